@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class BoardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'board'
+
+    def ready(self):
+        from scb_be import versions
+        from . import search  # noqa: F401  검색 색인 signal 등록
+        from .models import Board, Comment
+
+        versions.track(Board)
+        versions.track(Comment, parents=('board',))
@@ -0,0 +1,49 @@
+import csv
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from board.models import Board, Comment
+
+
+class Command(BaseCommand):
+    help = "CSV(board_id,username,text)로 댓글을 일괄 등록합니다. (bulk_create, 댓글 수 / 검색 색인 함께 갱신)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="헤더가 board_id,username,text인 CSV 파일")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 트랜잭션에서 만들 댓글 수")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['csv_path'], newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                missing = {'board_id', 'username', 'text'} - set(reader.fieldnames or ())
+                if missing:
+                    raise CommandError(f"Missing column(s): {', '.join(sorted(missing))}")
+                rows = list(reader)
+        except OSError as e:
+            raise CommandError(e)
+
+        # 게시글 / 작성자는 한 번씩만 조회
+        try:
+            board_ids = {int(row['board_id']) for row in rows}
+        except ValueError as e:
+            raise CommandError(f"Invalid board_id: {e}")
+        boards = set(Board.objects.filter(pk__in=board_ids).values_list('pk', flat=True))
+        authors = User.objects.only('pk', 'username').in_bulk({row['username'] for row in rows}, field_name='username')
+        unknown_boards = board_ids - boards
+        unknown_users = {row['username'] for row in rows} - set(authors)
+        if unknown_boards or unknown_users:
+            raise CommandError(
+                f"Unknown board(s): {sorted(unknown_boards)[:20]}, unknown user(s): {sorted(unknown_users)[:20]}"
+            )
+
+        total = 0
+        for start in range(0, len(rows), options['batch_size']):
+            batch = [
+                Comment(board_id=int(row['board_id']), author=authors[row['username']], text=row['text'])
+                for row in rows[start:start + options['batch_size']]
+            ]
+            total += len(Comment.bulk_import(batch, batch_size=options['batch_size']))
+            self.stdout.write(f"Imported {total}/{len(rows)}")
+        self.stdout.write(self.style.SUCCESS(f"Imported {total} comment(s)."))
@@ -0,0 +1,48 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from board.models import Board, Comment, SearchPosting
+from board.search import DOC_COUNT_KEY, board_postings, comment_postings
+
+
+def _batches(queryset, batch_size):
+    """pk 순서로 batch_size개씩 나누어 반환합니다. (OFFSET 없이)"""
+    last_pk = 0
+    while True:
+        batch = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_pk = batch[-1].pk
+
+
+class Command(BaseCommand):
+    help = "게시글/댓글 검색 색인(SearchPosting)을 처음부터 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="한 트랜잭션에서 색인할 게시글/댓글 수")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        SearchPosting.objects.all().delete()
+
+        boards = postings = 0
+        for batch in _batches(Board.objects.only('id', 'title', 'content'), batch_size):
+            rows = [posting for board in batch for posting in board_postings(board)]
+            with transaction.atomic():
+                SearchPosting.objects.bulk_create(rows, batch_size=1000)
+            boards += len(batch)
+            postings += len(rows)
+
+        comments = 0
+        queryset = Comment.objects.filter(board__isnull=False).only('id', 'board_id', 'text')
+        for batch in _batches(queryset, batch_size):
+            rows = [posting for comment in batch for posting in comment_postings(comment)]
+            with transaction.atomic():
+                SearchPosting.objects.bulk_create(rows, batch_size=1000)
+            comments += len(batch)
+            postings += len(rows)
+
+        cache.delete(DOC_COUNT_KEY)
+        self.stdout.write(f"Indexed {boards} boards and {comments} comments ({postings} postings).")
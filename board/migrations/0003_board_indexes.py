@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_board_created_by_comment_school_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 한 학생이 여러 글을 쓸 수 있도록 unique 제약 제거
+        migrations.AlterField(
+            model_name='board',
+            name='school_id',
+            field=models.CharField(max_length=10, verbose_name='학번'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['date_created', 'id'], name='board_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['school_id'], name='board_school_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['created_by', 'date_created'], name='board_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['board', 'created_at', 'id'], name='board_comment_board_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['created_at', 'id'], name='board_comment_created_idx'),
+        ),
+    ]
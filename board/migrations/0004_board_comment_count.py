@@ -0,0 +1,51 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:21
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def fill_comment_counts(apps, schema_editor):
+    # 기존 게시글의 댓글 수 / 마지막 활동 시각 채우기
+    Board = apps.get_model('board', 'Board')
+    Comment = apps.get_model('board', 'Comment')
+    stats = {
+        row['board']: row
+        for row in Comment.objects.filter(board__isnull=False)
+        .values('board').annotate(count=Count('id'), latest=Max('created_at'))
+    }
+    boards = list(Board.objects.only('id', 'date_created'))
+    for board in boards:
+        row = stats.get(board.pk)
+        board.comment_count = row['count'] if row else 0
+        board.last_activity_at = max(board.date_created, row['latest']) if row else board.date_created
+    Board.objects.bulk_update(boards, ['comment_count', 'last_activity_at'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_board_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='마지막 활동'),
+        ),
+        migrations.RunPython(fill_comment_counts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['comment_count', 'id'], name='board_comment_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['last_activity_at', 'id'], name='board_last_activity_idx'),
+        ),
+    ]
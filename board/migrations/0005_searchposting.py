@@ -0,0 +1,53 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:25
+
+import django.db.models.deletion
+from collections import Counter
+from django.db import migrations, models
+
+
+def build_search_index(apps, schema_editor):
+    # 기존 게시글/댓글 색인 (이후에는 저장 시 자동 색인, 다시 만들 때는 rebuild_search_index)
+    from board.search import TITLE_WEIGHT, tokenize
+
+    Board = apps.get_model('board', 'Board')
+    Comment = apps.get_model('board', 'Comment')
+    SearchPosting = apps.get_model('board', 'SearchPosting')
+
+    def postings(board_id, weighted_texts, comment_id=None):
+        counts = Counter()
+        for text, weight in weighted_texts:
+            for term in tokenize(text):
+                counts[term] += weight
+        return [SearchPosting(term=term, board_id=board_id, comment_id=comment_id, weight=weight)
+                for term, weight in counts.items()]
+
+    rows = []
+    for board in Board.objects.only('id', 'title', 'content').iterator():
+        rows.extend(postings(board.pk, [(board.title, TITLE_WEIGHT), (board.content, 1)]))
+    for comment in Comment.objects.filter(board__isnull=False).only('id', 'board_id', 'text').iterator():
+        rows.extend(postings(comment.board_id, [(comment.text, 1)], comment.pk))
+    SearchPosting.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0004_board_comment_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=32)),
+                ('weight', models.PositiveIntegerField()),
+                ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='board.board')),
+                ('comment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='board.comment')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'board'], name='board_search_term_idx'), models.Index(fields=['board', 'comment'], name='board_search_doc_idx')],
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
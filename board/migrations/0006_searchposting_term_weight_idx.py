@@ -0,0 +1,25 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0005_searchposting'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='searchposting',
+            name='board_search_term_idx',
+        ),
+        migrations.AddIndex(
+            model_name='searchposting',
+            index=models.Index(fields=['term', 'board', 'weight'], name='board_search_term_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchposting',
+            index=models.Index(fields=['term', '-weight', 'board'], name='board_search_term_weight_idx'),
+        ),
+    ]
@@ -1,4 +1,9 @@
-from django.db import models
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.contrib.auth.models import User
 
 # 게시판 모델
@@ -8,12 +13,52 @@ class Board(models.Model):
     content = models.TextField("내용", null=False)  # 내용
     date_created = models.DateTimeField("작성일", auto_now_add=True, null=False)  # 작성일
     date_updated = models.DateTimeField("수정일", auto_now=True)  # 수정일
+    comment_count = models.PositiveIntegerField("댓글 수", default=0)  # 댓글 수 (댓글 작성/삭제 시 갱신)
+    last_activity_at = models.DateTimeField("마지막 활동", default=timezone.now)  # 작성 또는 마지막 댓글 작성/수정/삭제 시각
 
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, null=False)  # 작성자 연결
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['date_created', 'id'], name='board_created_idx'),  # 목록 페이지네이션
+            models.Index(fields=['school_id'], name='board_school_id_idx'),
+            models.Index(fields=['created_by', 'date_created'], name='board_author_created_idx'),  # 작성자별 글 목록
+            models.Index(fields=['comment_count', 'id'], name='board_comment_count_idx'),  # 댓글 많은 순
+            models.Index(fields=['last_activity_at', 'id'], name='board_last_activity_idx'),  # 최근 활동 순
+        ]
+
     def __str__(self):
         return f"{self.title} ({self.school_id})"
 
+    @classmethod
+    def record_comment_added(cls, board_id, count=1):
+        """댓글 수와 마지막 활동 시각을 갱신합니다. (댓글 저장과 같은 트랜잭션에서 호출) 갱신된 게시글 수를 반환"""
+        return cls.objects.filter(pk=board_id).update(
+            comment_count=F('comment_count') + count,
+            last_activity_at=timezone.now(),
+        )
+
+    @classmethod
+    def record_comment_deleted(cls, board_id):
+        cls.objects.filter(pk=board_id, comment_count__gt=0).update(
+            comment_count=F('comment_count') - 1,
+            last_activity_at=timezone.now(),
+        )
+
+    @classmethod
+    def record_comment_updated(cls, board_id):
+        # 상세 응답(댓글 포함)의 ETag / Last-Modified가 바뀌도록
+        cls.objects.filter(pk=board_id).update(last_activity_at=timezone.now())
+
+    @classmethod
+    def refresh_comment_counts(cls, board_ids):
+        """댓글 일괄 삭제 후 여러 게시글의 댓글 수를 한 번의 UPDATE로 다시 계산합니다."""
+        counts = Comment.objects.filter(board=OuterRef('pk')).order_by().values('board').annotate(n=Count('id')).values('n')
+        cls.objects.filter(pk__in=board_ids).update(
+            comment_count=Coalesce(Subquery(counts), 0),
+            last_activity_at=timezone.now(),
+        )
+
 
 # 댓글 모델
 class Comment(models.Model):
@@ -24,11 +69,65 @@ class Comment(models.Model):
     created_at = models.DateTimeField("작성일", auto_now_add=True)  # 댓글 작성일
     updated_at = models.DateTimeField("수정일", auto_now=True)  # 댓글 수정일
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'created_at', 'id'], name='board_comment_board_idx'),  # 게시글별 댓글 목록
+            models.Index(fields=['created_at', 'id'], name='board_comment_created_idx'),  # 전체 댓글 목록
+        ]
+
     def save(self, *args, **kwargs):
-        # 작성자의 학번을 자동으로 설정
-        if self.author and not self.school_id:
-            self.school_id = self.author.profile.school_id  # 프로필에서 학번 가져오기
+        # 작성자의 학번을 자동으로 설정 (username이 학번, 요청 사용자를 author로 넘기면 추가 조회 없음)
+        if self.author_id and not self.school_id:
+            self.school_id = self.author.username
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_import(cls, comments, batch_size=500):
+        """
+        저장되지 않은 Comment 목록을 bulk_create로 저장합니다.
+        signal이 호출되지 않으므로 학번, 게시글 댓글 수, 검색 색인, 버전을 여기서 함께 처리합니다.
+        author는 User 객체로 넘겨야 학번을 추가 조회 없이 채울 수 있습니다.
+        """
+        from scb_be import versions
+        from .search import index_comments
+
+        for comment in comments:
+            if comment.author_id and not comment.school_id:
+                comment.school_id = comment.author.username
+        with transaction.atomic():
+            created = cls.objects.bulk_create(comments, batch_size=batch_size)
+            per_board = Counter(comment.board_id for comment in created if comment.board_id)
+            for board_id, count in per_board.items():
+                Board.record_comment_added(board_id, count)
+            # pk를 돌려주지 않는 DB(MySQL 등)에서는 색인하지 못하므로 rebuild_search_index를 실행
+            index_comments([comment for comment in created if comment.pk], created=True)
+            versions.bump_on_commit(
+                versions.model_name(cls),
+                *(versions.parent_name(cls, 'board', board_id) for board_id in per_board),
+            )
+        return created
+
+    def __str__(self):
+        return f"Comment on {self.board.title} by {self.author.username}"
+
+
+class SearchPosting(models.Model):
+    """
+    검색 역색인: 검색어 토큰(영문/숫자 단어, 한글 2-gram) -> 게시글
+    댓글에서 나온 토큰은 comment가 채워지며 해당 게시글의 검색 결과로 합쳐집니다.
+    게시글/댓글이 삭제되면 CASCADE로 함께 삭제됩니다.
+    """
+    term = models.CharField(max_length=32)
+    board = models.ForeignKey(Board, related_name='+', on_delete=models.CASCADE)
+    comment = models.ForeignKey(Comment, related_name='+', on_delete=models.CASCADE, null=True, blank=True)
+    weight = models.PositiveIntegerField()  # 등장 횟수 × 필드 가중치
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['term', 'board', 'weight'], name='board_search_term_idx'),  # 후보 게시글의 점수 합산 (커버링)
+            models.Index(fields=['term', '-weight', 'board'], name='board_search_term_weight_idx'),  # 검색 후보 (가중치 상위)
+            models.Index(fields=['board', 'comment'], name='board_search_doc_idx'),  # 재색인 시 삭제
+        ]
+
     def __str__(self):
-        return f"Comment on {self.board.title} by {self.author.username}"
\ No newline at end of file
+        return f"{self.term} -> {self.board_id}"
@@ -15,7 +15,8 @@ from rest_framework import permissions
 class CustomReadOnly(permissions.BasePermission):
     """
     GET : 누구나 접근 가능
-    POST, PATCH, DELETE : 작성자만 접근 가능
+    POST, PATCH, DELETE : 작성자만 접근 가능 (DELETE는 관리자(is_staff)도 가능)
+    작성자 컬럼은 뷰의 owner_field (기본: created_by_id, 댓글: author_id)
     """
 
     def has_object_permission(self, request, view, obj):
@@ -23,4 +24,17 @@ class CustomReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         # 작성자와 요청 사용자가 일치해야 허용
-        return obj.created_by == request.user
\ No newline at end of file
+        return self.is_owner(request, getattr(obj, self.owner_field(view)))
+
+    @staticmethod
+    def owner_field(view):
+        return getattr(view, 'owner_field', 'created_by_id')
+
+    @staticmethod
+    def is_owner(request, owner_id, deleting=None):
+        """owner_id(작성자 pk)로 수정/삭제 권한을 확인합니다. (일괄 API에서도 사용)"""
+        if deleting is None:
+            deleting = request.method == 'DELETE'
+        if deleting and request.user.is_staff:
+            return True  # 관리자는 스팸 등 다른 사용자의 글도 삭제 가능
+        return owner_id is not None and owner_id == request.user.id
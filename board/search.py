@@ -0,0 +1,167 @@
+"""
+게시글/댓글 검색 (DB 테이블 역색인)
+
+토큰화
+- 텍스트를 NFKC 정규화 + 소문자로 바꾼 뒤 문자 종류별로 나눕니다.
+- 한글은 띄어쓰기/조사 때문에 단어 단위 일치가 잘 안 되므로 글자 2-gram으로 색인합니다.
+  ("게시판에" -> 게시, 시판, 판에)  한 글자뿐인 덩어리는 그대로 색인
+- 영문/숫자는 단어 단위로 색인합니다.
+
+색인 (SearchPosting)
+- 게시글 저장 시 제목(TITLE_WEIGHT배)과 본문, 댓글 저장 시 댓글 내용을 다시 색인합니다.
+- 삭제는 FK CASCADE로 처리되므로 별도 작업이 없습니다.
+
+검색
+- 검색어의 모든 토큰을 포함하는 게시글만 (AND), 토큰별 가중치 × idf 합으로 정렬합니다.
+- 후보는 가장 드문 토큰의 가중치 상위 MAX_CANDIDATES개 색인 행의 게시글로 제한합니다.
+  (흔한 토큰의 색인 전체를 합산하지 않음 / 토큰 하나만 검색하면 순위는 정확하고 그 뒤의 결과는 잘림)
+- idf의 문서 빈도는 토큰의 색인 행 수를 MAX_DOC_FREQ까지만 셉니다. (그보다 흔한 토큰은 같은 가중치)
+"""
+import math
+import re
+import unicodedata
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Sum, When
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Board, Comment, SearchPosting
+
+TITLE_WEIGHT = 3
+MAX_TERM_LENGTH = 32
+MAX_QUERY_TERMS = 16
+MAX_CANDIDATES = 1000  # 점수를 계산할 최대 후보 수 (가장 드문 토큰 기준)
+MAX_DOC_FREQ = 10000  # 문서 빈도(idf)를 셀 최대 색인 행 수
+DOC_COUNT_KEY = 'board:search:doc_count'
+
+# 한글(음절/자모)과 한자는 n-gram, 그 외 문자/숫자는 단어
+_TOKEN_RE = re.compile(r'([가-힣ㄱ-ㆎ一-鿿]+)|([^\W_가-힣ㄱ-ㆎ一-鿿]+)')
+
+
+def tokenize(text):
+    """텍스트를 검색 토큰 목록으로 바꿉니다. (중복 포함)"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    tokens = []
+    for ngram_run, word in _TOKEN_RE.findall(text):
+        if word:
+            tokens.append(word[:MAX_TERM_LENGTH])
+        elif len(ngram_run) == 1:
+            tokens.append(ngram_run)
+        else:
+            tokens.extend(ngram_run[i:i + 2] for i in range(len(ngram_run) - 1))
+    return tokens
+
+
+def _postings(board_id, weighted_texts, comment_id=None):
+    counts = Counter()
+    for text, weight in weighted_texts:
+        for term in tokenize(text):
+            counts[term] += weight
+    return [
+        SearchPosting(term=term, board_id=board_id, comment_id=comment_id, weight=weight)
+        for term, weight in counts.items()
+    ]
+
+
+def board_postings(board):
+    return _postings(board.pk, [(board.title, TITLE_WEIGHT), (board.content, 1)])
+
+
+def comment_postings(comment):
+    return _postings(comment.board_id, [(comment.text, 1)], comment_id=comment.pk)
+
+
+def index_board(board):
+    """게시글 제목/본문을 다시 색인합니다."""
+    with transaction.atomic():
+        SearchPosting.objects.filter(board_id=board.pk, comment__isnull=True).delete()
+        SearchPosting.objects.bulk_create(board_postings(board), batch_size=1000)
+
+
+def index_comment(comment, created=False):
+    """댓글 내용을 다시 색인합니다. (게시글에 속하지 않은 댓글은 색인하지 않음)"""
+    with transaction.atomic():
+        if not created:  # 새 댓글은 지울 색인이 없음
+            SearchPosting.objects.filter(comment_id=comment.pk).delete()
+        if comment.board_id:
+            SearchPosting.objects.bulk_create(comment_postings(comment), batch_size=1000)
+
+
+def index_boards(boards, created=False):
+    """게시글 여러 개를 한 번에 다시 색인합니다. (bulk_create / bulk_update는 signal이 없으므로)"""
+    if not created:
+        SearchPosting.objects.filter(board__in=[board.pk for board in boards], comment__isnull=True).delete()
+    postings = []
+    for board in boards:
+        postings += board_postings(board)
+    SearchPosting.objects.bulk_create(postings, batch_size=1000)
+
+
+def index_comments(comments, created=False):
+    """댓글 여러 개를 한 번에 다시 색인합니다. (bulk_create / bulk_update는 signal이 없으므로)"""
+    if not created:
+        SearchPosting.objects.filter(comment__in=[comment.pk for comment in comments]).delete()
+    postings = []
+    for comment in comments:
+        if comment.board_id:
+            postings += comment_postings(comment)
+    SearchPosting.objects.bulk_create(postings, batch_size=1000)
+
+
+@receiver(post_save, sender=Board)
+def index_saved_board(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        index_board(instance)
+
+
+@receiver(post_save, sender=Comment)
+def index_saved_comment(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        index_comment(instance, created=created)
+
+
+def _document_count():
+    return cache.get_or_set(DOC_COUNT_KEY, Board.objects.count, 300)
+
+
+def _document_frequency(term):
+    """토큰의 색인 행 수 (MAX_DOC_FREQ까지만 세므로 흔한 토큰도 비용이 정해져 있음)"""
+    return SearchPosting.objects.filter(term=term)[:MAX_DOC_FREQ].count()
+
+
+def search_boards(query):
+    """
+    검색어와 일치하는 게시글의 (board, score)를 점수 순으로 반환하는 queryset
+    검색어에 색인된 토큰이 없으면 None
+    """
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+
+    postings = SearchPosting.objects.filter(term__in=terms)
+    doc_freq = {term: _document_frequency(term) for term in terms}
+    if not all(doc_freq.values()):
+        return postings.none().values('board')  # 어떤 게시글에도 없는 토큰이 있으면 결과 없음
+
+    # AND 검색이므로 가장 드문 토큰이 있는 게시글만 일치할 수 있음 (board_search_term_weight_idx 순서로 읽음)
+    rarest = min(doc_freq, key=doc_freq.get)
+    candidates = (
+        SearchPosting.objects.filter(term=rarest).order_by('-weight', 'board').values('board')[:MAX_CANDIDATES]
+    )
+
+    total = max(_document_count(), 1)
+    score = Sum(
+        Case(
+            *[When(term=term, then=F('weight') * math.log(1 + total / df)) for term, df in doc_freq.items()],
+            output_field=FloatField(),
+        )
+    )
+    return (
+        postings.filter(board__in=candidates).values('board')
+        .annotate(matched=Count('term', distinct=True), score=score)
+        .filter(matched=len(terms))
+        .order_by('-score', 'board')
+    )
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from .models import Board, Comment
 from django.contrib.auth.models import User
+from scb_be.sparse import SparseFieldsMixin
 
 # 댓글 데이터를 처리하는 Serializer
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author_username = serializers.StringRelatedField(source='author.username', read_only=True)  # 댓글 작성자 이름 추가
 
     class Meta:
@@ -27,12 +28,19 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
         fields = ['title', 'content']
 
 # Board 목록 조회 시 사용되는 Serializer
-class BoardListSerializer(serializers.ModelSerializer):
+class BoardListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     created_by_username = serializers.StringRelatedField(source='created_by.username', read_only=True)  # 목록에서도 'created_by' 필드 포함
 
     class Meta:
         model = Board
-        fields = ['id', 'school_id', 'title', 'date_created', 'created_by_username']
+        fields = ['id', 'school_id', 'title', 'date_created', 'comment_count', 'last_activity_at', 'created_by_username']
+
+# 검색 결과 Serializer (search_score는 BoardSearchView가 채움)
+class BoardSearchResultSerializer(BoardListSerializer):
+    score = serializers.FloatField(source='search_score', read_only=True)
+
+    class Meta(BoardListSerializer.Meta):
+        fields = BoardListSerializer.Meta.fields + ['score']
 
 # Board 상세 조회 시 사용되는 Serializer
 class BoardDetailSerializer(serializers.ModelSerializer):
@@ -48,7 +56,9 @@ class BoardDetailSerializer(serializers.ModelSerializer):
             'content',
             'date_created',
             'date_updated',
+            'comment_count',
+            'last_activity_at',
             'comments',
             'created_by_username'  # Board 상세 조회 시에도 'created_by' 필드 포함
         ]
-        read_only_fields = ['date_created', 'date_updated', 'comments']
\ No newline at end of file
+        read_only_fields = ['date_created', 'date_updated', 'comment_count', 'last_activity_at', 'comments']
\ No newline at end of file
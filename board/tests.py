@@ -1,3 +1,283 @@
-from django.test import TestCase
+import base64
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from . import search
+from .models import Board, Comment
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class BoardTestCase(TestCase):
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.user = User.objects.create(username='20201234')
+        self.client = self.client_for(self.user)
+
+    @staticmethod
+    def client_for(user=None):
+        client = APIClient()
+        if user is not None:
+            client.credentials(HTTP_AUTHORIZATION='Token ' + Token.objects.get_or_create(user=user)[0].key)
+        return client
+
+    def make_board(self, title='title', user=None):
+        return Board.objects.create(school_id='20201234', title=title, content='content', created_by=user or self.user)
+
+
+class DeleteCommentPermissionTests(BoardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.board = self.make_board()
+        self.other = User.objects.create(username='20209999')
+
+    def delete(self, client, comment):
+        return client.delete(f'/api/board/boards/{self.board.pk}/comments/{comment.pk}/')
+
+    def test_anonymous_cannot_delete_comment_without_author(self):
+        comment = Comment.objects.create(board=self.board, text='anonymous')
+        self.assertEqual(self.delete(self.client_for(), comment).status_code, 401)
+        self.assertTrue(Comment.objects.filter(pk=comment.pk).exists())
+
+    def test_only_author_or_staff_can_delete(self):
+        comment = Comment.objects.create(board=self.board, author=self.user, text='mine')
+        orphan = Comment.objects.create(board=self.board, text='no author')
+        self.assertEqual(self.delete(self.client_for(self.other), comment).status_code, 403)
+        self.assertEqual(self.delete(self.client_for(self.other), orphan).status_code, 403)
+        self.assertEqual(self.delete(self.client, comment).status_code, 204)
+
+        staff = User.objects.create(username='admin', is_staff=True)
+        self.assertEqual(self.delete(self.client_for(staff), orphan).status_code, 204)
+        self.assertFalse(Comment.objects.exists())
+
+
+class QueryCountTests(BoardTestCase):
+    """목록 / 상세 / 댓글 조회 쿼리 수는 글 / 댓글 / 작성자 수와 관계없이 일정해야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        self.anonymous = self.client_for()
+
+    def add_rows(self, boards, comments):
+        users = [User.objects.create(username=f'{boards:02d}{i:04d}') for i in range(5)]
+        created = [self.make_board(f'title {i}', users[i % 5]) for i in range(boards)]
+        Comment.objects.bulk_create(
+            [Comment(board=created[0], author=users[i % 5], text=f'comment {i}') for i in range(comments)]
+        )
+        return created[0]
+
+    def get(self, url, queries):
+        for cache in caches.all():
+            cache.clear()  # 응답 캐시 없이 측정
+        with self.assertNumQueries(queries):
+            response = self.anonymous.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_constant_query_counts(self):
+        for boards, comments in ((2, 3), (40, 60)):
+            board = self.add_rows(boards, comments)
+            with self.subTest(boards=boards, comments=comments):
+                # 버전 SELECT + 목록 SELECT (작성자 JOIN)
+                self.get('/api/board/boards/', 2)
+                self.get('/api/board/boards/?sort=discussed', 2)
+                self.get('/api/board/comments/', 2)
+                # 조건부 요청 SELECT + 게시글 SELECT (작성자 JOIN) + 댓글 prefetch (작성자 JOIN)
+                response = self.get(f'/api/board/boards/{board.pk}/', 3)
+                self.assertEqual(len(response.data['comments']), comments)
+                # 버전 SELECT + 게시글 존재 확인 + 댓글 SELECT (작성자 JOIN)
+                self.get(f'/api/board/boards/{board.pk}/comments/', 3)
+
+
+class CommentCreateQueryTests(BoardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.board = self.make_board()
+        self.client.get('/api/board/boards/')  # 토큰 인증 캐시
+
+    def post(self, url, data):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        statements = [query['sql'] for query in ctx.captured_queries if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        self.assertEqual([sql for sql in statements if sql.startswith('SELECT')], [])  # 작성자 / 프로필 / 게시글 조회 없음
+        self.assertEqual(sum(sql.startswith('INSERT INTO "board_comment"') for sql in statements), 1)
+        return statements
+
+    def test_board_comment_is_one_insert_without_select(self):
+        statements = self.post(f'/api/board/boards/{self.board.pk}/comments/', {'text': 'hello'})
+        self.assertTrue(statements[0].startswith('UPDATE "board_board"'))  # 댓글 수 갱신으로 게시글 존재 확인
+        comment = Comment.objects.get()
+        self.assertEqual((comment.board_id, comment.author_id, comment.school_id), (self.board.pk, self.user.pk, '20201234'))
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.comment_count, 1)
+
+    def test_comment_endpoint_is_one_insert_without_select(self):
+        self.post('/api/board/comments/', {'text': 'hello'})
+        self.assertEqual(Comment.objects.get().school_id, '20201234')
+
+    def test_comment_on_missing_board_is_404(self):
+        response = self.client.post('/api/board/boards/999/comments/', {'text': 'hello'}, format='json')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Comment.objects.exists())
+
+
+class KeysetPaginationTests(BoardTestCase):
+    """동점이 offset_cutoff(1000)보다 많아도 OFFSET 없이 모든 행을 한 번씩 순서대로 반환해야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        Board.objects.bulk_create([
+            Board(school_id='20201234', title=f't{i}', content='c', created_by=self.user,
+                  comment_count=7 if i % 400 == 0 else 3, last_activity_at=now)  # 대부분 동점
+            for i in range(1150)
+        ])
+
+    def walk(self, url):
+        pages, queries = [], []
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            queries += [query['sql'] for query in ctx.captured_queries]
+            pages.append([row['id'] for row in response.data['results']])
+            url = response.data['next']
+        self.assertFalse(any('OFFSET' in sql for sql in queries))
+        self.assertFalse(any(' OR ' in sql for sql in queries))  # OR 조건은 인덱스를 처음부터 훑음 (rows_after)
+        return pages, response.data['previous']
+
+    def test_sorts_with_ties_visit_every_row_once(self):
+        for sort, key in (('discussed', lambda board: (-board.comment_count, -board.id)),
+                          ('active', lambda board: (-board.last_activity_at.timestamp(), -board.id)),
+                          ('', lambda board: (-board.date_created.timestamp(), -board.id))):
+            with self.subTest(sort=sort):
+                pages, _ = self.walk(f'/api/board/boards/?sort={sort}&page_size=100&fields=id')
+                self.assertEqual(len(pages), 12)
+                self.assertEqual(sum(pages, []), [board.id for board in sorted(Board.objects.all(), key=key)])
+
+    def test_previous_links_walk_back(self):
+        pages, previous = self.walk('/api/board/boards/?sort=discussed&page_size=100')
+        backwards = []
+        while previous:
+            response = self.client.get(previous)
+            backwards.append([row['id'] for row in response.data['results']])
+            previous = response.data['previous']
+        self.assertEqual(backwards, pages[-2::-1])
+
+    def test_invalid_cursor_is_404(self):
+        self.assertEqual(self.client.get('/api/board/boards/?cursor=bad').status_code, 404)
+        for query, tokens in (
+            ('', 'p=1'),  # 정렬 컬럼 2개
+            ('', 'p=garbage&p=1'),
+            ('', 'p=2020-01-01&p=abc'),
+            ('', 'r=1&p=x&p=y'),
+            ('', 'p=&p=1'),
+            ('sort=discussed&', 'p=abc&p=1'),
+            ('sort=discussed&', 'p=1.5&p=1'),
+            ('sort=active&', 'p=yesterday&p=1'),
+        ):
+            with self.subTest(query=query, tokens=tokens):
+                cursor = base64.b64encode(tokens.encode()).decode()
+                response = self.client.get(f'/api/board/boards/?{query}cursor={cursor}')
+                self.assertEqual(response.status_code, 404)
+        # 사용자 목록 (정렬 컬럼이 FK attname)
+        cursor = base64.b64encode(b'p=abc').decode()
+        self.assertEqual(self.client.get(f'/users/profile/?cursor={cursor}').status_code, 404)
+
+
+class BulkValidationTests(BoardTestCase):
+    def setUp(self):
+        super().setUp()
+        self.board = self.make_board()
+
+    def test_comment_create_rejects_bad_board_per_item(self):
+        response = self.client.post('/api/board/comments/bulk/', {'items': [
+            {'text': 'list', 'board': [self.board.pk]},
+            {'text': 'float', 'board': 1.7},
+            {'text': 'bool', 'board': True},
+            {'text': 'missing', 'board': 999},
+            {'text': 'ok', 'board': self.board.pk},
+            {'text': 'ok string', 'board': str(self.board.pk)},
+            {'text': 'no board'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([result['status'] for result in response.data['results']], [400, 400, 400, 404, 201, 201, 201])
+        self.assertEqual(response.data['results'][0]['error'], {'board': ['A valid integer is required.']})
+        self.assertEqual(
+            sorted(Comment.objects.values_list('text', 'board_id')),
+            [('no board', None), ('ok', self.board.pk), ('ok string', self.board.pk)],
+        )
+
+    def test_update_reports_bad_ids_per_item(self):
+        other = self.make_board('other')
+        for url, pk, field in (('/api/board/boards/bulk/', other.pk, 'title'),
+                               ('/api/board/comments/bulk/', None, 'text')):
+            if pk is None:
+                pk = Comment.objects.create(board=self.board, author=self.user, text='before').pk
+            with self.subTest(url=url):
+                response = self.client.patch(url, {'items': [
+                    {field: 'no id'}, {'id': 'abc', field: 'bad'}, {'id': True, field: 'bool'}, {'id': pk, field: 'after'},
+                ]}, format='json')
+                self.assertEqual(response.status_code, 200, response.content)
+                self.assertEqual([result['status'] for result in response.data['results']], [400, 400, 400, 200])
+                self.assertEqual(response.data['results'][1], {'index': 1, 'status': 400, 'error': {'id': ['A valid integer is required.']}})
+        other.refresh_from_db()
+        self.assertEqual(other.title, 'after')
+        self.assertEqual(Comment.objects.get().text, 'after')
+
+    def test_bulk_delete_rejects_non_object_body(self):
+        for url in ('/api/board/boards/bulk-delete/', '/api/board/comments/bulk-delete/'):
+            for body in ([self.board.pk], {'ids': [True]}, {'ids': ['1.5']}):
+                with self.subTest(url=url, body=body):
+                    self.assertEqual(self.client.post(url, body, format='json').status_code, 400)
+        self.assertTrue(Board.objects.filter(pk=self.board.pk).exists())
+
+
+class SearchTests(BoardTestCase):
+    def search(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.data
+
+    def test_pages_without_count(self):
+        # 제목에 alpha가 여러 번 들어갈수록 점수가 높음
+        boards = [Board.objects.create(school_id='20201234', title='alpha ' * repeat, content='common', created_by=self.user)
+                  for repeat in range(1, 6)]
+        expected = [board.pk for board in reversed(boards)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            page = self.search('/api/board/search/?q=alpha&page_size=2')
+        counts = [query['sql'] for query in ctx.captured_queries if 'COUNT(*)' in query['sql']]
+        self.assertFalse([sql for sql in counts if 'GROUP BY' in sql])  # 결과(게시글별 합산) 개수는 세지 않음
+        self.assertNotIn('count', page)
+        self.assertIsNone(page['previous'])
+
+        found = [board['id'] for board in page['results']]
+        while page['next']:
+            page = self.search(page['next'])
+            self.assertIsNotNone(page['previous'])
+            found += [board['id'] for board in page['results']]
+        self.assertEqual(found, expected)
+
+        self.assertEqual(self.client.get('/api/board/search/?q=alpha&page=0').status_code, 404)
+        self.assertEqual(self.search('/api/board/search/?q=alpha&page=9')['results'], [])
+
+    def test_candidates_come_from_rarest_term(self):
+        rare = [Board.objects.create(school_id='20201234', title='common rare ' + 'rare ' * repeat, content='',
+                                     created_by=self.user) for repeat in range(3)]
+        for _ in range(5):
+            self.make_board('common only')
+
+        with mock.patch.object(search, 'MAX_CANDIDATES', 2):
+            hits = list(search.search_boards('common rare'))
+            self.assertEqual([hit['board'] for hit in hits], [rare[2].pk, rare[1].pk])  # 가중치 상위 2개만 후보
+            self.assertEqual(len(search.search_boards('common')), 2)  # 흔한 토큰도 후보 수까지만 합산
@@ -8,7 +8,7 @@
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import BoardViewSet, CommentViewSet
+from .views import BoardSearchView, BoardViewSet, CommentViewSet
 
 # DefaultRouter 생성
 router = DefaultRouter()
@@ -17,5 +17,6 @@ router.register(r'comments', CommentViewSet)  # Comment 관련 뷰셋 등록
 
 # URL 패턴 정의
 urlpatterns = [
+    path('search/', BoardSearchView.as_view(), name='board-search'),  # 게시글 검색
     path('', include(router.urls)),  # DefaultRouter의 URL 포함
 ]
\ No newline at end of file
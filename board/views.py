@@ -1,21 +1,41 @@
-from rest_framework import viewsets, status
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import generics, viewsets, status
 from rest_framework.permissions import IsAuthenticated  # 로그인된 사용자만 허용
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from .models import Board, Comment
+from .models import Board, Comment, SearchPosting
+from .search import index_boards, index_comments, search_boards
 from .serializers import (
     BoardSerializer,
     BoardListSerializer,
+    BoardSearchResultSerializer,
     BoardDetailSerializer,
     BoardUpdateSerializer,
     CommentSerializer
 )
 from .permissions import CustomReadOnly  # CustomReadOnly 권한 클래스를 import
+from scb_be import bulk, versions
+from scb_be.conditional import ConditionalGetMixin
+from scb_be.pagination import BoardPagination, CommentPagination, SearchPagination
+from scb_be.sparse import SPARSE_PARAMETERS, SparseQuerysetMixin
+from scb_be.values import STREAM_PARAMETERS, ValuesListMixin
 
+# 일괄 API 공통 스키마 (scb_be.bulk)
+BULK_IDS = openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+    'ids': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_INTEGER)),
+})
+BULK_RESULTS = openapi.Response("항목별 결과 (status: 201/200/204 성공, 400/403/404 실패)", examples={
+    "application/json": {"results": [{"id": 1, "status": 200}, {"id": 2, "status": 403, "error": "..."}]}
+})
 
-class BoardViewSet(viewsets.ModelViewSet):
+
+class BoardViewSet(SparseQuerysetMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     게시판 관련 CRUD API 제공
     """
@@ -23,9 +43,50 @@ class BoardViewSet(viewsets.ModelViewSet):
     serializer_class = BoardSerializer
     http_method_names = ['get', 'post', 'patch', 'delete']
     permission_classes = [CustomReadOnly]
+    pagination_class = BoardPagination
+    # 조건부 요청 (ETag / Last-Modified)
+    etag_fields = ('id', 'date_updated', 'comment_count', 'last_activity_at')
+    last_modified_fields = ('date_updated', 'last_activity_at')
+    list_version_names = ('board.Board', 'board.Comment')  # 목록에 댓글 수가 포함됨
+
+    def get_serializer_class(self):
+        """Serializer 반환"""
+        if self.action == 'list':
+            return BoardListSerializer
+        elif self.action == 'retrieve':
+            return BoardDetailSerializer
+        elif self.action in ['update', 'partial_update']:
+            return BoardUpdateSerializer
+        return BoardSerializer
+
+    def get_queryset(self):
+        """action별로 작성자/댓글을 미리 불러와 N+1 쿼리를 방지"""
+        queryset = super().get_queryset()
+        if self.action == 'list_comments':
+            return queryset.only('id')
+        queryset = queryset.select_related('created_by')
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(
+                Prefetch('comments', queryset=Comment.objects.select_related('author').order_by('created_at', 'id'))
+            )
+        return queryset
+
+    def perform_create(self, serializer):
+        serializer.save(created_by=self.request.user)
 
     @swagger_auto_schema(
         operation_description="게시판 목록 조회 API",
+        manual_parameters=[
+            openapi.Parameter(
+                'sort',
+                openapi.IN_QUERY,
+                description="정렬 (discussed: 댓글 많은 순, active: 최근 활동 순, 기본: 최신 글 순)",
+                type=openapi.TYPE_STRING,
+                enum=list(BoardPagination.sort_orderings),
+            ),
+            *SPARSE_PARAMETERS,
+            *STREAM_PARAMETERS,
+        ],
         responses={
             200: openapi.Response(
                 "게시판 목록 반환",
@@ -116,8 +177,113 @@ class BoardViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
 
+    @swagger_auto_schema(
+        method='post',
+        operation_description="게시판 일괄 작성 API (요청당 최대 BULK_API['MAX_ITEMS']개, 항목별 결과 반환)",
+        request_body=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+            'items': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                'school_id': openapi.Schema(type=openapi.TYPE_STRING),
+                'title': openapi.Schema(type=openapi.TYPE_STRING),
+                'content': openapi.Schema(type=openapi.TYPE_STRING),
+            })),
+        }),
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @swagger_auto_schema(
+        method='patch',
+        operation_description="게시판 일괄 수정 API (작성자만, 항목별 결과 반환)",
+        request_body=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+            'items': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                'title': openapi.Schema(type=openapi.TYPE_STRING),
+                'content': openapi.Schema(type=openapi.TYPE_STRING),
+            })),
+        }),
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @action(detail=False, methods=['post', 'patch'], url_path='bulk', permission_classes=[IsAuthenticated])
+    def bulk(self, request):
+        if request.method == 'POST':
+            return Response({'results': self._bulk_create(request)})
+        return Response({'results': self._bulk_update(request)})
+
+    def _bulk_create(self, request):
+        results, boards = [], []
+        for index, item in enumerate(bulk.parse_items(request.data)):
+            serializer = BoardSerializer(data=item)
+            if serializer.is_valid():
+                boards.append(Board(created_by=request.user, **serializer.validated_data))
+                results.append({'index': index, 'status': status.HTTP_201_CREATED})
+            else:
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, serializer.errors, index=index))
+        with transaction.atomic():
+            created = Board.objects.bulk_create(boards)
+            index_boards(created, created=True)
+            versions.bump_on_commit(versions.model_name(Board))
+        created = iter(created)
+        for result in results:
+            if result['status'] == status.HTTP_201_CREATED:
+                result['id'] = next(created).pk
+        return results
+
+    def _bulk_update(self, request):
+        items = bulk.parse_items(request.data)
+        item_ids, ids, invalid = bulk.item_ids(items)  # id가 잘못된 항목은 항목별 400
+        boards = Board.objects.in_bulk(ids)  # 권한 확인과 수정 대상 조회를 한 번에
+        allowed, failures = bulk.check_owners(
+            request, {pk: board.created_by_id for pk, board in boards.items()}, ids, CustomReadOnly.is_owner
+        )
+        results, changed, fields, seen = [], [], {'date_updated'}, set()
+        now = timezone.now()
+        for index, (item, pk) in enumerate(zip(items, item_ids)):
+            if index in invalid:
+                results.append(invalid[index])
+                continue
+            if pk in failures:
+                results.append(failures[pk])
+                continue
+            if pk in seen:
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, 'Duplicate id.', id=pk))
+                continue
+            seen.add(pk)
+            serializer = BoardUpdateSerializer(boards[pk], data=item, partial=True)
+            if not serializer.is_valid():
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, serializer.errors, id=pk))
+                continue
+            for attr, value in serializer.validated_data.items():
+                setattr(boards[pk], attr, value)
+            boards[pk].date_updated = now  # bulk_update는 auto_now를 채우지 않음
+            fields.update(serializer.validated_data)
+            changed.append(boards[pk])
+            results.append({'id': pk, 'status': status.HTTP_200_OK})
+        if changed:
+            with transaction.atomic():
+                Board.objects.bulk_update(changed, sorted(fields))
+                index_boards(changed)
+                versions.bump_on_commit(versions.model_name(Board))
+        return results
+
+    @swagger_auto_schema(
+        operation_description="게시판 일괄 삭제 API (작성자 또는 관리자, 항목별 결과 반환)",
+        request_body=BULK_IDS,
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-delete', permission_classes=[IsAuthenticated])
+    def bulk_delete(self, request):
+        ids = bulk.parse_delete_ids(request.data)
+        owners = dict(Board.objects.filter(pk__in=ids).values_list('pk', 'created_by_id'))
+        allowed, failures = bulk.check_owners(
+            request, owners, ids, lambda request, owner_id: CustomReadOnly.is_owner(request, owner_id, deleting=True)
+        )
+        with transaction.atomic():
+            Board.objects.filter(pk__in=allowed).delete()  # 댓글 / 검색 색인은 CASCADE
+        return Response({'results': [
+            failures.get(pk) or {'id': pk, 'status': status.HTTP_204_NO_CONTENT} for pk in ids
+        ]})
+
     @swagger_auto_schema(
         operation_description="특정 게시판 댓글 목록 조회 API",
+        manual_parameters=SPARSE_PARAMETERS,
         responses={
             200: openapi.Response(
                 "댓글 목록 반환",
@@ -132,8 +298,20 @@ class BoardViewSet(viewsets.ModelViewSet):
             404: "게시판을 찾을 수 없음"
         }
     )
+    @action(detail=True, methods=['get'], url_path='comments', pagination_class=CommentPagination)
     def list_comments(self, request, pk=None):
-        return super().list_comments(request, pk=pk)
+        if not str(pk).isdigit():
+            return self._comment_page()
+        # 게시글별 댓글 버전으로 조건부 요청 처리
+        etag = self.collection_etag(request, [versions.parent_name(Comment, 'board', pk)])
+        return self.conditional_response(request, etag, self._comment_page)
+
+    def _comment_page(self):
+        board = self.get_object()
+        comments = self.sparse_queryset(Comment.objects.filter(board_id=board.pk), CommentSerializer)  # 요청한 필드만 조회
+        page = self.paginate_queryset(comments)
+        serializer = CommentSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         operation_description="특정 게시판 댓글 추가 API",
@@ -154,22 +332,44 @@ class BoardViewSet(viewsets.ModelViewSet):
             404: "게시판을 찾을 수 없음"
         }
     )
+    @list_comments.mapping.post
     def add_comment(self, request, pk=None):
-        return super().add_comment(request, pk=pk)
+        if not request.user.is_authenticated:
+            self.permission_denied(request)
+        if not str(pk).isdigit():
+            raise Http404
+        serializer = CommentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            # 게시글 조회 대신 댓글 수 UPDATE의 결과로 존재 확인 (게시글 작성자가 아니어도 댓글 작성 가능)
+            if not Board.record_comment_added(pk):
+                raise Http404
+            serializer.save(board_id=int(pk), author=request.user)  # 학번은 request.user에서 (추가 조회 없음)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(
         operation_description="특정 게시판 댓글 삭제 API",
         responses={
             204: "댓글 삭제 성공",
+            401: "로그인 필요",
             403: "삭제 권한이 없습니다.",
             404: "댓글을 찾을 수 없음"
         }
     )
+    @action(detail=True, methods=['delete'], url_path=r'comments/(?P<comment_id>[0-9]+)')
     def delete_comment(self, request, pk=None, comment_id=None):
-        return super().delete_comment(request, pk=pk, comment_id=comment_id)
+        if not request.user.is_authenticated:
+            self.permission_denied(request)
+        comment = get_object_or_404(Comment.objects.only('id', 'board_id', 'author_id'), board_id=pk, pk=comment_id)
+        if not CustomReadOnly.is_owner(request, comment.author_id, deleting=True):  # 작성자 없는 댓글은 관리자만
+            return Response({"error": "삭제 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN)
+        with transaction.atomic():
+            comment.delete()
+            Board.record_comment_deleted(comment.board_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(SparseQuerysetMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     댓글 관련 CRUD API 제공
     """
@@ -177,6 +377,34 @@ class CommentViewSet(viewsets.ModelViewSet):
     serializer_class = CommentSerializer
     http_method_names = ['get', 'post', 'patch', 'delete']
     permission_classes = [CustomReadOnly]
+    owner_field = 'author_id'  # CustomReadOnly 작성자 확인
+    pagination_class = CommentPagination
+    etag_fields = ('id', 'updated_at')
+    last_modified_fields = ('updated_at',)
+    list_version_names = ('board.Board', 'board.Comment')
+
+    def get_queryset(self):
+        """댓글 작성자를 함께 조회"""
+        return super().get_queryset().select_related('author')
+
+    def perform_create(self, serializer):
+        author = self.request.user if self.request.user.is_authenticated else None
+        with transaction.atomic():
+            comment = serializer.save(author=author)
+            if comment.board_id:
+                Board.record_comment_added(comment.board_id)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            comment = serializer.save()
+            if comment.board_id:
+                Board.record_comment_updated(comment.board_id)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            if instance.board_id:
+                Board.record_comment_deleted(instance.board_id)
 
     @swagger_auto_schema(
         operation_description="댓글 수정 API",
@@ -210,3 +438,151 @@ class CommentViewSet(viewsets.ModelViewSet):
     )
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
+
+    @swagger_auto_schema(
+        method='post',
+        operation_description="댓글 일괄 작성 API (요청당 최대 BULK_API['MAX_ITEMS']개, 항목별 결과 반환)",
+        request_body=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+            'items': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                'board': openapi.Schema(type=openapi.TYPE_INTEGER, description="게시글 id (선택)"),
+                'text': openapi.Schema(type=openapi.TYPE_STRING),
+            })),
+        }),
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @swagger_auto_schema(
+        method='patch',
+        operation_description="댓글 일괄 수정 API (작성자만, 항목별 결과 반환)",
+        request_body=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+            'items': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT, properties={
+                'id': openapi.Schema(type=openapi.TYPE_INTEGER),
+                'text': openapi.Schema(type=openapi.TYPE_STRING),
+            })),
+        }),
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @action(detail=False, methods=['post', 'patch'], url_path='bulk', permission_classes=[IsAuthenticated])
+    def bulk(self, request):
+        if request.method == 'POST':
+            return Response({'results': self._bulk_create(request)})
+        return Response({'results': self._bulk_update(request)})
+
+    def _bulk_create(self, request):
+        items = bulk.parse_items(request.data)
+        # board는 항목마다 검사 (정수가 아니면 항목별 400), 존재 여부는 한 번의 쿼리로 확인
+        board_ids = [bulk.to_id(item['board']) if item.get('board') is not None else None for item in items]
+        existing = set(Board.objects.filter(pk__in={pk for pk in board_ids if pk}).values_list('pk', flat=True))
+        results, comments = [], []
+        for index, (item, board_id) in enumerate(zip(items, board_ids)):
+            serializer = CommentSerializer(data=item)
+            if item.get('board') is not None and board_id is None:
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, {'board': [bulk.ID_ERROR]}, index=index))
+            elif board_id is not None and board_id not in existing:
+                results.append(bulk.error(status.HTTP_404_NOT_FOUND, 'Board not found.', index=index))
+            elif not serializer.is_valid():
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, serializer.errors, index=index))
+            else:
+                comments.append(Comment(board_id=board_id, author=request.user, **serializer.validated_data))
+                results.append({'index': index, 'status': status.HTTP_201_CREATED})
+        created = iter(Comment.bulk_import(comments))  # 댓글 수 / 검색 색인 / 버전 함께 갱신
+        for result in results:
+            if result['status'] == status.HTTP_201_CREATED:
+                result['id'] = next(created).pk
+        return results
+
+    def _bulk_update(self, request):
+        items = bulk.parse_items(request.data)
+        item_ids, ids, invalid = bulk.item_ids(items)  # id가 잘못된 항목은 항목별 400
+        comments = Comment.objects.in_bulk(ids)  # 권한 확인과 수정 대상 조회를 한 번에
+        allowed, failures = bulk.check_owners(
+            request, {pk: comment.author_id for pk, comment in comments.items()}, ids, CustomReadOnly.is_owner
+        )
+        results, changed, seen = [], [], set()
+        now = timezone.now()
+        for index, (item, pk) in enumerate(zip(items, item_ids)):
+            if index in invalid:
+                results.append(invalid[index])
+                continue
+            if pk in failures:
+                results.append(failures[pk])
+                continue
+            if pk in seen:
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, 'Duplicate id.', id=pk))
+                continue
+            seen.add(pk)
+            serializer = CommentSerializer(comments[pk], data=item, partial=True)
+            if not serializer.is_valid():
+                results.append(bulk.error(status.HTTP_400_BAD_REQUEST, serializer.errors, id=pk))
+                continue
+            comments[pk].text = serializer.validated_data.get('text', comments[pk].text)
+            comments[pk].updated_at = now  # bulk_update는 auto_now를 채우지 않음
+            changed.append(comments[pk])
+            results.append({'id': pk, 'status': status.HTTP_200_OK})
+        if changed:
+            board_ids = {comment.board_id for comment in changed if comment.board_id}
+            with transaction.atomic():
+                Comment.objects.bulk_update(changed, ['text', 'updated_at'])
+                index_comments(changed)
+                Board.objects.filter(pk__in=board_ids).update(last_activity_at=now)
+                versions.bump_on_commit(
+                    versions.model_name(Comment),
+                    *(versions.parent_name(Comment, 'board', board_id) for board_id in board_ids),
+                )
+        return results
+
+    @swagger_auto_schema(
+        operation_description="댓글 일괄 삭제 API (작성자 또는 관리자, 항목별 결과 반환)",
+        request_body=BULK_IDS,
+        responses={200: BULK_RESULTS, 400: "유효하지 않은 요청 데이터"},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-delete', permission_classes=[IsAuthenticated])
+    def bulk_delete(self, request):
+        ids = bulk.parse_delete_ids(request.data)
+        rows = Comment.objects.filter(pk__in=ids).values_list('pk', 'author_id', 'board_id')
+        owners = {pk: author_id for pk, author_id, _ in rows}
+        allowed, failures = bulk.check_owners(
+            request, owners, ids, lambda request, owner_id: CustomReadOnly.is_owner(request, owner_id, deleting=True)
+        )
+        allowed_ids = set(allowed)
+        board_ids = {board_id for pk, _, board_id in rows if board_id and pk in allowed_ids}
+        with transaction.atomic():
+            Comment.objects.filter(pk__in=allowed).delete()
+            Board.refresh_comment_counts(board_ids)
+        return Response({'results': [
+            failures.get(pk) or {'id': pk, 'status': status.HTTP_204_NO_CONTENT} for pk in ids
+        ]})
+
+
+class BoardSearchView(SparseQuerysetMixin, generics.ListAPIView):
+    """
+    게시글 제목/본문/댓글 검색 API (역색인, 점수 순)
+    """
+    serializer_class = BoardSearchResultSerializer
+    pagination_class = SearchPagination
+
+    def get_queryset(self):
+        hits = search_boards(self.request.query_params.get('q', ''))
+        return hits if hits is not None else SearchPosting.objects.none().values('board')
+
+    @swagger_auto_schema(
+        operation_description="게시글 검색 API (제목, 본문, 댓글 / 한글은 2글자 이상)",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('page', openapi.IN_QUERY, description="페이지 번호", type=openapi.TYPE_INTEGER),
+            *SPARSE_PARAMETERS,
+        ],
+        responses={
+            200: openapi.Response("검색 결과 반환", BoardSearchResultSerializer(many=True)),
+        }
+    )
+    def get(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        boards = self.sparse_queryset(Board.objects.all()).in_bulk([hit['board'] for hit in page])
+        results = []
+        for hit in page:
+            board = boards.get(hit['board'])
+            if board is not None:
+                board.search_score = hit['score']
+                results.append(board)
+        serializer = self.get_serializer(results, many=True)
+        return self.get_paginated_response(serializer.data)
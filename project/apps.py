@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ProjectConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'project'
+
+    def ready(self):
+        from scb_be import versions
+        from .models import Comment, Project
+
+        versions.track(Project)
+        versions.track(Comment, parents=('project',))
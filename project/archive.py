@@ -0,0 +1,166 @@
+import codecs
+import os
+import stat
+import struct
+import zipfile
+import zlib
+
+from django.conf import settings
+
+PREVIEW_EXTENSIONS = ('.py', '.java', '.js', '.html', '.txt')  # 코드 미리보기 대상 확장자
+
+LANGUAGES = {
+    '.py': 'python',
+    '.java': 'java',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.html': 'html',
+    '.css': 'css',
+    '.c': 'c',
+    '.h': 'c',
+    '.cpp': 'cpp',
+    '.kt': 'kotlin',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.md': 'markdown',
+    '.txt': 'text',
+}
+
+ENCODING_CANDIDATES = ('utf-8', 'cp949')  # 한글 Windows 환경에서 만든 파일은 cp949인 경우가 많음
+DETECT_SAMPLE_SIZE = 16 * 1024  # 인코딩 판별에 사용할 앞부분 크기
+
+
+def detect_language(path):
+    return LANGUAGES.get(os.path.splitext(path)[1].lower(), '')
+
+
+def detect_encoding(sample, complete=True):
+    """텍스트 인코딩을 추정합니다. 바이너리로 보이면 빈 문자열을 반환합니다."""
+    if b'\x00' in sample[:8192]:
+        return ''
+    for encoding in ENCODING_CANDIDATES:
+        try:
+            # 샘플이 잘린 경우 마지막 멀티바이트 문자가 잘려도 실패로 보지 않음
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=complete)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return ''
+
+
+def is_text_member(entry):
+    """코드 미리보기/검색 대상인 텍스트 파일인지 확인합니다."""
+    return bool(entry.encoding) and entry.path.endswith(PREVIEW_EXTENSIONS)
+
+
+def top_level_directory(names):
+    return names[0].split('/')[0] if names else "Unknown"
+
+
+class ArchiveError(ValueError):
+    """업로드된 ZIP 파일이 잘못되었거나 제한을 초과함"""
+
+
+def _is_unsafe_path(name):
+    normalized = name.replace('\\', '/')
+    if normalized.startswith('/') or (len(normalized) > 1 and normalized[1] == ':'):
+        return True  # 절대 경로 / 드라이브 문자
+    return '..' in normalized.split('/')
+
+
+def _is_symlink(info):
+    return stat.S_ISLNK(info.external_attr >> 16)
+
+
+def scan_archive(fileobj, limits=None):
+    """
+    ZIP 파일을 한 번 훑으며 검증하고 (최상위 디렉토리, 파일 인덱스 목록)을 반환합니다.
+    인덱스 항목은 ProjectFile 필드와 같은 키를 가진 dict입니다.
+
+    - 중앙 디렉터리를 파싱하기 전에 끝 레코드의 항목 수를 먼저 확인
+    - 전체 압축 해제 크기, 파일당 압축률, 경로 조작(../, 절대 경로, 심볼릭 링크) 검사
+    - 인코딩 판별은 파일당 앞부분 DETECT_SAMPLE_SIZE 바이트만 압축 해제
+    제한을 넘으면 ArchiveError를 발생시킵니다.
+    """
+    limits = limits or settings.PROJECT_ARCHIVE_LIMITS
+    fileobj.seek(0)
+    try:
+        end_record = zipfile._EndRecData(fileobj)
+    except OSError as exc:
+        raise ArchiveError("Invalid ZIP file uploaded.") from exc
+    if not end_record:
+        raise ArchiveError("Invalid ZIP file uploaded.")
+    if end_record[zipfile._ECD_ENTRIES_TOTAL] > limits['MAX_MEMBERS']:
+        raise ArchiveError(f"ZIP file has too many entries (max {limits['MAX_MEMBERS']}).")
+
+    entries = []
+    total_size = 0
+    try:
+        with zipfile.ZipFile(fileobj, 'r') as zf:
+            infos = zf.infolist()
+            if len(infos) > limits['MAX_MEMBERS']:
+                raise ArchiveError(f"ZIP file has too many entries (max {limits['MAX_MEMBERS']}).")
+
+            for info in infos:
+                if _is_unsafe_path(info.filename) or _is_symlink(info):
+                    raise ArchiveError(f"Unsafe path in ZIP file: {info.filename}")
+                if info.is_dir():
+                    continue
+
+                total_size += info.file_size
+                if total_size > limits['MAX_TOTAL_SIZE']:
+                    raise ArchiveError("ZIP file is too large when extracted.")
+                if (info.file_size >= limits['RATIO_MIN_SIZE']
+                        and info.file_size > info.compress_size * limits['MAX_COMPRESSION_RATIO']):
+                    raise ArchiveError(f"Suspicious compression ratio: {info.filename}")
+
+                encoding = ''
+                if not info.flag_bits & 0x1:  # 암호화된 파일은 내용을 읽지 않음
+                    with zf.open(info) as member:
+                        sample = member.read(DETECT_SAMPLE_SIZE)
+                    encoding = detect_encoding(sample, complete=len(sample) >= info.file_size)
+                entries.append({
+                    'path': info.filename,
+                    'size': info.file_size,
+                    'compressed_size': info.compress_size,
+                    'crc': info.CRC,
+                    'compress_type': info.compress_type,
+                    'header_offset': info.header_offset,
+                    'encoding': encoding,
+                    'language': detect_language(info.filename),
+                })
+            return top_level_directory([info.filename for info in infos]), entries
+    except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError, EOFError, zlib.error) as exc:
+        raise ArchiveError("Invalid ZIP file uploaded.") from exc
+    finally:
+        fileobj.seek(0)
+
+
+def open_member(fileobj, entry):
+    """
+    인덱스 항목의 header_offset으로 바로 이동해 멤버 하나만 읽는 파일 객체를 반환합니다.
+    (중앙 디렉터리 전체를 다시 읽지 않음)
+    """
+    fileobj.seek(entry.header_offset)
+    header = fileobj.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader:
+        raise zipfile.BadZipFile("Truncated file header")
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile("Bad magic number for file header")
+    fileobj.seek(fields[zipfile._FH_FILENAME_LENGTH] + fields[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+    info = zipfile.ZipInfo(entry.path)
+    info.compress_type = entry.compress_type
+    info.compress_size = entry.compressed_size
+    info.file_size = entry.size
+    info.CRC = entry.crc
+    return zipfile.ZipExtFile(fileobj, 'rb', info)
+
+
+def read_member_text(fileobj, entry):
+    """멤버를 인덱스에 기록된 인코딩으로 디코딩합니다."""
+    with open_member(fileobj, entry) as member:
+        return member.read().decode(entry.encoding or 'utf-8', errors='replace')
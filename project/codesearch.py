@@ -0,0 +1,231 @@
+"""
+업로드된 전체 프로젝트 코드 검색 (트라이그램 색인)
+
+색인
+- 코드 미리보기와 같은 텍스트 파일(is_text_member)만 ZIP에서 한 번 읽어
+  소문자 트라이그램 집합을 CodeTrigram(trigram -> 파일)에 저장합니다.
+- 업로드된 프로젝트는 트랜잭션 커밋 후 백그라운드 스레드에서 바로 색인합니다. (schedule_code_index)
+- manage.py index_code는 누락된 프로젝트를 다시 색인합니다. ZIP 읽기/트라이그램 계산은 프로세스 풀에서 실행하고
+  DB 저장은 메인 프로세스에서 합니다.
+
+검색
+- 검색어의 트라이그램을 모두 가진 파일만 후보로 고른 뒤 (색인)
+  후보 파일을 실제로 읽어 일치하는 줄과 앞뒤 문맥을 반환합니다. (검증)
+"""
+import logging
+import os
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Count
+
+from .archive import ArchiveError, is_text_member, read_member_text
+from .models import CodeTrigram, Project, ProjectFile
+from .preview import member_cache_key, preview_cache
+from .storage import get_blob_store
+
+logger = logging.getLogger(__name__)
+
+MIN_QUERY_LENGTH = 3
+CANDIDATE_FIELDS = (
+    'id', 'path', 'size', 'compressed_size', 'crc', 'compress_type', 'header_offset', 'encoding',
+    'project__id', 'project__team_name', 'project__code_digest',
+)
+
+
+def trigrams(text):
+    """소문자로 바꾼 텍스트의 트라이그램 집합 (줄바꿈을 넘는 트라이그램은 제외)"""
+    result = set()
+    for line in text.lower().splitlines():
+        result.update(line[i:i + 3] for i in range(len(line) - 2))
+    return result
+
+
+def searchable_entries(project):
+    max_size = settings.PROJECT_CODE_SEARCH['MAX_FILE_SIZE']
+    return [
+        entry for entry in project.files.order_by('path')
+        if is_text_member(entry) and entry.size <= max_size
+    ]
+
+
+def extract_trigrams(code_digest, entries):
+    """
+    (워커 프로세스) ZIP 하나에서 파일별 트라이그램 목록을 계산합니다. DB는 사용하지 않습니다.
+    반환값: {파일 id: [트라이그램, ...]}
+    """
+    result = {}
+    with get_blob_store().open(code_digest) as fh:
+        for entry in entries:
+            try:
+                text = read_member_text(fh, entry)
+            except (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError):
+                continue  # 손상된 멤버는 건너뜀
+            result[entry.pk] = sorted(trigrams(text))
+    return result
+
+
+def save_trigrams(project, trigrams_by_file):
+    """extract_trigrams 결과를 저장하고 프로젝트를 색인 완료로 표시합니다."""
+    with transaction.atomic():
+        CodeTrigram.objects.filter(file__project=project).delete()
+        CodeTrigram.objects.bulk_create(
+            [
+                CodeTrigram(trigram=trigram, file_id=file_id)
+                for file_id, file_trigrams in trigrams_by_file.items()
+                for trigram in file_trigrams
+            ],
+            batch_size=5000,
+        )
+        Project.objects.filter(pk=project.pk).update(code_indexed=True)
+
+
+def _init_worker():
+    # spawn 방식으로 시작된 워커에서도 설정/앱을 사용할 수 있도록
+    if not apps.ready:
+        django.setup()
+
+
+def index_projects(projects, workers=None, on_indexed=None):
+    """
+    프로젝트들의 코드 검색 색인을 만듭니다.
+    workers가 1이면 현재 프로세스에서, 그 외에는 프로세스 풀에서 ZIP을 읽습니다.
+    on_indexed(project, file_count)는 프로젝트 하나를 저장할 때마다 호출됩니다.
+    """
+    workers = workers or settings.PROJECT_CODE_SEARCH['WORKERS'] or os.cpu_count() or 1
+    jobs = []
+    for project in projects:
+        try:
+            project.ensure_file_index()
+        except ArchiveError:
+            continue
+        jobs.append((project, searchable_entries(project)))
+
+    def finish(project, trigrams_by_file):
+        save_trigrams(project, trigrams_by_file)
+        if on_indexed:
+            on_indexed(project, len(trigrams_by_file))
+
+    if workers == 1:
+        for project, entries in jobs:
+            finish(project, extract_trigrams(project.code_digest, entries))
+        return len(jobs)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [
+            (project, executor.submit(extract_trigrams, project.code_digest, entries))
+            for project, entries in jobs
+        ]
+        for project, future in futures:
+            finish(project, future.result())
+    return len(jobs)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PROJECT_CODE_SEARCH['UPLOAD_WORKERS'], thread_name_prefix='code-index'
+            )
+        return _executor
+
+
+def _run(project_id):
+    close_old_connections()
+    try:
+        project = Project.objects.only('id', 'code_digest', 'files_indexed').filter(pk=project_id).first()
+        if project is not None:  # 색인 전에 삭제된 프로젝트는 건너뜀
+            index_projects([project], workers=1)
+    except Exception:
+        logger.exception("Project %s code index failed", project_id)  # manage.py index_code로 다시 색인
+    finally:
+        close_old_connections()
+
+
+def schedule_code_index(project_id):
+    """트랜잭션 커밋 후 백그라운드에서 프로젝트 코드를 색인합니다."""
+    transaction.on_commit(lambda: _get_executor().submit(_run, project_id))
+
+
+def candidate_files(query):
+    """검색어의 트라이그램을 모두 포함한 파일 queryset (검증 전 후보)"""
+    query_trigrams = trigrams(query)
+    file_ids = (
+        CodeTrigram.objects.filter(trigram__in=query_trigrams)
+        .values('file').annotate(matched=Count('trigram')).filter(matched=len(query_trigrams))
+        .values('file')
+    )
+    return (
+        ProjectFile.objects.filter(pk__in=file_ids)
+        .select_related('project')
+        .only(*CANDIDATE_FIELDS)
+        .order_by('project_id', 'path')
+    )
+
+
+def _read_texts(project, entries):
+    """후보 파일 내용을 읽습니다. 코드 미리보기 캐시에 있으면 ZIP을 열지 않습니다."""
+    keys = {entry.pk: member_cache_key(project, entry) for entry in entries}
+    cached = preview_cache().get_many(keys.values())
+    texts = {entry.pk: cached[keys[entry.pk]] for entry in entries if keys[entry.pk] in cached}
+    missing = [entry for entry in entries if entry.pk not in texts]
+    if missing:
+        with project.open_code() as fh:
+            for entry in missing:
+                texts[entry.pk] = read_member_text(fh, entry)
+    return texts
+
+
+def find_lines(text, query, context, case_sensitive=False):
+    """(줄 번호, 줄, 앞 문맥, 뒤 문맥) 목록"""
+    lines = text.splitlines()
+    needle = query if case_sensitive else query.lower()
+    matches = []
+    for index, line in enumerate(lines):
+        haystack = line if case_sensitive else line.lower()
+        if needle in haystack:
+            matches.append((index + 1, line, lines[max(index - context, 0):index], lines[index + 1:index + 1 + context]))
+    return matches
+
+
+def search_code(query, context=2, case_sensitive=False, limit=None):
+    """
+    검색어가 들어있는 줄을 찾습니다.
+    반환값: (일치 목록, 결과가 limit에서 잘렸는지 여부)
+    """
+    limit = limit or settings.PROJECT_CODE_SEARCH['MAX_RESULTS']
+    candidates = list(candidate_files(query))
+
+    by_project = {}
+    for entry in candidates:
+        by_project.setdefault(entry.project_id, (entry.project, []))[1].append(entry)
+
+    results = []
+    for project, entries in by_project.values():
+        texts = _read_texts(project, entries)
+        for entry in entries:
+            for line_number, line, before, after in find_lines(texts[entry.pk], query, context, case_sensitive):
+                if len(results) >= limit:
+                    return results, True
+                results.append({
+                    'project': project.pk,
+                    'team_name': project.team_name,
+                    'file': entry.pk,
+                    'path': entry.path,
+                    'line': line_number,
+                    'text': line,
+                    'before': before,
+                    'after': after,
+                })
+    return results, False
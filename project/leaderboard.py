@@ -0,0 +1,75 @@
+"""
+프로젝트 점수 순위표 (DB 조회)
+
+project_score_idx (score_status, score DESC, id) 인덱스만 읽습니다. (테이블 행은 읽지 않음)
+- 상위 N개: 채점 완료 범위 앞에서 N행 (정렬 없음)
+- 특정 프로젝트 순위: 더 높은 점수의 COUNT + 1 (인덱스 범위만 셈)
+- 주변 K개: 앞뒤 방향으로 각각 K행 (scb_be.pagination.rows_after) + COUNT 두 번
+
+점수는 DB에만 있으므로 어느 프로세스(웹 서버, score_worker)가 쓴 점수든 다음 조회에 바로 반영됩니다.
+(프로세스마다 메모리 사본을 두고 다시 만드는 비용 없음)
+"""
+from scb_be.pagination import rows_after
+
+from .models import Project
+
+
+class Leaderboard:
+    def _scored(self):
+        return Project.objects.filter(score_status=Project.SCORE_SCORED)
+
+    def _score_of(self, project_id):
+        if project_id is None:
+            return None
+        return self._scored().filter(pk=project_id).values_list('score', flat=True).first()
+
+    def _entries(self, rows, position, rank):
+        """
+        rows: 순위 순서의 (id, score) 목록
+        position: 첫 행 앞에 있는 항목 수, rank: 첫 행의 순위
+        동점이면 같은 순위 (1, 2, 2, 4 ...)
+        """
+        entries = []
+        for index, (project_id, score) in enumerate(rows):
+            if index and score != entries[-1]['score']:
+                rank = position + index + 1
+            entries.append({'rank': rank, 'id': project_id, 'score': score})
+        return entries
+
+    # 조회
+    def top(self, limit):
+        rows = self._scored().order_by('-score', 'id').values_list('id', 'score')[:limit]
+        return self._entries(list(rows), 0, 1)
+
+    def rank(self, project_id):
+        """프로젝트의 순위 정보를 반환합니다. 순위표에 없으면 None"""
+        score = self._score_of(project_id)
+        if score is None:
+            return None
+        return {'rank': self._scored().filter(score__gt=score).count() + 1, 'id': project_id, 'score': score}
+
+    def around(self, project_id, radius):
+        """프로젝트 앞뒤 radius개씩을 포함한 순위 목록을 반환합니다. 순위표에 없으면 None"""
+        score = self._score_of(project_id)
+        if score is None:
+            return None
+        rows = self._scored().values_list('id', 'score')
+        above = rows_after(rows.order_by('score', '-id'), ('score', '-id'), (score, project_id), radius)
+        below = rows_after(rows.order_by('-score', 'id'), ('-score', 'id'), (score, project_id), radius)
+        rows = [*reversed(above), (project_id, score), *below]
+
+        first_id, first_score = rows[0]
+        higher = self._scored().filter(score__gt=first_score).count()
+        position = higher + self._scored().filter(score=first_score, id__lt=first_id).count()
+        return self._entries(rows, position, higher + 1)
+
+    def __len__(self):
+        return self._scored().count()
+
+
+_leaderboard = Leaderboard()
+
+
+def get_leaderboard():
+    """순위표를 반환합니다. (상태가 없으므로 프로세스에서 하나를 공유)"""
+    return _leaderboard
@@ -0,0 +1,135 @@
+import re
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+from rest_framework.utils.urls import replace_query_param
+
+from board.models import Board
+from project.models import Project
+
+# 실제 URL을 요청해 실행된 SELECT를 EXPLAIN 합니다. ({board} / {project}는 첫 번째 게시글 / 프로젝트 id)
+ENDPOINTS = [
+    "/api/board/boards/",
+    "/api/board/boards/?sort=discussed",
+    "/api/board/boards/?sort=active",
+    "/api/board/boards/?fields=id,title",
+    "/api/board/boards/?stream=1",
+    "/api/board/boards/{board}/",
+    "/api/board/boards/{board}/comments/",
+    "/api/board/comments/",
+    "/api/projects/",
+    "/api/projects/?sort=discussed",
+    "/api/projects/?sort=active",
+    "/api/projects/?stream=1",
+    "/api/projects/{project}/",
+    "/api/projects/{project}/comments/",
+    "/api/projects/leaderboard/",
+    "/users/profile/",
+]
+PAGE_SIZE = 2  # 데이터가 적어도 다음 페이지(커서 조건) 쿼리까지 실행되도록
+
+# 응답 캐시 / 인증 캐시를 거치지 않고 매번 쿼리가 실행되도록
+NO_CACHE = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+
+def _fetch(client, url):
+    """응답 본문까지 읽습니다. (스트리밍 응답은 읽는 동안 쿼리를 실행)"""
+    response = client.get(url)
+    if response.streaming:
+        b''.join(response.streaming_content)
+    return response
+
+
+def endpoint_queries(user=None):
+    """(엔드포인트 이름, 실행된 SELECT 목록) 목록. 목록 API는 다음 페이지까지 요청합니다."""
+    ids = {
+        'board': Board.objects.order_by('pk').values_list('pk', flat=True).first() or 1,
+        'project': Project.objects.order_by('pk').values_list('pk', flat=True).first() or 1,
+    }
+    client = APIClient()
+    if user is not None:
+        client.force_authenticate(user)
+
+    result = []
+    with override_settings(
+        CACHES={alias: NO_CACHE for alias in settings.CACHES},
+        ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+        SECURE_SSL_REDIRECT=False,
+    ):
+        for template in ENDPOINTS:
+            url = template.format(**ids)
+            if 'stream=' not in url:
+                url = replace_query_param(url, 'page_size', PAGE_SIZE)
+            with CaptureQueriesContext(connection) as ctx:
+                response = _fetch(client, url)
+            result.append((f"GET {url} ({response.status_code})", ctx.captured_queries))
+
+            next_url = response.data.get('next') if isinstance(getattr(response, 'data', None), dict) else None
+            if next_url:
+                with CaptureQueriesContext(connection) as ctx:
+                    response = _fetch(client, next_url)
+                result.append((f"GET {url} next page ({response.status_code})", ctx.captured_queries))
+
+    return [
+        (name, [query['sql'] for query in queries if query['sql'].lstrip().upper().startswith('SELECT')])
+        for name, queries in result
+    ]
+
+
+def _ordered_limit_scan(sql, plan):
+    """
+    조건 없이 기본 키 순서로 읽다가 LIMIT에서 멈추는 쿼리 (첫 페이지 등)
+    SQLite는 이것도 SCAN <table>로 표시하지만 정렬(TEMP B-TREE) 없이 LIMIT 행만 읽습니다.
+    """
+    return ' WHERE ' not in sql and ' LIMIT ' in sql and not any('TEMP B-TREE' in line for line in plan)
+
+
+class Command(BaseCommand):
+    help = "각 목록/상세 API를 실제로 요청해 실행된 쿼리를 EXPLAIN 하고 전체 테이블 스캔을 표시합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fail-on-scan', action='store_true', help="전체 테이블 스캔이 있으면 실패로 종료")
+        parser.add_argument('--user', help="이 사용자로 로그인해 요청 (username, 기본: 로그인 안 함)")
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            prefix = 'EXPLAIN QUERY PLAN '
+            # SCAN <table> 뒤에 USING (COVERING) INDEX가 없으면 전체 스캔
+            full_scan = re.compile(r'\bSCAN (\w+)(?!\w| USING)')
+        else:
+            prefix = 'EXPLAIN '
+            full_scan = re.compile(r'Seq Scan on (\w+)')
+
+        user = None
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"User {options['user']} does not exist.")
+
+        scans = []
+        for name, queries in endpoint_queries(user):
+            flagged = []
+            plans = []
+            for sql in queries:
+                with connection.cursor() as cursor:
+                    cursor.execute(prefix + sql)  # 캡처된 SQL은 값이 채워진 상태
+                    plan = [' '.join(str(column) for column in row) for row in cursor.fetchall()]
+                plans.append((sql, plan))
+                if not _ordered_limit_scan(sql, plan):
+                    flagged += [match for line in plan for match in full_scan.findall(line)]
+
+            status = self.style.ERROR('FULL SCAN') if flagged else self.style.SUCCESS('OK')
+            self.stdout.write(f"{status} {name}")
+            for sql, plan in plans:
+                self.stdout.write(f"  {sql}")
+                for line in plan:
+                    self.stdout.write(f"    {line}")
+            if flagged:
+                scans.append((name, flagged))
+
+        if scans and options['fail_on_scan']:
+            raise CommandError(f"{len(scans)} endpoint(s) use a full table scan.")
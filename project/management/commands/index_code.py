@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from project.codesearch import index_projects
+from project.models import Project
+
+
+class Command(BaseCommand):
+    help = "업로드된 프로젝트 ZIP의 코드 검색 색인(트라이그램)을 프로세스 풀로 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, help="색인 프로세스 수 (기본: PROJECT_CODE_SEARCH['WORKERS'] 또는 CPU 코어 수)")
+        parser.add_argument('--batch-size', type=int, default=100, help="한 번에 프로세스 풀로 보낼 프로젝트 수")
+        parser.add_argument('--reindex', action='store_true', help="이미 색인된 프로젝트도 다시 색인")
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.only('id', 'code_digest', 'files_indexed').order_by('pk')
+        if not options['reindex']:
+            queryset = queryset.filter(code_indexed=False)
+
+        def report(project, file_count):
+            self.stdout.write(f"Indexed project {project.pk} ({file_count} files)")
+
+        total = 0
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:options['batch_size']])
+            if not batch:
+                break
+            total += index_projects(batch, workers=options['workers'], on_indexed=report)
+            last_pk = batch[-1].pk
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} project(s)."))
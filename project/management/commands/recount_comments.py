@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max
+
+from scb_be import versions
+
+from board.models import Board, Comment as BoardComment
+from project.models import Project, Comment as ProjectComment
+
+# 이름 -> (모델, 댓글 모델, 댓글 FK 이름, 작성 시각 필드)
+TARGETS = {
+    'boards': (Board, BoardComment, 'board', 'date_created'),
+    'projects': (Project, ProjectComment, 'project', 'created_at'),
+}
+
+
+def recount(model, comment_model, fk_name, created_field, batch_size):
+    """
+    pk 순서로 batch_size개씩 댓글 수 / 마지막 활동 시각을 다시 계산하고
+    값이 달라진 행만 저장합니다. (배치마다 하나의 트랜잭션)
+    반환값: (검사한 행 수, 수정한 행 수)
+    """
+    checked = fixed = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                model.objects.select_for_update()
+                .filter(pk__gt=last_pk).order_by('pk')
+                .only('id', 'comment_count', 'last_activity_at', created_field)[:batch_size]
+            )
+            if not rows:
+                break
+            stats = {
+                row[fk_name]: row
+                for row in comment_model.objects.filter(**{f'{fk_name}__in': [obj.pk for obj in rows]})
+                .values(fk_name).annotate(count=Count('id'), latest=Max('created_at'))
+            }
+            changed = []
+            for obj in rows:
+                row = stats.get(obj.pk)
+                created = getattr(obj, created_field)
+                count = row['count'] if row else 0
+                last_activity = max(created, row['latest']) if row else created
+                if obj.comment_count != count or obj.last_activity_at != last_activity:
+                    obj.comment_count = count
+                    obj.last_activity_at = last_activity
+                    changed.append(obj)
+            model.objects.bulk_update(changed, ['comment_count', 'last_activity_at'])
+            if changed:
+                versions.bump_on_commit(versions.model_name(model))  # bulk_update는 signal이 없음
+        checked += len(rows)
+        fixed += len(changed)
+        last_pk = rows[-1].pk
+    return checked, fixed
+
+
+class Command(BaseCommand):
+    help = "게시글/프로젝트의 comment_count, last_activity_at을 댓글 테이블 기준으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', choices=sorted(TARGETS), help="한 종류만 다시 계산")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 트랜잭션에서 처리할 행 수")
+
+    def handle(self, *args, **options):
+        names = [options['only']] if options['only'] else sorted(TARGETS)
+        for name in names:
+            checked, fixed = recount(*TARGETS[name], batch_size=options['batch_size'])
+            self.stdout.write(f"{name}: checked {checked}, fixed {fixed}")
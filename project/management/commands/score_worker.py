@@ -0,0 +1,35 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from project.worker import ScoreWorker
+
+
+class Command(BaseCommand):
+    help = "AI 채점 작업 큐(ScoreJob)를 처리하는 워커를 실행합니다."
+
+    def add_arguments(self, parser):
+        options = settings.SCORE_WORKER
+        parser.add_argument('--concurrency', type=int, default=options['CONCURRENCY'], help="동시에 실행할 작업 수")
+        parser.add_argument('--timeout', type=float, default=options['TIMEOUT'], help="작업당 제한 시간(초)")
+        parser.add_argument('--max-attempts', type=int, default=options['MAX_ATTEMPTS'], help="최대 시도 횟수")
+        parser.add_argument('--backoff', type=float, default=options['BACKOFF'], help="재시도 대기 기준 시간(초)")
+        parser.add_argument('--poll-interval', type=float, default=options['POLL_INTERVAL'], help="큐 확인 주기(초)")
+        parser.add_argument('--once', action='store_true', help="실행 가능한 작업을 모두 처리한 뒤 종료")
+
+    def handle(self, *args, **options):
+        worker = ScoreWorker(
+            concurrency=options['concurrency'],
+            timeout=options['timeout'],
+            max_attempts=options['max_attempts'],
+            backoff=options['backoff'],
+            poll_interval=options['poll_interval'],
+        )
+        signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+        self.stdout.write(f"Score worker started (concurrency={options['concurrency']}).")
+        try:
+            worker.run(once=options['once'])
+        except KeyboardInterrupt:
+            worker.stop()
+        self.stdout.write("Score worker stopped.")
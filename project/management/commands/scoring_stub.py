@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from project.scoring_stub import ScoringStubServer
+
+
+class Command(BaseCommand):
+    help = "로컬 AI 채점 서비스 스텁을 실행합니다. (SCORING_SERVICE['URL']을 출력된 주소로 설정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--score', type=float, default=50.0, help="반환할 점수")
+        parser.add_argument('--status', type=int, default=200, help="반환할 HTTP 상태 코드")
+        parser.add_argument('--delay', type=float, default=0, help="응답 지연 시간(초)")
+
+    def handle(self, *args, **options):
+        server = ScoringStubServer(
+            options['host'], options['port'],
+            score=options['score'], status=options['status'], delay=options['delay'], verbose=True,
+        )
+        self.stdout.write(f"Scoring stub listening on {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
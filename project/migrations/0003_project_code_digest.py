@@ -0,0 +1,49 @@
+import io
+
+from django.db import migrations, models
+
+
+def move_code_to_blob_store(apps, schema_editor):
+    from project.storage import get_blob_store
+
+    Project = apps.get_model('project', 'Project')
+    store = get_blob_store()
+    for project in Project.objects.only('id', 'code').iterator():
+        digest, size = store.save(io.BytesIO(bytes(project.code or b'')))
+        Project.objects.filter(pk=project.pk).update(code_digest=digest, file_size=size)
+
+
+def move_code_to_database(apps, schema_editor):
+    from project.storage import get_blob_store
+
+    Project = apps.get_model('project', 'Project')
+    store = get_blob_store()
+    for project in Project.objects.only('id', 'code_digest').iterator():
+        if project.code_digest and store.exists(project.code_digest):
+            Project.objects.filter(pk=project.pk).update(code=store.read(project.code_digest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0002_project_created_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='code_digest',
+            field=models.CharField(db_index=True, default='', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='code',
+            field=models.BinaryField(default=b''),
+        ),
+        migrations.RunPython(move_code_to_blob_store, move_code_to_database),
+        migrations.RemoveField(
+            model_name='project',
+            name='code',
+        ),
+    ]
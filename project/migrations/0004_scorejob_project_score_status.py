@@ -0,0 +1,44 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def mark_existing_projects_scored(apps, schema_editor):
+    # 기존 프로젝트는 생성 시점에 이미 동기식으로 채점됨
+    Project = apps.get_model('project', 'Project')
+    Project.objects.update(score_status='scored')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0003_project_code_digest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='score_status',
+            field=models.CharField(choices=[('pending', '채점 대기'), ('scored', '채점 완료'), ('failed', '채점 실패')], default='pending', max_length=10),
+        ),
+        migrations.RunPython(mark_existing_projects_scored, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ScoreJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='queued', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='score_jobs', to='project.project')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'run_after'], name='scorejob_status_run_after')],
+            },
+        ),
+    ]
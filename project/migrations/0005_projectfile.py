@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_scorejob_project_score_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='files_indexed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='ProjectFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500)),
+                ('size', models.PositiveBigIntegerField()),
+                ('compressed_size', models.PositiveBigIntegerField()),
+                ('crc', models.PositiveBigIntegerField()),
+                ('compress_type', models.PositiveSmallIntegerField()),
+                ('header_offset', models.PositiveBigIntegerField()),
+                ('encoding', models.CharField(blank=True, max_length=20)),
+                ('language', models.CharField(blank=True, max_length=20)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='files', to='project.project')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('project', 'path'), name='unique_project_file_path')],
+            },
+        ),
+    ]
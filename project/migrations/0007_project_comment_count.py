@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:21
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def fill_comment_counts(apps, schema_editor):
+    # 기존 프로젝트의 댓글 수 / 마지막 활동 시각 채우기
+    Project = apps.get_model('project', 'Project')
+    Comment = apps.get_model('project', 'Comment')
+    stats = {
+        row['project']: row
+        for row in Comment.objects.values('project').annotate(count=Count('id'), latest=Max('created_at'))
+    }
+    projects = list(Project.objects.only('id', 'created_at'))
+    for project in projects:
+        row = stats.get(project.pk)
+        project.comment_count = row['count'] if row else 0
+        project.last_activity_at = max(project.created_at, row['latest']) if row else project.created_at
+    Project.objects.bulk_update(projects, ['comment_count', 'last_activity_at'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0006_project_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(fill_comment_counts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['comment_count', 'id'], name='project_comment_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['last_activity_at', 'id'], name='project_last_activity_idx'),
+        ),
+    ]
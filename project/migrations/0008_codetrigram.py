@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0007_project_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='code_indexed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='CodeTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='project.projectfile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['file'], name='project_codetrigram_file_idx')],
+                'constraints': [models.UniqueConstraint(fields=('trigram', 'file'), name='unique_code_trigram_file')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0008_codetrigram'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='project_score_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(models.OrderBy(models.F('score'), descending=True), models.F('id'), condition=models.Q(('score_status', 'scored')), name='project_score_idx'),
+        ),
+    ]
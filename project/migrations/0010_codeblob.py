@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:53
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_blob_refs(apps, schema_editor):
+    # 기존 프로젝트가 참조하는 blob별 참조 수 채우기
+    Project = apps.get_model('project', 'Project')
+    CodeBlob = apps.get_model('project', 'CodeBlob')
+    rows = Project.objects.exclude(code_digest='').values('code_digest').annotate(refs=Count('id'))
+    CodeBlob.objects.bulk_create(
+        [CodeBlob(digest=row['code_digest'], refs=row['refs']) for row in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0009_project_score_idx_scored'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CodeBlob',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('refs', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_blob_refs, migrations.RunPython.noop),
+    ]
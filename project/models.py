@@ -1,24 +1,199 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.utils.timezone import now
 from django.contrib.auth.models import User
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .archive import scan_archive
+from .storage import get_blob_store
 
 class Project(models.Model):
+    SCORE_PENDING = 'pending'
+    SCORE_SCORED = 'scored'
+    SCORE_FAILED = 'failed'
+    SCORE_STATUS_CHOICES = [
+        (SCORE_PENDING, '채점 대기'),
+        (SCORE_SCORED, '채점 완료'),
+        (SCORE_FAILED, '채점 실패'),
+    ]
+
     team_name = models.CharField(max_length=100)  # 팀 이름
     team_members = models.CharField(max_length=255)  # 팀 멤버 이름 (콤마로 구분)
-    code = models.BinaryField()  # ZIP 파일 데이터를 저장
+    code_digest = models.CharField(max_length=64, db_index=True)  # ZIP 파일의 SHA-256 (blob 저장소 키)
     top_level_directory = models.CharField(max_length=255, blank=True)  # 최상위 디렉토리 이름 저장
     score = models.FloatField(default=0.0)  # AI 점수
+    score_status = models.CharField(max_length=10, choices=SCORE_STATUS_CHOICES, default=SCORE_PENDING)  # AI 채점 상태
     description = models.TextField(blank=True)  # 사용자 입력 내용 또는 프로젝트 설명
     created_at = models.DateTimeField(auto_now_add=True)  # default 제거
     updated_at = models.DateTimeField(auto_now=True)  # 프로젝트 수정 시간
     file_size = models.PositiveIntegerField(default=0)  # ZIP 파일 크기 (바이트 단위)
+    files_indexed = models.BooleanField(default=False)  # ZIP 파일 인덱스(ProjectFile) 생성 여부
+    code_indexed = models.BooleanField(default=False)  # 코드 검색 색인(CodeTrigram) 생성 여부
+    comment_count = models.PositiveIntegerField(default=0)  # 댓글 수 (댓글 작성/삭제 시 갱신)
+    last_activity_at = models.DateTimeField(default=now)  # 생성 또는 마지막 댓글 작성/삭제 시각
 
     created_by = models.ForeignKey(User, on_delete=models.CASCADE)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='project_created_idx'),  # 목록 페이지네이션
+            models.Index(fields=['score_status', '-score', 'id'], name='project_score_idx'),  # 점수 순위 (채점 상태별)
+            models.Index(fields=['created_by', 'created_at'], name='project_author_created_idx'),
+            models.Index(fields=['comment_count', 'id'], name='project_comment_count_idx'),  # 댓글 많은 순
+            models.Index(fields=['last_activity_at', 'id'], name='project_last_activity_idx'),  # 최근 활동 순
+        ]
 
     def __str__(self):
         return self.team_name
 
+    @classmethod
+    def record_comment_added(cls, project_id):
+        """댓글 수와 마지막 활동 시각을 갱신합니다. (댓글 저장과 같은 트랜잭션에서 호출)"""
+        cls.objects.filter(pk=project_id).update(comment_count=F('comment_count') + 1, last_activity_at=now())
+
+    @classmethod
+    def record_comment_deleted(cls, project_id):
+        cls.objects.filter(pk=project_id, comment_count__gt=0).update(
+            comment_count=F('comment_count') - 1, last_activity_at=now()
+        )
+
+    def open_code(self):
+        """blob 저장소에서 ZIP 파일을 읽기 전용으로 엽니다."""
+        return get_blob_store().open(self.code_digest)
+
+    def save_file_index(self, entries):
+        """scan_archive 결과로 ZIP 파일 인덱스를 저장합니다."""
+        ProjectFile.objects.bulk_create(
+            [ProjectFile(project=self, **entry) for entry in entries],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+    def ensure_file_index(self):
+        """인덱스가 없는 기존 프로젝트는 처음 조회할 때 한 번 생성합니다."""
+        if self.files_indexed:
+            return
+        with self.open_code() as fh:
+            _, entries = scan_archive(fh)
+        self.save_file_index(entries)
+        Project.objects.filter(pk=self.pk).update(files_indexed=True)
+        self.files_indexed = True
+
+
+class ProjectFile(models.Model):
+    """ZIP 파일 안의 파일 인덱스 (업로드 시 한 번 생성)"""
+    project = models.ForeignKey(Project, related_name='files', on_delete=models.CASCADE)
+    path = models.CharField(max_length=500)  # ZIP 내부 경로
+    size = models.PositiveBigIntegerField()  # 압축 해제 크기
+    compressed_size = models.PositiveBigIntegerField()  # 압축 크기
+    crc = models.PositiveBigIntegerField()  # CRC-32
+    compress_type = models.PositiveSmallIntegerField()  # ZIP 압축 방식
+    header_offset = models.PositiveBigIntegerField()  # 로컬 파일 헤더 위치 (멤버 하나만 바로 읽기 위함)
+    encoding = models.CharField(max_length=20, blank=True)  # 감지된 인코딩 (바이너리면 빈 값)
+    language = models.CharField(max_length=20, blank=True)  # 확장자로 판별한 언어
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'path'], name='unique_project_file_path'),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id}:{self.path}"
+
+
+class CodeTrigram(models.Model):
+    """코드 검색 색인: 소문자 트라이그램 -> 그 트라이그램을 포함한 파일"""
+    trigram = models.CharField(max_length=3)
+    file = models.ForeignKey(ProjectFile, related_name='+', on_delete=models.CASCADE)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['trigram', 'file'], name='unique_code_trigram_file'),
+        ]
+        indexes = [
+            models.Index(fields=['file'], name='project_codetrigram_file_idx'),  # 파일 삭제/재색인
+        ]
+
+    def __str__(self):
+        return f"{self.trigram!r} -> {self.file_id}"
+
+
+class ScoreJob(models.Model):
+    """AI 채점 작업 큐 (score_worker 명령이 처리)"""
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    project = models.ForeignKey(Project, related_name='score_jobs', on_delete=models.CASCADE)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    attempts = models.PositiveIntegerField(default=0)  # 시도 횟수
+    run_after = models.DateTimeField(default=now)  # 이 시각 이후에 실행 (재시도 백오프)
+    locked_at = models.DateTimeField(null=True, blank=True)  # 워커가 작업을 가져간 시각
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='scorejob_status_run_after'),
+        ]
+
+    def __str__(self):
+        return f"ScoreJob {self.pk} for project {self.project_id} ({self.status})"
+
+
+class CodeBlob(models.Model):
+    """
+    blob 참조 수 (같은 ZIP을 올린 프로젝트 수)
+    업로드는 Project INSERT와 같은 트랜잭션에서 refs를 올리고, 삭제는 Project DELETE와 같은 트랜잭션에서 내립니다.
+    blob 파일 삭제는 이 행을 잠근 채로 하므로 같은 ZIP을 동시에 올리는 업로드와 겹치지 않습니다.
+    """
+    digest = models.CharField(max_length=64, primary_key=True)  # Project.code_digest
+    refs = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.digest} ({self.refs})"
+
+    @classmethod
+    def acquire(cls, digest):
+        """참조 수를 올립니다. (업로드 트랜잭션 안에서 호출, 커밋될 때까지 삭제와 겹치지 않도록 행을 잠금)"""
+        cls.objects.bulk_create([cls(digest=digest)], ignore_conflicts=True)  # 행이 없으면 생성 (동시 생성은 무시)
+        cls.objects.filter(digest=digest).update(refs=F('refs') + 1)
+
+    @classmethod
+    def release(cls, digest):
+        cls.objects.filter(digest=digest, refs__gt=0).update(refs=F('refs') - 1)
+
+
+def delete_code_if_orphaned(digest):
+    """같은 ZIP을 참조하는 프로젝트가 더 이상 없을 때만 blob을 삭제합니다."""
+    if not digest:
+        return
+    with transaction.atomic():
+        # 행을 먼저 잠그고(없으면 생성) 파일 삭제까지 마친 뒤 커밋
+        # 그 사이에 같은 ZIP을 올린 업로드는 acquire에서 기다렸다가 파일이 없으면 다시 저장함
+        CodeBlob.objects.bulk_create([CodeBlob(digest=digest)], ignore_conflicts=True)
+        blob = CodeBlob.objects.select_for_update().get(digest=digest)
+        if blob.refs <= 0 and not Project.objects.filter(code_digest=digest).exists():
+            blob.delete()
+            get_blob_store().delete(digest)
+
+
+@receiver(post_delete, sender=Project)
+def delete_orphan_code(sender, instance, **kwargs):
+    # 참조 수는 삭제와 같은 트랜잭션에서 내리고, 커밋된 뒤 다시 확인 (롤백되면 blob 유지)
+    digest = instance.code_digest
+    CodeBlob.release(digest)
+    transaction.on_commit(lambda: delete_code_if_orphaned(digest))
+
 
 class Comment(models.Model):
     project = models.ForeignKey(Project, related_name='comments', on_delete=models.CASCADE)  # Project와 연결
@@ -27,5 +202,10 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # 댓글 작성 시간
     updated_at = models.DateTimeField(auto_now=True)  # 댓글 수정 시간
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'created_at', 'id'], name='project_comment_project_idx'),  # 프로젝트별 댓글 목록
+        ]
+
     def __str__(self):
         return f"Comment on {self.project.team_name} by {self.author or 'Anonymous'}"
\ No newline at end of file
@@ -0,0 +1,56 @@
+import hashlib
+from contextlib import ExitStack
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .archive import is_text_member, read_member_text
+
+
+def preview_cache():
+    return caches[settings.PROJECT_PREVIEW_CACHE['ALIAS']]
+
+
+def member_cache_key(project, entry):
+    # ZIP digest가 키에 포함되므로 다시 업로드하면 자연스럽게 새 키를 사용
+    path_hash = hashlib.sha1(entry.path.encode()).hexdigest()
+    return f"preview:{project.pk}:{project.code_digest}:{path_hash}"
+
+
+def iter_code_preview(project, chunk_size=None):
+    """
+    code-preview 응답의 (경로, 내용)을 경로 순서로 하나씩 반환합니다.
+    chunk_size개씩 캐시에서 먼저 찾고, 없는 멤버만 ZIP에서 읽습니다. (ZIP은 필요할 때 한 번만 엶)
+    한 번에 chunk_size개 멤버의 내용만 메모리에 둡니다.
+    """
+    chunk_size = chunk_size or settings.STREAMING_JSON['CHUNK_SIZE']
+    entries = (entry for entry in project.files.order_by('path').iterator(chunk_size) if is_text_member(entry))
+    cache = preview_cache()
+    # 한 프로젝트가 캐시를 독점하지 않도록 프로젝트당 저장 용량 제한
+    budget = settings.PROJECT_PREVIEW_CACHE['PROJECT_MAX_BYTES']
+    with ExitStack() as stack:
+        fh = None
+        while chunk := list(islice(entries, chunk_size)):
+            keys = {entry.path: member_cache_key(project, entry) for entry in chunk}
+            cached = cache.get_many(keys.values())
+            budget -= sum(len(text) for text in cached.values())
+            to_cache = {}
+            for entry in chunk:
+                key = keys[entry.path]
+                if key in cached:
+                    yield entry.path, cached[key]
+                    continue
+                if fh is None:
+                    fh = stack.enter_context(project.open_code())
+                text = read_member_text(fh, entry)
+                if len(text) <= budget:
+                    to_cache[key] = text
+                    budget -= len(text)
+                yield entry.path, text
+            cache.set_many(to_cache)
+
+
+def render_code_preview(project):
+    """code-preview 응답({경로: 내용})을 한 번에 만듭니다."""
+    return dict(iter_code_preview(project))
@@ -0,0 +1,49 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from scb_be import versions
+
+from .models import Project, ScoreJob
+from .scoring_client import get_scoring_client
+
+
+def http_scorer(project, timeout):
+    """외부 AI 채점 서비스로 ZIP을 보내 점수를 받아옵니다."""
+    with project.open_code() as fh:
+        return get_scoring_client().score(fh, filename=f"{project.code_digest}.zip", timeout=timeout)
+
+
+def fake_scorer(project, timeout):
+    """테스트/로컬 개발용 채점기: ZIP digest로부터 0~100 사이의 고정 점수를 계산합니다."""
+    delay = getattr(settings, 'FAKE_SCORER_DELAY', 0)
+    if delay:
+        time.sleep(min(delay, timeout))
+    seed = int(hashlib.sha256(project.code_digest.encode()).hexdigest()[:8], 16)
+    return round(seed % 10001 / 100, 2)
+
+
+def get_scorer():
+    """settings.PROJECT_SCORER에 지정된 채점 함수를 반환합니다."""
+    return import_string(settings.PROJECT_SCORER)
+
+
+def enqueue_scoring(project):
+    """프로젝트 채점 작업을 큐에 등록합니다."""
+    return ScoreJob.objects.create(project=project)
+
+
+def save_project_score(project_id, score):
+    """채점 결과를 저장합니다. (순위표는 DB를 조회하므로 따로 갱신하지 않음)"""
+    Project.objects.filter(pk=project_id).update(
+        score=score, score_status=Project.SCORE_SCORED, updated_at=timezone.now()
+    )
+    versions.bump_on_commit(versions.model_name(Project))  # update()는 signal이 없으므로 직접
+
+
+def mark_scoring_failed(project_id):
+    Project.objects.filter(pk=project_id).update(score_status=Project.SCORE_FAILED, updated_at=timezone.now())
+    versions.bump_on_commit(versions.model_name(Project))
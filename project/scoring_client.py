@@ -0,0 +1,147 @@
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from scb_be import metrics
+
+
+class ScoringError(Exception):
+    """채점 서비스 호출 실패"""
+
+
+class CircuitOpenError(ScoringError):
+    """연속 실패로 회로가 열려 호출을 차단함"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold회 이상이면 reset_timeout초 동안 호출을 차단합니다.
+    차단 시간이 지나면 한 번의 시험 호출(half-open)을 허용하고, 성공하면 다시 닫힙니다.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Scoring service circuit is open.")
+                self.state = self.HALF_OPEN
+            elif self.state == self.HALF_OPEN:
+                # 시험 호출은 한 번만 허용
+                raise CircuitOpenError("Scoring service circuit is half-open.")
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                metrics.incr('scoring.circuit_opened')
+
+
+class ScoringClient:
+    """
+    외부 AI 채점 서비스 클라이언트
+    - requests.Session + HTTPAdapter로 keep-alive 연결을 재사용합니다.
+    - ZIP 파일은 HEX JSON이 아닌 원본 바이너리(application/zip)로 스트리밍 전송합니다.
+    """
+
+    def __init__(self, url, connect_timeout=3.05, read_timeout=30, pool_size=10,
+                 failure_threshold=5, reset_timeout=30):
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def score(self, fileobj, filename='code.zip', timeout=None):
+        """ZIP 파일 객체를 전송하고 점수를 반환합니다."""
+        self.breaker.before_call()
+        read_timeout = min(self.read_timeout, timeout) if timeout else self.read_timeout
+        started = time.monotonic()
+        try:
+            response = self.session.post(
+                self.url,
+                data=fileobj,  # 파일 객체를 그대로 넘겨 메모리에 올리지 않고 전송
+                headers={
+                    'Content-Type': 'application/zip',
+                    'Content-Disposition': f'attachment; filename="{filename}"',
+                },
+                timeout=(self.connect_timeout, read_timeout),
+            )
+            response.raise_for_status()
+            score = float(response.json().get("score", 0.0))
+        except (requests.RequestException, ValueError, TypeError, AttributeError) as exc:
+            # 연결 / HTTP 오류, JSON이 아니거나 {"score": null}, 객체가 아닌 응답 등
+            self.breaker.record_failure()
+            metrics.incr('scoring.failures')
+            raise ScoringError(str(exc)) from exc
+        except Exception:
+            self.breaker.record_failure()  # 예상하지 못한 오류도 half-open 상태로 남기지 않음
+            metrics.incr('scoring.failures')
+            raise
+        finally:
+            metrics.observe('scoring.latency', time.monotonic() - started)
+            self._record_pool_stats()
+
+        self.breaker.record_success()
+        metrics.incr('scoring.successes')
+        return score
+
+    def _record_pool_stats(self):
+        # urllib3 풀의 새 연결 수 / 전체 요청 수로 연결 재사용률을 기록
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        with pools.lock:
+            pool_list = list(pools._container.values())
+        connections = sum(pool.num_connections for pool in pool_list)
+        requests_sent = sum(pool.num_requests for pool in pool_list)
+        metrics.set_gauge('scoring.pool.connections_opened', connections)
+        metrics.set_gauge('scoring.pool.requests', requests_sent)
+        if requests_sent:
+            metrics.set_gauge('scoring.pool.reuse_ratio', 1 - connections / requests_sent)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_scoring_client():
+    """settings.SCORING_SERVICE 설정으로 만든 공유 클라이언트를 반환합니다."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            options = settings.SCORING_SERVICE
+            _client = ScoringClient(
+                options['URL'],
+                connect_timeout=options['CONNECT_TIMEOUT'],
+                read_timeout=options['READ_TIMEOUT'],
+                pool_size=options['POOL_SIZE'],
+                failure_threshold=options['FAILURE_THRESHOLD'],
+                reset_timeout=options['RESET_TIMEOUT'],
+            )
+        return _client
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive 연결 유지
+
+    def do_POST(self):
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in self._read_body():
+            hasher.update(chunk)
+            size += len(chunk)
+        self.server.requests.append({
+            'content_type': self.headers.get('Content-Type'),
+            'size': size,
+            'digest': hasher.hexdigest(),
+            'client_port': self.client_address[1],
+        })
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        status = self.server.status
+        body = json.dumps({"score": self.server.score}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                length = int(self.rfile.readline().strip() or b'0', 16)
+                if length == 0:
+                    self.rfile.readline()
+                    return
+                yield self.rfile.read(length)
+                self.rfile.readline()
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, 64 * 1024))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ScoringStubServer(ThreadingHTTPServer):
+    """
+    로컬 채점 서비스 스텁 (테스트/개발용)
+    받은 요청 정보는 requests 리스트에 쌓이며, score/status/delay로 응답을 조절합니다.
+
+    사용 예:
+        with ScoringStubServer(score=87.5) as stub:
+            ScoringClient(stub.url).score(fh)
+    """
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, score=50.0, status=200, delay=0, verbose=False):
+        super().__init__((host, port), _StubHandler)
+        self.score = score
+        self.status = status
+        self.delay = delay
+        self.verbose = verbose
+        self.requests = []
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/score"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
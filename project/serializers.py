@@ -1,10 +1,14 @@
+from django.db import transaction
 from rest_framework import serializers
-from .models import Project, Comment
+from scb_be.sparse import SparseFieldsMixin
+from .archive import ArchiveError, scan_archive
+from .models import CodeBlob, Project, ProjectFile, Comment, delete_code_if_orphaned
+from .storage import get_blob_store
 import base64
 
 
 # 댓글 데이터를 처리하는 Serializer
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ['id', 'text', 'author', 'created_at']  # 댓글 ID, 내용, 작성자, 생성 시간 포함
@@ -13,6 +17,21 @@ class CommentSerializer(serializers.ModelSerializer):
 
 
 
+# ZIP 파일 인덱스 조회 시 사용되는 Serializer
+class ProjectFileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProjectFile
+        fields = ['id', 'path', 'size', 'compressed_size', 'crc', 'encoding', 'language']
+
+
+# 점수 순위표 항목
+class LeaderboardEntrySerializer(serializers.Serializer):
+    rank = serializers.IntegerField()  # 동점이면 같은 순위
+    id = serializers.IntegerField()
+    team_name = serializers.CharField()
+    score = serializers.FloatField()
+
+
 # Project 생성 시 사용되는 Serializer
 class ProjectSerializer(serializers.ModelSerializer):
     code_file = serializers.FileField(write_only=True, required=True)  # ZIP 파일 업로드
@@ -20,14 +39,39 @@ class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = ['team_name', 'team_members', 'description', 'code_file']  # description과 code_file 포함
-        read_only_fields = ['score', 'code', 'top_level_directory', 'file_size']  # 읽기 전용 필드
+        read_only_fields = ['score', 'code_digest', 'top_level_directory', 'file_size']  # 읽기 전용 필드
+
+    def validate(self, attrs):
+        # 저장하기 전에 ZIP 파일을 검증하고 최상위 디렉토리/파일 인덱스를 한 번에 계산
+        try:
+            attrs['top_level_directory'], attrs['file_index'] = scan_archive(attrs['code_file'])
+        except ArchiveError as exc:
+            raise serializers.ValidationError({'code_file': str(exc)})
+        return attrs
 
     def create(self, validated_data):
-        # 업로드된 ZIP 파일 데이터를 code 필드에 저장
+        # 업로드된 ZIP 파일을 청크 단위로 blob 저장소에 기록하고 digest만 DB에 저장
         code_file = validated_data.pop('code_file')
-        validated_data['code'] = code_file.read()  # BinaryField에 ZIP 데이터 저장
-        validated_data['score'] = 0  # 기본 점수 설정
-        return super().create(validated_data)
+        file_index = validated_data.pop('file_index')
+        digest = None
+        try:
+            with transaction.atomic():
+                store = get_blob_store()
+                digest, size = store.save(code_file)
+                CodeBlob.acquire(digest)
+                if not store.exists(digest):  # acquire 전에 다른 요청이 같은 blob을 지웠으면 다시 저장
+                    code_file.seek(0)
+                    store.save(code_file)
+                validated_data['code_digest'] = digest
+                validated_data['file_size'] = size
+                validated_data['files_indexed'] = True
+                validated_data['score'] = 0  # 기본 점수 설정
+                project = super().create(validated_data)  # Project INSERT 한 번
+                project.save_file_index(file_index)
+        except Exception:
+            delete_code_if_orphaned(digest)  # INSERT가 실패하면 방금 저장한 blob 정리
+            raise
+        return project
 
 
 # Project 수정 시 사용되는 Serializer
@@ -38,10 +82,10 @@ class ProjectUpdateSerializer(serializers.ModelSerializer):
 
 
 # Project 목록 조회 시 사용되는 Serializer
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
-        fields = ['id', 'team_name', 'team_members', 'score']  
+        fields = ['id', 'team_name', 'team_members', 'score', 'score_status', 'comment_count', 'last_activity_at']
 
 
 # Project 상세 조회 시 사용되는 Serializer
@@ -57,12 +101,18 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             'team_members',
             'description',
             'score',
+            'score_status',
             'file_size',
             'top_level_directory',
             'zip_file',
+            'comment_count',
+            'last_activity_at',
             'comments',
         ]
-        read_only_fields = ['score', 'file_size', 'top_level_directory', 'comments']
+        read_only_fields = [
+            'score', 'score_status', 'file_size', 'top_level_directory',
+            'comment_count', 'last_activity_at', 'comments',
+        ]
 
 '''
     def get_code(self, obj):
@@ -0,0 +1,167 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+CHUNK_SIZE = 64 * 1024  # 스트리밍 읽기/쓰기 단위 (64KB)
+
+
+class BlobStore:
+    """
+    ZIP 데이터를 SHA-256 다이제스트로 저장/조회하는 저장소 인터페이스
+    """
+
+    def save(self, fileobj):
+        """파일 객체를 저장하고 (digest, size)를 반환합니다."""
+        raise NotImplementedError
+
+    def open(self, digest):
+        """digest에 해당하는 읽기 전용 파일 객체를 반환합니다."""
+        raise NotImplementedError
+
+    def exists(self, digest):
+        raise NotImplementedError
+
+    def delete(self, digest):
+        raise NotImplementedError
+
+    def read(self, digest):
+        """blob 전체를 bytes로 반환합니다. (작은 파일에만 사용)"""
+        with self.open(digest) as fh:
+            return fh.read()
+
+
+class LocalBlobStore(BlobStore):
+    """
+    로컬 파일 시스템 저장소
+    <root>/ab/cd/abcd... 형태로 저장하며, 같은 내용은 한 번만 저장됩니다.
+    """
+
+    def __init__(self, root=None):
+        self.root = str(root or settings.PROJECT_BLOB_ROOT)
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def save(self, fileobj):
+        os.makedirs(self.root, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+
+        # 임시 파일에 청크 단위로 기록하면서 해시 계산
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in _iter_chunks(fileobj):
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+
+            digest = hasher.hexdigest()
+            final_path = self.path(digest)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)  # 동일한 내용이 이미 있으면 중복 저장하지 않음
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest, size
+
+    def open(self, digest):
+        return open(self.path(digest), 'rb')
+
+    def exists(self, digest):
+        return os.path.exists(self.path(digest))
+
+    def delete(self, digest):
+        try:
+            os.remove(self.path(digest))
+        except FileNotFoundError:
+            pass
+
+
+class ObjectBlobStore(BlobStore):
+    """
+    오브젝트 스토리지(S3 등)용 자리 표시 클래스
+    client는 put_object / get_object / head_object / delete_object 를 제공해야 합니다.
+    """
+
+    def __init__(self, client=None, bucket=None, prefix='projects/'):
+        self.client = client
+        self.bucket = bucket or getattr(settings, 'PROJECT_BLOB_BUCKET', None)
+        self.prefix = prefix
+
+    def key(self, digest):
+        return f"{self.prefix}{digest}"
+
+    def _require_client(self):
+        if self.client is None:
+            raise NotImplementedError("ObjectBlobStore requires a storage client.")
+        return self.client
+
+    def save(self, fileobj):
+        client = self._require_client()
+        # 업로드 전에 digest를 알아야 하므로 임시 파일에 스풀링
+        hasher = hashlib.sha256()
+        size = 0
+        with tempfile.TemporaryFile() as tmp:
+            for chunk in _iter_chunks(fileobj):
+                hasher.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+            digest = hasher.hexdigest()
+            if not self.exists(digest):
+                tmp.seek(0)
+                client.put_object(Bucket=self.bucket, Key=self.key(digest), Body=tmp)
+        return digest, size
+
+    def open(self, digest):
+        client = self._require_client()
+        body = client.get_object(Bucket=self.bucket, Key=self.key(digest))['Body']
+        # zipfile은 seek 가능한 파일이 필요하므로 임시 파일로 내려받음
+        tmp = tempfile.TemporaryFile()
+        shutil.copyfileobj(body, tmp, CHUNK_SIZE)
+        tmp.seek(0)
+        return tmp
+
+    def exists(self, digest):
+        client = self._require_client()
+        try:
+            client.head_object(Bucket=self.bucket, Key=self.key(digest))
+            return True
+        except Exception:
+            return False
+
+    def delete(self, digest):
+        self._require_client().delete_object(Bucket=self.bucket, Key=self.key(digest))
+
+
+def _iter_chunks(fileobj):
+    """Django UploadedFile이면 chunks()를, 일반 파일이면 read()를 사용합니다."""
+    if hasattr(fileobj, 'chunks'):
+        yield from fileobj.chunks(CHUNK_SIZE)
+        return
+    while True:
+        chunk = fileobj.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+_blob_store = None
+
+
+def get_blob_store():
+    """settings.PROJECT_BLOB_STORE에 지정된 저장소 인스턴스를 반환합니다."""
+    global _blob_store
+    if _blob_store is None:
+        backend = getattr(settings, 'PROJECT_BLOB_STORE', 'project.storage.LocalBlobStore')
+        _blob_store = import_string(backend)()
+    return _blob_store
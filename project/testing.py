@@ -0,0 +1,31 @@
+import re
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@contextmanager
+def assert_columns_not_selected(table='project_project', columns=('code_digest',), using=connection):
+    """
+    블록 안에서 실행된 SELECT 문이 지정한 컬럼을 읽으면 AssertionError를 발생시킵니다.
+
+    사용 예:
+        with assert_columns_not_selected():
+            client.get('/api/projects/')
+    """
+    patterns = [
+        re.compile(rf'"{re.escape(table)}"\."{re.escape(column)}"') for column in columns
+    ]
+    with CaptureQueriesContext(using) as ctx:
+        yield ctx
+
+    for query in ctx.captured_queries:
+        sql = query['sql']
+        if not sql.lstrip().upper().startswith('SELECT'):
+            continue
+        # WHERE 절 이후는 조건이므로 SELECT 목록만 검사
+        select_list = re.split(r'\bFROM\b', sql, maxsplit=1, flags=re.IGNORECASE)[0]
+        for column, pattern in zip(columns, patterns):
+            if pattern.search(select_list):
+                raise AssertionError(f"Query selected {table}.{column}: {sql}")
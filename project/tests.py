@@ -1,3 +1,394 @@
-from django.test import TestCase
+import io
+import os
+import random
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Future
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from board.models import Board
+
+from . import codesearch, storage
+from .leaderboard import Leaderboard
+from .models import CodeBlob, Project, ScoreJob, delete_code_if_orphaned
+from .scoring import fake_scorer, mark_scoring_failed, save_project_score
+from .scoring_client import CircuitBreaker, ScoringClient, ScoringError
+from .testing import assert_columns_not_selected
+from .worker import ScoreWorker
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    buffer.seek(0)
+    buffer.name = 'code.zip'
+    return buffer
+
+
+SAMPLE_FILES = {'app/main.py': 'print("hello")\n', 'app/README.md': '# app\n'}
+
+
+class InlineExecutor:
+    """백그라운드 스레드 대신 바로 실행 (TestCase 트랜잭션 안의 sqlite는 다른 스레드에서 쓸 수 없음)"""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class ProjectTestCase(TestCase):
+    """blob 저장소를 임시 디렉터리로 바꾸고 캐시를 비운 상태에서 시작합니다. (업로드 후 코드 색인은 바로 실행)"""
+
+    def setUp(self):
+        self.blob_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.blob_root, ignore_errors=True)
+        blob_settings = override_settings(PROJECT_BLOB_ROOT=self.blob_root)
+        blob_settings.enable()
+        self.addCleanup(blob_settings.disable)
+        storage._blob_store = None
+        self.addCleanup(setattr, storage, '_blob_store', None)
+        for cache in caches.all():
+            cache.clear()
+        index_executor = mock.patch.object(codesearch, '_get_executor', return_value=InlineExecutor())
+        self.index_executor = index_executor.start()
+        self.addCleanup(index_executor.stop)
+
+        self.user = User.objects.create(username='20201234')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + Token.objects.create(user=self.user).key)
+
+    def upload(self, files=SAMPLE_FILES, team_name='team'):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/projects/', {'team_name': team_name, 'team_members': 'a', 'code_file': make_zip(files)},
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, 201, response.content)
+        return Project.objects.latest('id')
+
+    def blob_files(self):
+        return [name for _, _, names in os.walk(self.blob_root) for name in names]
+
+
+class BlobLifecycleTests(ProjectTestCase):
+    def test_blob_deleted_only_after_commit(self):
+        project = self.upload()
+        store = storage.get_blob_store()
+        with self.captureOnCommitCallbacks() as callbacks:
+            project.delete()
+        self.assertTrue(store.exists(project.code_digest))
+        for callback in callbacks:
+            callback()
+        self.assertFalse(store.exists(project.code_digest))
+
+    def test_rolled_back_delete_keeps_blob(self):
+        project = self.upload()
+        project_id = project.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(DatabaseError):
+                with transaction.atomic():
+                    project.delete()
+                    raise DatabaseError('rollback')
+        self.assertTrue(Project.objects.filter(pk=project_id).exists())
+        self.assertTrue(storage.get_blob_store().exists(project.code_digest))
+
+    def test_shared_blob_kept_while_referenced(self):
+        first = self.upload()
+        second = self.upload(team_name='other')
+        self.assertEqual(first.code_digest, second.code_digest)
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(storage.get_blob_store().exists(second.code_digest))
+
+    def test_refs_follow_projects(self):
+        first = self.upload()
+        second = self.upload(team_name='other')
+        self.assertEqual(CodeBlob.objects.get(digest=first.code_digest).refs, 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(CodeBlob.objects.get(digest=first.code_digest).refs, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(CodeBlob.objects.exists())
+        self.assertEqual(self.blob_files(), [])
+
+    def test_cleanup_between_save_and_acquire_does_not_lose_blob(self):
+        old = self.upload()
+        digest = old.code_digest
+        save = storage.LocalBlobStore.save
+
+        def save_then_delete_old(store, fileobj):
+            result = save(store, fileobj)  # 이미 있는 blob이라 새로 쓰지 않음
+            if Project.objects.filter(pk=old.pk).exists():
+                # 다른 요청이 마지막 참조 프로젝트를 지우고 정리까지 마침 (이 업로드의 acquire 전)
+                old.delete()
+                delete_code_if_orphaned(digest)
+                self.assertFalse(store.exists(digest))
+            return result
+
+        with mock.patch.object(storage.LocalBlobStore, 'save', autospec=True, side_effect=save_then_delete_old):
+            new = self.upload(team_name='new')
+        self.assertEqual(new.code_digest, digest)
+        self.assertTrue(storage.get_blob_store().exists(digest))
+        self.assertEqual(CodeBlob.objects.get(digest=digest).refs, 1)
+        self.assertEqual(self.client.get(f'/api/projects/{new.pk}/code-preview/').status_code, 200)
+
+    def test_failed_insert_removes_new_blob(self):
+        with mock.patch.object(Project, 'save_file_index', side_effect=DatabaseError('insert failed')):
+            with self.assertRaises(DatabaseError):
+                self.upload()
+        self.assertFalse(Project.objects.exists())
+        self.assertEqual(self.blob_files(), [])
+
+
+class ColumnProjectionTests(ProjectTestCase):
+    def test_list_and_detail_do_not_select_code_columns(self):
+        project = self.upload()
+        for url in ('/api/projects/', '/api/projects/?fields=id,team_name', f'/api/projects/{project.pk}/'):
+            with self.subTest(url=url), assert_columns_not_selected(columns=('code_digest', 'code_indexed')) as ctx:
+                self.assertEqual(self.client.get(url).status_code, 200)
+            self.assertTrue(any('"project_project"' in query['sql'] for query in ctx.captured_queries))
+
+
+class ScoreWorkerTests(ProjectTestCase):
+    def test_timed_out_job_counts_against_concurrency_until_it_finishes(self):
+        first, second = self.upload(), self.upload(team_name='other')
+        release = threading.Event()
+        lock = threading.Lock()
+        active, peak, started = [0], [0], []
+
+        def scorer(project, timeout):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                started.append(project.pk)
+            try:
+                if project.pk == first.pk and len(started) == 1:
+                    release.wait(5)  # 제한 시간보다 오래 걸리는 첫 시도
+                return fake_scorer(project, timeout)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        worker = ScoreWorker(concurrency=1, timeout=0.2, backoff=0, poll_interval=0.05, scorer=scorer)
+        threading.Timer(0.6, release.set).start()
+        with self.captureOnCommitCallbacks(execute=True):
+            worker.run(once=True)
+
+        self.assertEqual(peak[0], 1)
+        self.assertEqual(started[:2], [first.pk, second.pk])  # 첫 작업 스레드가 끝난 뒤에야 다음 작업 시작
+        self.assertEqual(
+            set(Project.objects.values_list('score_status', flat=True)), {Project.SCORE_SCORED}
+        )
+        timed_out = ScoreJob.objects.get(project=first)
+        self.assertEqual((timed_out.status, timed_out.attempts), (ScoreJob.STATUS_DONE, 2))
+
+
+class ScoringClientTests(TestCase):
+    def make_client(self, *bodies):
+        client = ScoringClient('http://scoring.invalid/', failure_threshold=1, reset_timeout=0)
+        responses = []
+        for body in bodies:
+            response = mock.Mock()
+            response.json.return_value = body
+            responses.append(response)
+        client.session.post = mock.Mock(side_effect=responses)
+        client._record_pool_stats = mock.Mock()
+        return client
+
+    def test_malformed_responses_reopen_half_open_circuit(self):
+        for body in ({'score': None}, [1, 2], 'text'):
+            with self.subTest(body=body):
+                client = self.make_client({'score': 'oops'}, body, {'score': 42})
+                with self.assertRaises(ScoringError):
+                    client.score(io.BytesIO(b'zip'))
+                self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+                with self.assertRaises(ScoringError):
+                    client.score(io.BytesIO(b'zip'))  # half-open 시험 호출 실패
+                self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+                self.assertEqual(client.score(io.BytesIO(b'zip')), 42.0)
+                self.assertEqual(client.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_unexpected_error_reopens_half_open_circuit(self):
+        client = self.make_client({'score': 1})
+        client.breaker.record_failure()
+        client.session.post.side_effect = RuntimeError('boom')
+        with self.assertRaises(RuntimeError):
+            client.score(io.BytesIO(b'zip'))
+        self.assertEqual(client.breaker.state, CircuitBreaker.OPEN)
+
+
+class ConditionalListTests(ProjectTestCase):
+    def test_write_from_worker_path_changes_list_etag(self):
+        project = self.upload()
+        etag = self.client.get('/api/projects/')['ETag']
+        self.assertEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # score_worker가 쓰는 경로 (update()라 signal 없음), 프로세스 메모리(캐시)는 공유하지 않는다고 가정
+        with self.captureOnCommitCallbacks(execute=True):
+            save_project_score(project.pk, 77.0)
+        for cache in caches.all():
+            cache.clear()
+
+        response = self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['results'][0]['score_status'], Project.SCORE_SCORED)
+        self.assertEqual(response.data['results'][0]['score'], 77.0)
+
+    def test_cached_body_not_reused_after_write(self):
+        project = self.upload()
+        self.assertEqual(self.client.get('/api/projects/').data['results'][0]['score_status'], Project.SCORE_PENDING)
+        with self.captureOnCommitCallbacks(execute=True):
+            save_project_score(project.pk, 12.5)
+        self.assertEqual(self.client.get('/api/projects/').data['results'][0]['score'], 12.5)
+
+    def test_host_and_scheme_get_their_own_etag_and_links(self):
+        self.upload()
+        self.upload(team_name='other')
+        responses = {
+            (secure, host): self.client.get('/api/projects/?page_size=1', HTTP_HOST=host, secure=secure)
+            for secure in (False, True) for host in ('localhost', '127.0.0.1')
+        }
+        self.assertEqual(len({response['ETag'] for response in responses.values()}), 4)
+        for (secure, host), response in responses.items():
+            self.assertTrue(response.data['next'].startswith(f"{'https' if secure else 'http'}://{host}/"))
+
+        etag = responses[False, 'localhost']['ETag']
+        response = self.client.get('/api/projects/?page_size=1', HTTP_HOST='127.0.0.1', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class LeaderboardTests(ProjectTestCase):
+    def make_projects(self, scores):
+        return Project.objects.bulk_create([
+            Project(team_name=f't{i}', team_members='m', code_digest='0' * 64, created_by=self.user,
+                    score=score, score_status=Project.SCORE_SCORED)
+            for i, score in enumerate(scores)
+        ])
+
+    def expected_ranks(self):
+        rows = list(Project.objects.filter(score_status=Project.SCORE_SCORED).values_list('id', 'score'))
+        return {pk: 1 + sum(1 for _, other in rows if other > score) for pk, score in rows}
+
+    def test_matches_brute_force_after_random_updates(self):
+        rng = random.Random(7)
+        projects = self.make_projects([rng.choice(range(0, 100, 5)) for _ in range(200)])  # 동점 많음
+        for _ in range(300):
+            project = rng.choice(projects)
+            with self.captureOnCommitCallbacks(execute=True):
+                if rng.random() < 0.1:
+                    mark_scoring_failed(project.pk)
+                else:
+                    save_project_score(project.pk, rng.choice(range(0, 100, 5)))
+
+        expected = self.expected_ranks()
+        board = Leaderboard()
+        self.assertEqual(len(board), len(expected))
+        self.assertEqual({pk: board.rank(pk)['rank'] for pk in expected}, expected)
+        top = board.top(20)
+        self.assertEqual([entry['rank'] for entry in top], sorted(expected[entry['id']] for entry in top))
+
+        order = [entry['id'] for entry in board.top(len(expected))]
+        for pk in rng.sample(order, 20):
+            index = order.index(pk)
+            window = order[max(index - 3, 0):index + 4]
+            around = board.around(pk, 3)
+            self.assertEqual([entry['id'] for entry in around], window)
+            self.assertEqual([entry['rank'] for entry in around], [expected[other] for other in window])
+
+    def test_score_written_elsewhere_is_seen(self):
+        first, second = self.make_projects([10.0, 20.0])
+        web = Leaderboard()  # 웹 서버 프로세스의 순위표
+        self.assertEqual(web.rank(first.pk)['rank'], 2)
+
+        # score_worker 프로세스가 DB에 직접 쓴 점수 (웹 프로세스 쪽 호출 없음)
+        Project.objects.filter(pk=first.pk).update(score=30.0)
+        self.assertEqual(web.rank(first.pk)['rank'], 1)
+        self.assertEqual([entry['id'] for entry in web.top(2)], [first.pk, second.pk])
+
+        Project.objects.filter(pk=second.pk).update(score_status=Project.SCORE_FAILED)
+        self.assertIsNone(web.rank(second.pk))
+        self.assertEqual(len(web), 1)
+
+    def test_rank_does_not_load_whole_table(self):
+        projects = self.make_projects([float(score) for score in range(50)])
+        board = Leaderboard()
+        with self.assertNumQueries(1):
+            self.assertEqual([entry['rank'] for entry in board.top(3)], [1, 2, 3])
+        with self.assertNumQueries(2):
+            self.assertEqual(board.rank(projects[0].pk)['rank'], 50)
+        with self.assertNumQueries(7) as ctx:  # 점수, 위/아래 각각 (같은 점수, 다른 점수), COUNT 두 번
+            self.assertEqual([entry['rank'] for entry in board.around(projects[10].pk, 2)], [38, 39, 40, 41, 42])
+        self.assertFalse(any(' OR ' in query['sql'] for query in ctx.captured_queries))  # 인덱스를 처음부터 훑지 않음
+
+
+class CodeSearchIndexTests(ProjectTestCase):
+
+    def brute_force(self, query, case_sensitive):
+        """색인 없이 모든 프로젝트의 텍스트 파일을 읽어 찾은 (프로젝트, 경로, 줄 번호) 목록"""
+        found = []
+        for project in Project.objects.order_by('pk'):
+            entries = codesearch.searchable_entries(project)
+            texts = codesearch._read_texts(project, entries)
+            for entry in entries:
+                for line_number, *_ in codesearch.find_lines(texts[entry.pk], query, 0, case_sensitive):
+                    found.append((project.pk, entry.path, line_number))
+        return found
+
+    def test_upload_is_searchable_and_matches_brute_force(self):
+        rng = random.Random(3)
+        words = ['alpha', 'Beta', 'gamma_delta', 'def run():', 'return None', '한글 검색', 'x = 1']
+        for team in range(6):
+            files = {
+                f'app/m{i}.py': '\n'.join(' '.join(rng.sample(words, 3)) for _ in range(rng.randint(1, 8)))
+                for i in range(rng.randint(1, 4))
+            }
+            files['app/data.bin'] = 'alpha beta'  # 텍스트 파일이 아니면 검색하지 않음
+            self.upload(files, team_name=f'team{team}')
+        self.assertTrue(self.index_executor.called)
+        self.assertFalse(Project.objects.filter(code_indexed=False).exists())
+
+        for query in ('alpha', 'beta', 'Beta', 'mma_de', 'def run', '한글 검', 'None\n'.strip(), 'zzz'):
+            for case_sensitive in (False, True):
+                with self.subTest(query=query, case_sensitive=case_sensitive):
+                    results, truncated = codesearch.search_code(query, context=0, case_sensitive=case_sensitive)
+                    self.assertFalse(truncated)
+                    self.assertEqual(
+                        [(row['project'], row['path'], row['line']) for row in results],
+                        self.brute_force(query, case_sensitive),
+                    )
+
+    def test_search_endpoint_finds_new_upload(self):
+        project = self.upload({'src/main.py': 'print("needle")\n'})
+        response = self.client.get('/api/projects/code-search/', {'q': 'needle'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(row['project'], row['path']) for row in response.data['results']], [(project.pk, 'src/main.py')])
+
+
+class ExplainEndpointsTests(ProjectTestCase):
+    def test_explains_queries_of_real_requests(self):
+        for team in range(3):
+            self.upload(team_name=f'team{team}')
+        Board.objects.create(school_id='20201234', title='title', content='content', created_by=self.user)
+        output = io.StringIO()
+        call_command('explain_endpoints', '--fail-on-scan', '--user', self.user.username, stdout=output)
+        lines = [line for line in output.getvalue().splitlines() if line.startswith(('OK', 'FULL SCAN'))]
+        self.assertIn('OK GET /api/projects/?page_size=2 (200)', lines)
+        self.assertIn('OK GET /api/projects/?page_size=2&sort=discussed next page (200)', lines)  # 커서 조건 쿼리
+        self.assertTrue(all(line.endswith('(200)') for line in lines), lines)
+        self.assertIn('"project_project"."comment_count" <', output.getvalue())
@@ -1,25 +1,128 @@
 import zipfile
-import requests
-import io
+from itertools import chain
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from rest_framework.decorators import action 
 from rest_framework.response import Response
 from rest_framework import viewsets, status
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from .models import Project, Comment
+from scb_be import versions
+from scb_be.conditional import ConditionalGetMixin
+from scb_be.pagination import CommentPagination, CursorPagination, ProjectPagination
+from scb_be.renderers import StreamingJSONResponse, iter_json_object
+from scb_be.sparse import SPARSE_PARAMETERS, SparseQuerysetMixin, serializer_projection
+from scb_be.values import STREAM_PARAMETERS, ValuesListMixin
+from .archive import ArchiveError, open_member
+from .models import Project, ProjectFile, Comment, delete_code_if_orphaned
 from .serializers import (
+    LeaderboardEntrySerializer,
+    ProjectFileSerializer,
     ProjectSerializer,
     ProjectListSerializer,
     ProjectDetailSerializer,
     ProjectUpdateSerializer,
     CommentSerializer
 )
+from .codesearch import MIN_QUERY_LENGTH, schedule_code_index, search_code
+from .leaderboard import get_leaderboard
+from .preview import iter_code_preview, render_code_preview
+from .scoring import enqueue_scoring
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+def int_query_param(request, name, default, minimum, maximum):
+    """정수 쿼리 파라미터를 [minimum, maximum] 범위로 잘라 반환합니다. (잘못된 값이면 default)"""
+    try:
+        value = int(request.query_params.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return min(max(value, minimum), maximum)
+
+
+def with_team_names(entries):
+    """순위표 항목에 팀 이름을 채웁니다. (id, team_name 컬럼만 한 번에 조회)"""
+    names = dict(Project.objects.filter(pk__in=[entry['id'] for entry in entries]).values_list('id', 'team_name'))
+    for entry in entries:
+        entry['team_name'] = names.get(entry['id'], '')
+    return entries
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def parse_range_header(header, size):
+    """
+    'bytes=start-end' 형식의 단일 Range 헤더를 해석합니다.
+    헤더가 없거나 지원하지 않는 형식이면 None, 범위가 잘못되었으면 False를 반환합니다.
+    """
+    if not header or not header.startswith('bytes=') or ',' in header:
+        return None
+    start_text, _, end_text = header[len('bytes='):].strip().partition('-')
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            start = max(size - int(end_text), 0)  # bytes=-N : 마지막 N바이트
+            end = size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        return False
+    return start, min(end, size - 1)
+
+
+def stream_member(project, entry, start, end):
+    """ZIP 멤버의 start~end 바이트를 청크 단위로 내보냅니다."""
+    with project.open_code() as fh, open_member(fh, entry) as member:
+        if start:
+            member.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = member.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class ProjectFilePagination(CursorPagination):
+    """ZIP 파일 인덱스 목록 페이지네이션 (경로 순)"""
+    ordering = 'path'
+    page_size = 100
+    max_page_size = 500
+
+
+class ProjectViewSet(SparseQuerysetMixin, ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
     http_method_names = ['get', 'post', 'patch', 'delete']
+    pagination_class = ProjectPagination
+    # 조건부 요청 (ETag / Last-Modified)
+    etag_fields = ('id', 'updated_at', 'score', 'score_status', 'comment_count', 'last_activity_at')
+    last_modified_fields = ('updated_at', 'last_activity_at')
+    list_version_names = ('project.Project', 'project.Comment')  # 목록에 댓글 수가 포함됨
+
+    # Serializer를 쓰지 않는 action에서 필요한 컬럼
+    action_only_fields = {
+        'list_comments': ('id',),
+        'add_comment': ('id',),
+        'delete_comment': ('id',),
+        'code_preview': ('id', 'code_digest', 'files_indexed'),
+        'list_files': ('id', 'code_digest', 'files_indexed'),
+        'file_content': ('id', 'code_digest'),
+    }
+
+    def get_queryset(self):
+        """action별로 필요한 컬럼만 조회하는 queryset 반환"""
+        queryset = super().get_queryset()
+        if self.action in self.action_only_fields:
+            return queryset.only(*self.action_only_fields[self.action])
+        if self.action == 'retrieve':  # list는 SparseQuerysetMixin이 ?fields=에 맞춰 처리
+            only_fields, related_fields, prefetch_fields = serializer_projection(self.get_serializer_class())
+            return queryset.only(*only_fields).select_related(*related_fields).prefetch_related(*prefetch_fields)
+        return queryset
 
     def get_serializer_class(self):
         """Serializer 반환"""
@@ -33,6 +136,17 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     @swagger_auto_schema(
         operation_description="프로젝트 목록을 조회하는 API",
+        manual_parameters=[
+            openapi.Parameter(
+                'sort',
+                openapi.IN_QUERY,
+                description="정렬 (discussed: 댓글 많은 순, active: 최근 활동 순, 기본: 최신 순)",
+                type=openapi.TYPE_STRING,
+                enum=list(ProjectPagination.sort_orderings),
+            ),
+            *SPARSE_PARAMETERS,
+            *STREAM_PARAMETERS,
+        ],
         responses={
             200: openapi.Response(
                 description="프로젝트 목록 반환 성공",
@@ -61,40 +175,16 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """새로운 프로젝트를 생성합니다."""
-        project = serializer.save()
-
-        # ZIP 파일 처리 및 최상위 디렉토리 추출
         try:
-            zip_data = io.BytesIO(project.code)  # BinaryField에서 ZIP 파일 데이터 가져오기
-            with zipfile.ZipFile(zip_data, 'r') as zf:
-                # 최상위 디렉토리 이름 추출
-                top_level_dir = zf.namelist()[0].split('/')[0] if zf.namelist() else "Unknown"
-                project.file_size = len(project.code)  # 파일 크기 (바이트 단위)
-                project.top_level_directory = top_level_dir  # 최상위 디렉토리 이름 저장
-                project.save()
-        except zipfile.BadZipFile:
-            project.delete()  # 잘못된 ZIP 파일 업로드 시 삭제
-            raise ValueError("Invalid ZIP file uploaded.")
-
-        # AI 모델에 점수 업데이트 요청
-        self._update_project_score(project)
-
-    def _update_project_score(self, project):
-        """AI 모델로 점수 계산 및 업데이트"""
-        try:
-            file_data = project.code.hex()  # BinaryField 데이터를 HEX로 변환
-            payload = {"code": file_data}
-            headers = {'Content-Type': 'application/json'}
-            response = requests.post(
-                "https://sozerong.pythonanywhere.com/random",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            project.score = response.json().get("score", 0.0)
-        except requests.RequestException:
-            project.score = 0.0
-        project.save()
+            with transaction.atomic():
+                project = serializer.save(created_by=self.request.user)
+                # AI 채점은 score_worker가 비동기로 처리
+                enqueue_scoring(project)
+                schedule_code_index(project.pk)  # 코드 검색 색인은 커밋 후 백그라운드에서
+        except Exception:
+            if serializer.instance is not None:  # 프로젝트 저장 후 실패하면 blob 정리
+                delete_code_if_orphaned(serializer.instance.code_digest)
+            raise
 
     @swagger_auto_schema(
         operation_description="특정 프로젝트를 조회하는 API.",
@@ -153,6 +243,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     @swagger_auto_schema(
         operation_description="특정 프로젝트의 댓글 목록을 조회하는 API",
+        manual_parameters=SPARSE_PARAMETERS,
         responses={
             200: openapi.Response(
                 description="댓글 목록 반환 성공",
@@ -161,17 +252,25 @@ class ProjectViewSet(viewsets.ModelViewSet):
             404: "프로젝트를 찾을 수 없음",
         },
     )
-    @action(detail=True, methods=['get'], url_path='comments')
+    @action(detail=True, methods=['get'], url_path='comments', pagination_class=CommentPagination)
     def list_comments(self, request, pk=None):
-        """특정 프로젝트 댓글 목록을 조회합니다."""
+        """특정 프로젝트 댓글 목록을 페이지 단위로 조회합니다."""
+        if not str(pk).isdigit():
+            return Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
+        # 프로젝트별 댓글 버전으로 조건부 요청 처리
+        etag = self.collection_etag(request, [versions.parent_name(Comment, 'project', pk)])
+        return self.conditional_response(request, etag, lambda: self._comment_page(pk))
+
+    def _comment_page(self, pk):
         try:
-            project = Project.objects.get(pk=pk)
+            project = self.get_queryset().get(pk=pk)
         except Project.DoesNotExist:
             return Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        comments = project.comments.all()
-        serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        comments = self.sparse_queryset(Comment.objects.filter(project_id=project.pk), CommentSerializer)  # 요청한 필드만 조회
+        page = self.paginate_queryset(comments)
+        serializer = CommentSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
 
     @swagger_auto_schema(
         request_body=CommentSerializer,
@@ -184,17 +283,19 @@ class ProjectViewSet(viewsets.ModelViewSet):
             400: "유효하지 않은 요청 데이터",
         },
     )
-    @action(detail=True, methods=['post'], url_path='comments')
+    @list_comments.mapping.post
     def add_comment(self, request, pk=None):
         """특정 프로젝트에 댓글을 추가합니다."""
         try:
-            project = Project.objects.get(pk=pk)
+            project = self.get_queryset().get(pk=pk)
         except Project.DoesNotExist:
             return Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = CommentSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(project=project)
+            with transaction.atomic():
+                serializer.save(project=project)
+                Project.record_comment_added(project.pk)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -219,7 +320,9 @@ class ProjectViewSet(viewsets.ModelViewSet):
         try:
             project = self.get_object()
             comment = project.comments.get(id=comment_id)
-            comment.delete()
+            with transaction.atomic():
+                comment.delete()
+                Project.record_comment_deleted(project.pk)
             return Response({"message": "Comment deleted successfully."}, status=status.HTTP_204_NO_CONTENT)
         except Comment.DoesNotExist:
             return Response({"error": "Comment not found."}, status=status.HTTP_404_NOT_FOUND)
@@ -241,19 +344,191 @@ class ProjectViewSet(viewsets.ModelViewSet):
     def code_preview(self, request, pk=None):
         """ZIP 파일에서 텍스트 파일을 미리 봅니다."""
         try:
-            project = Project.objects.get(pk=pk)
+            project = self.get_queryset().get(pk=pk)
+            project.ensure_file_index()
+            if request.accepted_renderer.format != 'json':  # Browsable API
+                return Response(render_code_preview(project), status=status.HTTP_200_OK)
+            # 파일 하나씩 인코딩해 스트리밍 (첫 파일은 미리 읽어 ZIP 오류를 응답 전에 확인)
+            preview = iter_code_preview(project)
+            first = next(preview, None)
 
-            zip_data = io.BytesIO(project.code)
-            code_contents = {}
-            with zipfile.ZipFile(zip_data, 'r') as zf:
-                for file_name in zf.namelist():
-                    if file_name.endswith(('.py', '.java', '.js', '.html', '.txt')):
-                        with zf.open(file_name) as file:
-                            code_contents[file_name] = file.read().decode('utf-8')
+        except Project.DoesNotExist:
+            return Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
+        except (zipfile.BadZipFile, ArchiveError):
+            return Response({"error": "Invalid ZIP file format."}, status=status.HTTP_400_BAD_REQUEST)
+        return StreamingJSONResponse(iter_json_object(chain([first] if first else [], preview)))
 
-            return Response(code_contents, status=status.HTTP_200_OK)
+    @swagger_auto_schema(
+        operation_description="점수 상위 프로젝트 순위표를 조회하는 API",
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, description="조회할 개수 (기본 10, 최대 100)", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="순위표 반환 성공",
+                schema=LeaderboardEntrySerializer(many=True),
+            ),
+        },
+    )
+    @action(detail=False, methods=['get'], url_path='leaderboard', pagination_class=None)
+    def leaderboard(self, request):
+        """점수 상위 N개 프로젝트를 반환합니다."""
+        limit = int_query_param(request, 'limit', 10, 1, 100)
+        entries = with_team_names(get_leaderboard().top(limit))
+        return Response(LeaderboardEntrySerializer(entries, many=True).data)
 
+    @swagger_auto_schema(
+        operation_description="색인된 전체 프로젝트 코드에서 문자열을 검색하는 API (업로드 후 백그라운드에서 색인)",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description=f"검색어 ({MIN_QUERY_LENGTH}글자 이상, 한 줄)", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('context', openapi.IN_QUERY, description="앞뒤 문맥 줄 수 (기본 2, 최대 10)", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('case', openapi.IN_QUERY, description="1이면 대소문자 구분", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="최대 결과 줄 수", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="검색 결과 (project, team_name, file, path, line, text, before, after)",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'results': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT)),
+                        'truncated': openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                    },
+                ),
+            ),
+            400: "검색어가 너무 짧음",
+        },
+    )
+    @action(detail=False, methods=['get'], url_path='code-search', pagination_class=None)
+    def code_search(self, request):
+        """업로드된 프로젝트 코드에서 검색어가 들어있는 줄을 찾습니다."""
+        query = request.query_params.get('q', '')
+        if len(query) < MIN_QUERY_LENGTH or '\n' in query:
+            return Response(
+                {"error": f"Query must be a single line of at least {MIN_QUERY_LENGTH} characters."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        max_results = settings.PROJECT_CODE_SEARCH['MAX_RESULTS']
+        results, truncated = search_code(
+            query,
+            context=int_query_param(request, 'context', 2, 0, 10),
+            case_sensitive=request.query_params.get('case') == '1',
+            limit=int_query_param(request, 'limit', max_results, 1, max_results),
+        )
+        return Response({'results': results, 'truncated': truncated})
+
+    @swagger_auto_schema(
+        operation_description="특정 프로젝트의 순위와 앞뒤 순위 프로젝트를 조회하는 API",
+        manual_parameters=[
+            openapi.Parameter('around', openapi.IN_QUERY, description="앞뒤로 함께 볼 개수 (기본 5, 최대 50)", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="순위 반환 성공",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'rank': openapi.Schema(type=openapi.TYPE_INTEGER),
+                        'score': openapi.Schema(type=openapi.TYPE_NUMBER),
+                        'neighbours': openapi.Schema(type=openapi.TYPE_ARRAY, items=openapi.Schema(type=openapi.TYPE_OBJECT)),
+                    },
+                ),
+            ),
+            404: "채점되지 않았거나 없는 프로젝트",
+        },
+    )
+    @action(detail=True, methods=['get'], url_path='rank')
+    def rank(self, request, pk=None):
+        """프로젝트 순위와 앞뒤 around개씩의 순위를 반환합니다."""
+        around = int_query_param(request, 'around', 5, 0, 50)
+        try:
+            project_id = int(pk)
+        except ValueError:
+            project_id = None
+        leaderboard = get_leaderboard()
+        entry = leaderboard.rank(project_id)
+        if entry is None:
+            return Response({"error": "Project has not been scored."}, status=status.HTTP_404_NOT_FOUND)
+        neighbours = with_team_names(leaderboard.around(project_id, around) or [])
+        return Response({
+            'rank': entry['rank'],
+            'score': entry['score'],
+            'neighbours': LeaderboardEntrySerializer(neighbours, many=True).data,
+        })
+
+    @swagger_auto_schema(
+        operation_description="ZIP 파일 안의 파일 목록(인덱스)을 페이지 단위로 조회하는 API",
+        manual_parameters=[
+            openapi.Parameter('prefix', openapi.IN_QUERY, description="경로 접두사 (디렉토리)", type=openapi.TYPE_STRING),
+            openapi.Parameter('page_size', openapi.IN_QUERY, description="페이지 크기", type=openapi.TYPE_INTEGER),
+        ],
+        responses={
+            200: openapi.Response(
+                description="파일 목록 반환 성공",
+                schema=ProjectFileSerializer(many=True),
+            ),
+            404: "프로젝트를 찾을 수 없음",
+        },
+    )
+    @action(detail=True, methods=['get'], url_path='files', pagination_class=ProjectFilePagination)
+    def list_files(self, request, pk=None):
+        """ZIP 파일 인덱스를 페이지 단위로 반환합니다."""
+        try:
+            project = self.get_queryset().get(pk=pk)
         except Project.DoesNotExist:
             return Response({"error": "Project not found."}, status=status.HTTP_404_NOT_FOUND)
-        except zipfile.BadZipFile:
+        try:
+            project.ensure_file_index()
+        except ArchiveError:
             return Response({"error": "Invalid ZIP file format."}, status=status.HTTP_400_BAD_REQUEST)
+
+        files = project.files.all()
+        prefix = request.query_params.get('prefix')
+        if prefix:
+            files = files.filter(path__startswith=prefix)
+        page = self.paginate_queryset(files)
+        serializer = ProjectFileSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(
+        operation_description="ZIP 파일 안의 파일 하나를 스트리밍하는 API (Range 헤더 지원)",
+        manual_parameters=[
+            openapi.Parameter('Range', openapi.IN_HEADER, description="bytes=시작-끝", type=openapi.TYPE_STRING),
+        ],
+        responses={
+            200: "파일 내용",
+            206: "요청한 범위의 파일 내용",
+            404: "프로젝트 또는 파일을 찾을 수 없음",
+            416: "잘못된 Range 요청",
+        },
+    )
+    @action(detail=True, methods=['get'], url_path=r'files/(?P<file_id>[0-9]+)')
+    def file_content(self, request, pk=None, file_id=None):
+        """ZIP 파일에서 멤버 하나만 읽어 스트리밍합니다."""
+        try:
+            project = self.get_queryset().get(pk=pk)
+            entry = project.files.get(pk=file_id)
+        except (Project.DoesNotExist, ProjectFile.DoesNotExist):
+            return Response({"error": "File not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        byte_range = parse_range_header(request.headers.get('Range'), entry.size)
+        if byte_range is False:
+            response = Response({"error": "Invalid range."}, status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+            response['Content-Range'] = f"bytes */{entry.size}"
+            return response
+        start, end = byte_range or (0, entry.size - 1)
+
+        if entry.encoding:
+            content_type = f"text/plain; charset={entry.encoding}"
+        else:
+            content_type = 'application/octet-stream'
+        response = StreamingHttpResponse(
+            stream_member(project, entry, start, end),
+            content_type=content_type,
+            status=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        )
+        response['Content-Length'] = str(max(end - start + 1, 0))
+        response['Accept-Ranges'] = 'bytes'
+        if byte_range:
+            response['Content-Range'] = f"bytes {start}-{end}/{entry.size}"
+        return response
@@ -0,0 +1,140 @@
+import logging
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ScoreJob
+from .scoring import get_scorer, mark_scoring_failed, save_project_score
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreWorker:
+    """
+    ScoreJob 큐를 처리하는 워커
+    - concurrency: 동시에 실행할 최대 작업 수
+    - timeout: 작업 하나당 최대 실행 시간(초)
+      채점 함수에도 전달되어 요청 제한 시간으로 쓰입니다. 넘긴 작업은 재시도하되,
+      스레드가 실제로 끝날 때까지 동시 실행 수에 포함합니다.
+    - max_attempts: 최대 시도 횟수 (초과 시 failed)
+    - backoff: 재시도 대기 시간의 기준(초), 시도마다 2배씩 증가
+    """
+
+    def __init__(self, concurrency=4, timeout=30, max_attempts=5, backoff=5, poll_interval=1, scorer=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+        self.scorer = scorer or get_scorer()
+        self._stopping = False
+
+    def stop(self):
+        self._stopping = True
+
+    def run(self, once=False):
+        """큐를 처리합니다. once=True이면 실행 가능한 작업이 없어질 때 종료합니다."""
+        running = {}  # future -> (job, 시작 시각)
+        # 제한 시간을 넘겨 포기한 작업의 future
+        # 실행 중인 스레드는 중단할 수 없으므로 실제로 끝날 때까지 동시 실행 수에 포함
+        abandoned = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='score-worker') as executor:
+            while not self._stopping:
+                self.requeue_stale()
+                for job in self.claim(self.concurrency - len(running) - len(abandoned)):
+                    running[executor.submit(self._score, job)] = (job, time.monotonic())
+
+                if not running and not abandoned:
+                    if once:
+                        break
+                    time.sleep(self.poll_interval)
+                    continue
+
+                done, _ = wait([*running, *abandoned], timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in abandoned:
+                        abandoned.discard(future)  # 결과는 이미 재시도로 넘긴 작업이므로 버림
+                        continue
+                    job, _ = running.pop(future)
+                    try:
+                        self.finish(job, future.result())
+                    except Exception as exc:
+                        self.retry(job, exc)
+
+                # 제한 시간을 넘긴 작업은 재시도 대기열로 되돌림
+                now = time.monotonic()
+                for future, (job, started) in list(running.items()):
+                    if now - started > self.timeout:
+                        running.pop(future)
+                        abandoned.add(future)
+                        self.retry(job, TimeoutError(f"Scoring exceeded {self.timeout}s."))
+
+    def claim(self, limit):
+        """실행 가능한 작업을 최대 limit개 가져옵니다. (여러 워커가 동시에 실행돼도 안전)"""
+        if limit <= 0:
+            return []
+        candidates = list(
+            ScoreJob.objects.filter(status=ScoreJob.STATUS_QUEUED, run_after__lte=timezone.now())
+            .order_by('run_after', 'id')
+            .values_list('id', flat=True)[:limit]
+        )
+        claimed = []
+        for job_id in candidates:
+            # 조건부 UPDATE로 다른 워커보다 먼저 가져간 경우에만 실행
+            updated = ScoreJob.objects.filter(id=job_id, status=ScoreJob.STATUS_QUEUED).update(
+                status=ScoreJob.STATUS_RUNNING,
+                attempts=F('attempts') + 1,
+                locked_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+            if updated:
+                claimed.append(ScoreJob.objects.select_related('project').get(id=job_id))
+        return claimed
+
+    def requeue_stale(self):
+        """워커가 비정상 종료되어 running 상태로 남은 작업을 되돌립니다."""
+        deadline = timezone.now() - timedelta(seconds=self.timeout * 2)
+        ScoreJob.objects.filter(status=ScoreJob.STATUS_RUNNING, locked_at__lt=deadline).update(
+            status=ScoreJob.STATUS_QUEUED, locked_at=None, updated_at=timezone.now()
+        )
+
+    def _score(self, job):
+        close_old_connections()
+        try:
+            return self.scorer(job.project, timeout=self.timeout)
+        finally:
+            close_old_connections()
+
+    def finish(self, job, score):
+        updated = ScoreJob.objects.filter(id=job.id, status=ScoreJob.STATUS_RUNNING, attempts=job.attempts).update(
+            status=ScoreJob.STATUS_DONE, locked_at=None, last_error='', updated_at=timezone.now()
+        )
+        if updated:
+            save_project_score(job.project_id, score)
+            logger.info("Scored project %s: %s", job.project_id, score)
+
+    def retry(self, job, exc):
+        logger.warning("Scoring project %s failed (attempt %s): %s", job.project_id, job.attempts, exc)
+        if job.attempts >= self.max_attempts:
+            updated = ScoreJob.objects.filter(id=job.id, status=ScoreJob.STATUS_RUNNING, attempts=job.attempts).update(
+                status=ScoreJob.STATUS_FAILED, locked_at=None, last_error=str(exc), updated_at=timezone.now()
+            )
+            if updated:
+                mark_scoring_failed(job.project_id)
+            return
+
+        # 지수 백오프 + 약간의 지터
+        delay = self.backoff * (2 ** (job.attempts - 1)) * random.uniform(1.0, 1.25)
+        ScoreJob.objects.filter(id=job.id, status=ScoreJob.STATUS_RUNNING, attempts=job.attempts).update(
+            status=ScoreJob.STATUS_QUEUED,
+            run_after=timezone.now() + timedelta(seconds=delay),
+            locked_at=None,
+            last_error=str(exc),
+            updated_at=timezone.now(),
+        )
+
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ScbBeConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'scb_be'
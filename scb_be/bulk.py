@@ -0,0 +1,92 @@
+"""
+일괄(bulk) 생성 / 수정 / 삭제 API 공통 처리
+
+- 요청 본문: 생성/수정은 {"items": [...]}, 삭제는 {"ids": [...]}
+  한 번에 BULK_API['MAX_ITEMS']개까지 받습니다.
+- 권한 확인은 대상 객체를 한 번의 쿼리로 조회해 항목별로 확인합니다. (get_object 반복 없음)
+- 응답은 항목별 결과 목록입니다. 일부 항목이 실패해도 나머지는 처리됩니다.
+  {"results": [{"id": 1, "status": 200}, {"id": 2, "status": 403, "error": "..."}]}
+  항목의 id / board 값이 정수가 아니면 그 항목만 400입니다. ({"index": 0, "status": 400, "error": {...}})
+"""
+from django.conf import settings
+from rest_framework import serializers, status
+
+
+def max_items():
+    return settings.BULK_API['MAX_ITEMS']
+
+
+def parse_items(data):
+    """요청 본문의 items 목록을 반환합니다. 목록이 아니거나 너무 많으면 ValidationError"""
+    items = data.get('items') if hasattr(data, 'get') else None
+    if not isinstance(items, list) or not items:
+        raise serializers.ValidationError({'items': 'A non-empty list is required.'})
+    if len(items) > max_items():
+        raise serializers.ValidationError({'items': f'At most {max_items()} items per request.'})
+    if not all(isinstance(item, dict) for item in items):
+        raise serializers.ValidationError({'items': 'Each item must be an object.'})
+    return items
+
+
+_id_field = serializers.IntegerField(min_value=1)
+ID_ERROR = 'A valid integer is required.'
+
+
+def to_id(value):
+    """정수 id로 변환합니다. (숫자 문자열 허용) bool / 소수 / 목록 등 변환할 수 없으면 None"""
+    if isinstance(value, bool):
+        return None
+    try:
+        return _id_field.run_validation(value)
+    except serializers.ValidationError:
+        return None
+
+
+def parse_ids(values, name='ids'):
+    """id 목록을 중복 없이 (순서 유지) 정수로 반환합니다."""
+    if not isinstance(values, list) or not values:
+        raise serializers.ValidationError({name: 'A non-empty list is required.'})
+    if len(values) > max_items():
+        raise serializers.ValidationError({name: f'At most {max_items()} ids per request.'})
+    ids = [to_id(value) for value in values]
+    if None in ids:
+        raise serializers.ValidationError({name: 'Ids must be integers.'})
+    return list(dict.fromkeys(ids))
+
+
+def parse_delete_ids(data):
+    """삭제 요청 본문 {"ids": [...]}의 id 목록 (본문이 객체가 아니면 ValidationError)"""
+    return parse_ids(data.get('ids') if hasattr(data, 'get') else None)
+
+
+def item_ids(items):
+    """
+    수정 요청 항목별 id를 검사합니다.
+    (항목별 id 또는 None 목록, 중복 없는 올바른 id 목록, {항목 index: 실패 결과})
+    """
+    ids = [to_id(item.get('id')) for item in items]
+    failures = {
+        index: error(status.HTTP_400_BAD_REQUEST, {'id': [ID_ERROR]}, index=index)
+        for index, pk in enumerate(ids) if pk is None
+    }
+    return ids, list(dict.fromkeys(pk for pk in ids if pk is not None)), failures
+
+
+def error(status_code, message, **fields):
+    return {**fields, 'status': status_code, 'error': message}
+
+
+def check_owners(request, owners, ids, is_owner):
+    """
+    owners: {id: 작성자 pk} (한 번의 쿼리로 조회한 값)
+    권한이 있는 id 목록과 {id: 실패 결과}를 반환합니다.
+    """
+    allowed, failures = [], {}
+    for pk in ids:
+        if pk not in owners:
+            failures[pk] = error(status.HTTP_404_NOT_FOUND, 'Not found.', id=pk)
+        elif not is_owner(request, owners[pk]):
+            failures[pk] = error(status.HTTP_403_FORBIDDEN, 'You do not have permission to perform this action.', id=pk)
+        else:
+            allowed.append(pk)
+    return allowed, failures
@@ -0,0 +1,176 @@
+"""
+바이트 크기 기준으로 LRU 제거하는 로컬 메모리 캐시 백엔드
+
+CACHES 설정 예:
+    'preview': {
+        'BACKEND': 'scb_be.cache.SizeAwareLocMemCache',
+        'LOCATION': 'preview',
+        'OPTIONS': {
+            'MAX_BYTES': 64 * 1024 * 1024,       # 전체 용량
+            'MAX_ENTRY_BYTES': 4 * 1024 * 1024,  # 이보다 큰 값은 저장하지 않음
+        },
+    }
+
+Django 기본 LocMemCache는 항목 개수(MAX_ENTRIES)로만 제거하므로
+큰 값 몇 개가 캐시 전체를 밀어낼 수 있습니다. 이 백엔드는 pickle된 크기를 합산해
+MAX_BYTES를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from . import metrics
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class _Store:
+    def __init__(self):
+        self.data = OrderedDict()  # key -> (pickled, expires_at)
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+
+
+class SizeAwareLocMemCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._name = name
+        self._max_bytes = int(options.get('MAX_BYTES', 64 * 1024 * 1024))
+        self._max_entry_bytes = int(options.get('MAX_ENTRY_BYTES', self._max_bytes // 16))
+        with _stores_lock:
+            self._store = _stores.setdefault(name, _Store())
+
+    # 내부 헬퍼 (lock을 잡은 상태에서 호출)
+    def _expired(self, key, now):
+        _, expires_at = self._store.data[key]
+        return expires_at is not None and expires_at <= now
+
+    def _remove(self, key):
+        pickled, _ = self._store.data.pop(key)
+        self._store.total_bytes -= len(pickled)
+
+    def _set(self, key, value, timeout):
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        if len(pickled) > self._max_entry_bytes:
+            # 너무 큰 값은 다른 항목을 모두 밀어내지 않도록 저장하지 않음
+            self._store.rejected += 1
+            metrics.incr(f'cache.{self._name}.rejected')
+            if key in self._store.data:
+                self._remove(key)
+            return False
+        if key in self._store.data:
+            self._remove(key)
+        self._store.data[key] = (pickled, self.get_backend_timeout(timeout))
+        self._store.total_bytes += len(pickled)
+        self._evict()
+        return True
+
+    def _evict(self):
+        evicted = 0
+        while self._store.total_bytes > self._max_bytes and self._store.data:
+            oldest = next(iter(self._store.data))
+            self._remove(oldest)
+            evicted += 1
+        if evicted:
+            self._store.evictions += evicted
+            metrics.incr(f'cache.{self._name}.evictions', evicted)
+
+    def _has_live(self, key, now):
+        if key not in self._store.data:
+            return False
+        if self._expired(key, now):
+            self._remove(key)
+            return False
+        return True
+
+    # BaseCache API
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if self._has_live(key, time.time()):
+                return False
+            return self._set(key, value, timeout)
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if not self._has_live(key, time.time()):
+                self._store.misses += 1
+                metrics.incr(f'cache.{self._name}.misses')
+                return default
+            self._store.data.move_to_end(key)
+            pickled, _ = self._store.data[key]
+            self._store.hits += 1
+        metrics.incr(f'cache.{self._name}.hits')
+        return pickle.loads(pickled)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            self._set(key, value, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if not self._has_live(key, time.time()):
+                return False
+            pickled, _ = self._store.data[key]
+            self._store.data[key] = (pickled, self.get_backend_timeout(timeout))
+            self._store.data.move_to_end(key)
+            return True
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if not self._has_live(key, time.time()):
+                raise ValueError("Key '%s' not found" % key)
+            pickled, expires_at = self._store.data[key]
+            new_value = pickle.loads(pickled) + delta
+            self._remove(key)
+            new_pickled = pickle.dumps(new_value, self.pickle_protocol)
+            self._store.data[key] = (new_pickled, expires_at)
+            self._store.total_bytes += len(new_pickled)
+            self._store.data.move_to_end(key)
+        return new_value
+
+    def has_key(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            return self._has_live(key, time.time())
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._store.lock:
+            if key not in self._store.data:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        with self._store.lock:
+            self._store.data.clear()
+            self._store.total_bytes = 0
+
+    def stats(self):
+        """hit/miss/eviction 통계와 현재 사용량을 반환합니다."""
+        with self._store.lock:
+            return {
+                'hits': self._store.hits,
+                'misses': self._store.misses,
+                'evictions': self._store.evictions,
+                'rejected': self._store.rejected,
+                'entries': len(self._store.data),
+                'bytes': self._store.total_bytes,
+                'max_bytes': self._max_bytes,
+            }
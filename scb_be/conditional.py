@@ -0,0 +1,99 @@
+"""
+조회 API 조건부 요청(ETag / Last-Modified) 처리 mixin
+
+- retrieve: etag_fields 컬럼만 한 번 조회해 ETag와 Last-Modified를 계산합니다.
+- list: list_version_names 버전 카운터와 요청 경로(쿼리스트링 포함)로 ETag를 계산합니다. (버전 조회 SELECT 한 번)
+- If-None-Match / If-Modified-Since가 일치하면 queryset 조회와 serializer 실행 없이 304를 반환합니다.
+- ETag에는 요청 scheme / host도 넣습니다. (본문의 next / previous 링크가 절대 URL이므로 host마다 다른 본문)
+- RESPONSE_CACHE 설정이 있으면 ETag를 키로 직렬화된 응답 본문을 캐시합니다.
+  버전은 DB에 있으므로 프로세스별 캐시여도 다른 프로세스가 쓴 뒤에는 새 ETag(새 키)를 사용합니다.
+- 버전은 scb_be.versions.track()으로 등록한 모델이 저장/삭제될 때 올라가 목록 ETag/캐시가 무효화됩니다.
+304/캐시 응답은 get_object()를 거치지 않으므로 조회(GET)를 누구에게나 허용하는 뷰셋에만 사용합니다.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from . import metrics, versions
+
+
+def make_etag(*parts):
+    return '"%s"' % hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def request_origin(request):
+    """응답 본문의 절대 URL을 결정하는 값 (ETag / 캐시 키에 포함)"""
+    return request.scheme, request.get_host()
+
+
+def response_cache():
+    options = getattr(settings, 'RESPONSE_CACHE', None)
+    return caches[options['ALIAS']] if options else None
+
+
+class ConditionalGetMixin:
+    etag_fields = ('id',)  # 상세 응답이 바뀌면 함께 바뀌는 컬럼
+    last_modified_fields = ()  # Last-Modified로 사용할 시각 컬럼 (가장 늦은 값)
+    list_version_names = ()  # 목록 응답에 영향을 주는 버전 카운터 이름
+
+    def conditional_response(self, request, etag, fresh, last_modified=None):
+        """조건이 맞으면 304, 아니면 캐시된 본문 또는 fresh()로 만든 응답에 검증 헤더를 붙여 반환"""
+        timestamp = int(last_modified.timestamp()) if last_modified else None  # HTTP 날짜는 초 단위
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            metrics.incr('conditional.not_modified')
+            if not_modified.status_code == 304:
+                not_modified['ETag'] = etag
+            return not_modified
+
+        cache = response_cache()
+        cache_key = f"response:{etag}"
+        data = cache.get(cache_key) if cache else None
+        if data is not None:
+            metrics.incr('conditional.cache_hits')
+            response = Response(data)
+        else:
+            response = fresh()
+            if response.status_code != 200:
+                return response
+            if cache and not response.streaming:  # 스트리밍 응답은 본문을 보관하지 않음
+                cache.set(cache_key, response.data, settings.RESPONSE_CACHE['TIMEOUT'])
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(timestamp)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            row = self.queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}) \
+                .values_list(*self.etag_fields, *self.last_modified_fields).first()
+        except (TypeError, ValueError):
+            row = None
+        if row is None:
+            return super().retrieve(request, *args, **kwargs)  # 404 처리는 기본 동작에 맡김
+
+        etag = make_etag(
+            type(self).__name__, request_origin(request), request.accepted_media_type, row[:len(self.etag_fields)]
+        )
+        last_modified = max(row[len(self.etag_fields):], default=None)
+        return self.conditional_response(
+            request, etag, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs), last_modified
+        )
+
+    def collection_etag(self, request, version_names):
+        """버전 카운터와 요청 경로(쿼리스트링, 커서 포함)로 목록 응답의 ETag를 만듭니다."""
+        return make_etag(
+            type(self).__name__, getattr(self, 'action', None), request_origin(request), request.accepted_media_type,
+            request.get_full_path(), versions.get_versions(version_names),
+        )
+
+    def list(self, request, *args, **kwargs):
+        etag = self.collection_etag(request, self.list_version_names)
+        return self.conditional_response(
+            request, etag, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
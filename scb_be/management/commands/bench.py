@@ -0,0 +1,262 @@
+"""
+성능 측정 명령 (python manage.py bench [대상 ...])
+
+임시 테스트 DB(테스트 실행과 같은 방식)를 만들어 데이터를 채운 뒤 측정하므로 실제 DB(db.sqlite3)는 건드리지 않습니다.
+응답 캐시 / 인증 캐시는 끄고 실제 URL을 APIClient로 요청합니다. (뷰, 쿼리, 직렬화까지 포함한 시간)
+
+- pagination: 목록 첫 페이지와 깊은 위치(10% / 50% / 90% / 마지막) 커서 페이지의 응답 시간
+- leaderboard: 상위 N개 / 순위 위치별 rank API 응답 시간, 점수 변경 직후 조회 시간
+- search: 모든 글에 있는 흔한 단어 / 드문 단어 / 둘 다 검색한 첫 페이지와 뒤 페이지 응답 시간
+- login: 동시 로그인 폭주 중 상태 코드별 응답 시간 (해시 작업 풀 / 대기열이 넘치면 503)
+- values: 목록 serializer의 초당 처리 행 수 (values 모드 / ModelSerializer)
+"""
+import logging
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from rest_framework.pagination import Cursor
+from rest_framework.test import APIClient
+
+from board.models import Board
+from board.search import index_boards
+from board.serializers import BoardListSerializer
+from project.models import Project
+from project.serializers import ProjectListSerializer
+from project.scoring import save_project_score
+from scb_be.pagination import BoardPagination, _value_text
+from scb_be.sparse import serializer_field_names
+from scb_be.values import serialize_rows, values_plan
+from users.authentication import issue_token
+
+NO_CACHE = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+BATCH_SIZE = 5000
+
+
+def timed(fn, repeat):
+    """fn을 repeat번 실행한 시간(초) 목록"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def summary(times):
+    ordered = sorted(times)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"median {statistics.median(ordered) * 1000:8.2f} ms  p99 {p99 * 1000:8.2f} ms  (n={len(ordered)})"
+
+
+def get_ok(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, (url, response.status_code)
+    return response
+
+
+def make_user(username='bench'):
+    return User.objects.get_or_create(username=username)[0]
+
+
+def bench_pagination(command, options):
+    """게시글 목록: 몇 번째 페이지든 같은 비용인지 (OFFSET 없는 keyset 커서)"""
+    rows = options['rows']
+    user = make_user()
+    for start in range(0, rows, BATCH_SIZE):
+        Board.objects.bulk_create([
+            Board(school_id='20200000', title=f'title {i}', content='content', created_by=user)
+            for i in range(start, min(start + BATCH_SIZE, rows))
+        ])
+    command.stdout.write(f"{rows} boards")
+
+    client = APIClient()
+    for sort in (None, 'discussed'):  # 기본 정렬 / 동점만 있는 정렬 (댓글 수 모두 0)
+        paginator = BoardPagination()
+        query = {'sort': sort} if sort else {}
+        paginator.base_url = 'http://testserver/api/board/boards/?' + urlencode(query)
+        ordering = paginator.sort_orderings.get(sort, paginator.ordering)
+        queryset = Board.objects.order_by(*ordering)
+
+        for label, depth in (('first', None), ('10%', rows // 10), ('50%', rows // 2), ('90%', rows * 9 // 10), ('last', rows - 2)):
+            if depth is None:
+                url = paginator.base_url
+            else:  # depth번째 행 다음 페이지의 커서 (측정 밖에서 OFFSET으로 위치만 구함)
+                position = queryset.values_list(*[order.lstrip('-') for order in ordering])[depth]
+                url = paginator.encode_cursor(Cursor(offset=0, reverse=False, position=[_value_text(v) for v in position]))
+            get_ok(client, url)  # 준비 실행
+            command.stdout.write(f"  sort={sort or 'default':10} {label:>6}: {summary(timed(lambda: get_ok(client, url), options['repeat']))}")
+
+
+def bench_leaderboard(command, options):
+    """프로젝트 순위표: 순위가 낮은 프로젝트도 같은 비용인지, 다른 프로세스의 점수 변경 뒤에도 다시 만들지 않는지"""
+    rows = options['rows']
+    user = make_user()
+    rng = random.Random(0)
+    for start in range(0, rows, BATCH_SIZE):
+        Project.objects.bulk_create([
+            Project(team_name=f'team {i}', team_members='m', code_digest='0' * 64, created_by=user,
+                    score=rng.randrange(10000) / 100, score_status=Project.SCORE_SCORED)
+            for i in range(start, min(start + BATCH_SIZE, rows))
+        ])
+    command.stdout.write(f"{rows} scored projects")
+
+    client = APIClient()
+    url = '/api/projects/leaderboard/?limit=10'
+    get_ok(client, url)
+    command.stdout.write(f"  top 10            : {summary(timed(lambda: get_ok(client, url), options['repeat']))}")
+
+    order = list(Project.objects.order_by('-score', 'id').values_list('id', flat=True))
+    for label, index in (('rank 1', 0), ('rank 50%', rows // 2), ('rank last', rows - 1)):
+        url = f'/api/projects/{order[index]}/rank/?around=5'
+        get_ok(client, url)
+        command.stdout.write(f"  {label:18}: {summary(timed(lambda: get_ok(client, url), options['repeat']))}")
+
+    # score_worker(다른 프로세스)가 점수를 쓴 직후의 조회 (변경마다 새 점수)
+    ids = rng.sample(order, min(options['repeat'], len(order)))
+
+    def write_then_read():
+        project_id = ids.pop()
+        save_project_score(project_id, rng.randrange(10000) / 100)
+        get_ok(client, f'/api/projects/{project_id}/rank/?around=5')
+    command.stdout.write(f"  write + rank      : {summary(timed(write_then_read, len(ids)))}")
+
+
+def bench_search(command, options):
+    """게시글 검색: 흔한 단어(모든 글)도 후보 수만큼만 점수를 계산하고 전체 개수를 세지 않는지"""
+    rows = options['rows']
+    user = make_user()
+    rng = random.Random(0)
+    words = ['alpha', 'beta', 'gamma', 'delta', '게시판', '시험기간', '도서관']
+    for start in range(0, rows, BATCH_SIZE):
+        boards = Board.objects.bulk_create([
+            Board(school_id='20200000', title=f'common {rng.choice(words)}', created_by=user,
+                  content=' '.join(rng.choices(words, k=8)) + (' rare' if i % 100 == 0 else ''))
+            for i in range(start, min(start + BATCH_SIZE, rows))
+        ])
+        index_boards(boards, created=True)  # bulk_create는 signal이 없으므로 직접 색인
+    command.stdout.write(f"{rows} boards (common: 100%, rare: 1%)")
+
+    client = APIClient()
+    for query in ('common', 'rare', 'common rare', '게시판 도서관'):
+        for page in (1, 5):
+            url = '/api/board/search/?' + urlencode({'q': query, 'page': page})
+            get_ok(client, url)
+            command.stdout.write(f"  {query:14} page {page}: {summary(timed(lambda: get_ok(client, url), options['repeat']))}")
+
+
+def bench_login(command, options):
+    """로그인 폭주: 해시 계산 수가 제한되어 성공 응답의 p99가 일정하고, 넘치는 요청은 기다리지 않고 503인지"""
+    clients, per_client = options['clients'], 3
+    password = 'bench-password'
+    encoded = make_password(password)  # 기본 해시 (settings.PASSWORD_HASHER)
+    User.objects.bulk_create([User(username=f'bench{i}', password=encoded) for i in range(clients)])
+    for user in User.objects.filter(username__startswith='bench'):
+        issue_token(user)  # 로그인 때 토큰을 새로 만들지 않도록 (DB 쓰기 없이 해시 계산만 측정)
+    command.stdout.write(f"{clients} clients x {per_client} logins, PASSWORD_HASHING={settings.PASSWORD_HASHING}")
+
+    results = defaultdict(list)  # 상태 코드 -> 응답 시간 목록
+    lock = threading.Lock()
+    start = threading.Barrier(clients)
+
+    def client_thread(index):
+        client = APIClient()
+        try:
+            start.wait()
+            for _ in range(per_client):
+                started = time.perf_counter()
+                response = client.post('/users/login/', {'username': f'bench{index}', 'password': password}, format='json')
+                with lock:
+                    results[response.status_code].append(time.perf_counter() - started)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=client_thread, args=(index,)) for index in range(clients)]
+    request_logger = logging.getLogger('django.request')
+    level = request_logger.level
+    request_logger.setLevel(logging.CRITICAL)  # 503마다 찍히는 오류 로그 생략
+    started = time.perf_counter()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        request_logger.setLevel(level)
+    elapsed = time.perf_counter() - started
+    for status_code, times in sorted(results.items()):
+        command.stdout.write(f"  {status_code}: {summary(times)}")
+    command.stdout.write(f"  total {sum(map(len, results.values()))} requests in {elapsed:.2f} s")
+
+
+def bench_values(command, options):
+    """목록 직렬화: values 모드가 같은 행을 ModelSerializer보다 빠르게 처리하는지 (DB 읽기 포함)"""
+    rows = min(options['rows'], 10_000)  # 한 번에 직렬화하는 행 수
+    user = make_user()
+    Board.objects.bulk_create([
+        Board(school_id='20200000', title=f'title {i}', content='content', created_by=user) for i in range(rows)
+    ], batch_size=BATCH_SIZE)
+    Project.objects.bulk_create([
+        Project(team_name=f'team {i}', team_members='m', code_digest='0' * 64, created_by=user, score=i / 100)
+        for i in range(rows)
+    ], batch_size=BATCH_SIZE)
+    command.stdout.write(f"{rows} rows per run")
+
+    repeat = max(1, options['repeat'] // 4)
+    for serializer_class, queryset in (
+        (BoardListSerializer, Board.objects.select_related('created_by').order_by('-id')),
+        (ProjectListSerializer, Project.objects.order_by('-id')),
+    ):
+        lookups, rules = values_plan(serializer_class, serializer_field_names(serializer_class))
+        runs = {
+            'values': lambda: serialize_rows(serializer_class, rules, list(queryset.values(*lookups)[:rows]), {}),
+            'ModelSerializer': lambda: serializer_class(queryset[:rows], many=True).data,
+        }
+        assert runs['values']() == runs['ModelSerializer'](), serializer_class.__name__  # 같은 결과
+        for label, run in runs.items():
+            times = timed(run, repeat)
+            command.stdout.write(
+                f"  {serializer_class.__name__:22} {label:15}: {summary(times)}  {rows / statistics.median(times):10,.0f} rows/s"
+            )
+
+
+BENCHMARKS = {
+    'pagination': bench_pagination,
+    'leaderboard': bench_leaderboard,
+    'search': bench_search,
+    'login': bench_login,
+    'values': bench_values,
+}
+
+
+class Command(BaseCommand):
+    help = "임시 테스트 DB에 데이터를 채우고 목록 페이지네이션 등의 응답 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='*', choices=[*BENCHMARKS, []], help="측정 대상 (기본: 전체)")
+        parser.add_argument('--rows', type=int, default=100_000, help="채울 행 수 (기본 100000)")
+        parser.add_argument('--repeat', type=int, default=20, help="측정 반복 횟수 (기본 20)")
+        parser.add_argument('--clients', type=int, default=64, help="login: 동시에 로그인하는 클라이언트 수 (기본 64)")
+
+    def handle(self, *args, **options):
+        old_config = setup_databases(verbosity=0, interactive=False)  # 실제 DB 대신 테스트 DB
+        try:
+            with override_settings(
+                CACHES={alias: NO_CACHE for alias in settings.CACHES},
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                SECURE_SSL_REDIRECT=False,
+            ):
+                for name in options['targets'] or BENCHMARKS:
+                    self.stdout.write(self.style.MIGRATE_HEADING(f"{name}: {BENCHMARKS[name].__doc__}"))
+                    BENCHMARKS[name](self, options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
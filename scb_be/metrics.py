@@ -0,0 +1,48 @@
+"""
+프로세스 단위의 간단한 메트릭 저장소
+- incr(name): 카운터 증가
+- set_gauge(name, value): 현재 값 기록
+- observe(name, value): 값 분포 기록 (count / sum / max)
+snapshot()으로 전체 값을 조회하며 /metrics/ API로 노출됩니다.
+"""
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_gauges = {}
+_timings = {}
+
+
+def incr(name, value=1):
+    with _lock:
+        _counters[name] += value
+
+
+def set_gauge(name, value):
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(name, value):
+    with _lock:
+        stats = _timings.setdefault(name, {'count': 0, 'sum': 0.0, 'max': 0.0})
+        stats['count'] += 1
+        stats['sum'] += value
+        stats['max'] = max(stats['max'], value)
+
+
+def snapshot():
+    with _lock:
+        timings = {
+            name: dict(stats, avg=stats['sum'] / stats['count'] if stats['count'] else 0.0)
+            for name, stats in _timings.items()
+        }
+        return {'counters': dict(_counters), 'gauges': dict(_gauges), 'timings': timings}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _timings.clear()
@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class Version(models.Model):
+    """
+    버전 카운터 (scb_be.versions)
+    웹 서버, score_worker 등 모든 프로세스가 같은 값을 보도록 DB에 둡니다.
+    """
+    name = models.CharField(max_length=255, primary_key=True)  # 예: 'board.Comment', 'board.Comment:board=3'
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
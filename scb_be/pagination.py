@@ -0,0 +1,218 @@
+"""
+커서(keyset) 기반 페이지네이션
+OFFSET 없이 정렬 컬럼 값으로 다음 페이지 위치를 찾으므로 몇 번째 페이지든 비용이 같습니다.
+클라이언트는 ?page_size=로 페이지 크기를 정할 수 있습니다. (최대 max_page_size)
+?sort=로 sort_orderings에 정의된 다른 정렬을 고를 수 있습니다. (정렬 컬럼마다 인덱스 필요)
+
+DRF CursorPagination은 첫 번째 정렬 컬럼 값만 커서에 넣고 같은 값이 이어지면 OFFSET으로 넘어가므로
+댓글 수처럼 동점이 많은 정렬에서는 느려지고, offset_cutoff(1000)를 넘는 동점 뒤로는 넘어가지 못합니다.
+여기서는 정렬 컬럼 전체 값을 커서에 넣고 (comment_count, id) < (c, i)인 행을 다음 페이지로 읽습니다.
+한 번의 OR 조건((c' < c) | (c' = c & id < i))으로 읽으면 SQLite는 인덱스를 처음부터 훑으며 걸러내므로 (앞 페이지 수에 비례)
+같은 값 + 범위 조건 쿼리로 나누어 읽습니다. (rows_after, 각 쿼리가 인덱스에서 시작 위치를 바로 찾음)
+정렬의 마지막 컬럼은 유일해야 하고(id 등), 정렬 컬럼에는 NULL이 없어야 합니다.
+"""
+from base64 import b64decode
+from urllib import parse
+
+from django.core.exceptions import ValidationError
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, _reverse_ordering
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _value_text(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+def rows_after(queryset, ordering, position, limit):
+    """
+    ordering 순서로 정렬된 queryset에서 position(정렬 컬럼별 값) 다음에 오는 행을 limit개까지 읽습니다.
+    (a, b) 다음은 a = x & b < y인 행, 그다음 a < x인 행 순이므로 마지막 컬럼부터 조건을 한 단계씩 넓혀 읽습니다.
+    (대부분 한두 번, 최대 정렬 컬럼 수만큼 쿼리)
+    """
+    rows = []
+    for index in reversed(range(len(ordering))):
+        order = ordering[index]
+        lookup = '__lt' if order.startswith('-') else '__gt'
+        equal = {prior.lstrip('-'): value for prior, value in zip(ordering[:index], position)}
+        rows += queryset.filter(**equal, **{order.lstrip('-') + lookup: position[index]})[:limit - len(rows)]
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+class CursorPagination(pagination.CursorPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-pk'
+    sort_query_param = 'sort'
+    sort_orderings = {}  # ?sort= 값 -> 정렬
+
+    def get_ordering(self, request, queryset, view):
+        sort = request.query_params.get(self.sort_query_param)
+        if sort in self.sort_orderings:
+            return self.sort_orderings[sort]
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        if isinstance(self.ordering, str):
+            self.ordering = (self.ordering,)
+        self.cursor = self.decode_cursor(request)
+        reverse, position = (False, None) if self.cursor is None else self.cursor[1:]
+        if position is not None:
+            position = self.position_values(queryset.model, position)
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        # 한 행을 더 읽어 다음(역방향이면 이전) 페이지가 있는지 확인
+        if position is None:
+            results = list(queryset[:self.page_size + 1])
+        else:
+            results = rows_after(queryset, ordering, position, self.page_size + 1)
+        self.page = results[:self.page_size]
+        has_following = len(results) > len(self.page)
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_following
+        else:
+            self.has_next, self.has_previous = has_following, position is not None
+
+        if self.page:
+            self.next_position = self._get_position_from_instance(self.page[-1], self.ordering)
+            self.previous_position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:  # 빈 페이지: 받은 커서 위치에서 다시 시작
+            self.next_position = self.previous_position = (
+                None if position is None else [_value_text(value) for value in position]
+            )
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def position_values(self, model, position):
+        """커서의 값을 정렬 컬럼 형식으로 변환합니다. 개수가 다르거나 변환할 수 없으면 404"""
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        values = []
+        for order, text in zip(self.ordering, position):
+            name = order.lstrip('-')
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            try:
+                value = field.to_python(text)
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:  # 정렬 컬럼에는 NULL이 없음
+                raise NotFound(self.invalid_cursor_message)
+            values.append(value)
+        return values
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode('ascii')).decode('ascii'), keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=tokens.get('p'))  # p: 정렬 컬럼별 값 목록
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            field = order.lstrip('-')
+            value = instance[field] if isinstance(instance, dict) else getattr(instance, field)
+            values.append(_value_text(value))
+        return values
+
+
+class BoardPagination(CursorPagination):
+    ordering = ('-date_created', '-id')
+    sort_orderings = {
+        'discussed': ('-comment_count', '-id'),  # 댓글 많은 순
+        'active': ('-last_activity_at', '-id'),  # 최근 활동 순
+    }
+
+
+class CommentPagination(CursorPagination):
+    ordering = ('created_at', 'id')  # 댓글은 작성 순
+
+
+class ProjectPagination(CursorPagination):
+    ordering = ('-created_at', '-id')
+    sort_orderings = {
+        'discussed': ('-comment_count', '-id'),
+        'active': ('-last_activity_at', '-id'),
+    }
+
+
+class SearchPagination(pagination.PageNumberPagination):
+    """
+    검색 결과는 점수 순이라 커서 대신 페이지 번호 사용 (?page=)
+    전체 개수(COUNT)는 세지 않고 page_size + 1개를 읽어 다음 페이지가 있는지만 확인합니다. (응답에 count 없음)
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.page_number = 0
+        if self.page_number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'previous': self.get_previous_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        del response_schema['properties']['count']
+        response_schema['required'].remove('count')
+        return response_schema
+
+
+class ProfilePagination(CursorPagination):
+    ordering = ('user_id',)
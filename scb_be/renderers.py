@@ -0,0 +1,103 @@
+"""
+JSON 렌더러 / 스트리밍 JSON 응답
+
+- dumps(): orjson이 설치되어 있으면 orjson으로, 없으면 DRF와 같은 설정의 표준 json으로 인코딩합니다.
+  orjson이 처리하지 못하는 값(64비트를 넘는 정수 등)은 표준 json으로 다시 인코딩합니다.
+  날짜 / Decimal / lazy 문자열 등은 DRF JSONEncoder 규칙을 그대로 따릅니다.
+- FastJSONRenderer: JSONRenderer와 같은 결과를 dumps()로 만듭니다. (들여쓰기 요청은 기본 렌더러로 처리)
+- StreamingJSONResponse: 배열 / 객체를 항목 단위로 인코딩해 내보냅니다.
+  응답 전체를 메모리에 만들지 않으므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+"""
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import renderers
+from rest_framework.compat import SHORT_SEPARATORS
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pip install orjson (선택)
+    orjson = None
+
+_encoder = encoders.JSONEncoder()
+
+
+def _stdlib_dumps(data):
+    text = json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False, allow_nan=not api_settings.STRICT_JSON,
+        separators=SHORT_SEPARATORS,
+    )
+    # JSONRenderer와 같이 JavaScript에서 줄바꿈으로 해석되는 문자는 이스케이프
+    return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+
+def dumps(data):
+    """data를 압축된 UTF-8 JSON bytes로 인코딩합니다. (JSONRenderer 기본 설정과 같은 결과)"""
+    if orjson is None:
+        return _stdlib_dumps(data)
+    try:
+        content = orjson.dumps(
+            data, default=_encoder.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,  # 날짜는 DRF 형식으로
+        )
+    except TypeError:  # orjson.JSONEncodeError
+        return _stdlib_dumps(data)
+    if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+        content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return content
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """JSONRenderer와 같은 응답을 orjson(설치된 경우)으로 만듭니다."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+def iter_json_array(items):
+    """항목을 하나씩 인코딩해 JSON 배열 조각(bytes)을 반환합니다."""
+    yield b'['
+    first = True
+    for item in items:
+        yield dumps(item) if first else b',' + dumps(item)
+        first = False
+    yield b']'
+
+
+def iter_json_object(pairs):
+    """(키, 값)을 하나씩 인코딩해 JSON 객체 조각(bytes)을 반환합니다."""
+    yield b'{'
+    first = True
+    for key, value in pairs:
+        chunk = dumps(str(key)) + b':' + dumps(value)
+        yield chunk if first else b',' + chunk
+        first = False
+    yield b'}'
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """iter_json_array() / iter_json_object()의 조각을 그대로 내보내는 application/json 응답"""
+
+    def __init__(self, chunks, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(_buffered(chunks, settings.STREAMING_JSON['BUFFER_SIZE']), **kwargs)
+
+
+def _buffered(chunks, size):
+    """작은 조각을 size 바이트 정도로 모아 내보냅니다. (조각마다 write 하지 않도록)"""
+    buffer, length = [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield b''.join(buffer)
+            buffer, length = [], 0
+    if buffer:
+        yield b''.join(buffer)
@@ -6,6 +6,8 @@ Generated by 'django-admin startproject' using Django 5.1.4.
 
 import os
 from pathlib import Path
+from datetime import timedelta
+from importlib.util import find_spec
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -34,6 +36,7 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework.authtoken',
     'drf_spectacular',
+    'scb_be',  # 공용 모델 (버전 카운터)
     'users',
     'project',
     'drf_yasg',
@@ -124,14 +127,158 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# 프로젝트 ZIP 파일 저장소 (SHA-256 기반 blob 저장소)
+PROJECT_BLOB_STORE = 'project.storage.LocalBlobStore'
+PROJECT_BLOB_ROOT = os.path.join(BASE_DIR, 'blobs')
+
+# 업로드 ZIP 파일 검증 제한 (zip bomb / 경로 조작 방지)
+PROJECT_ARCHIVE_LIMITS = {
+    'MAX_MEMBERS': 10000,  # 최대 파일 개수
+    'MAX_TOTAL_SIZE': 512 * 1024 * 1024,  # 압축 해제 후 전체 크기 (512MB)
+    'MAX_COMPRESSION_RATIO': 100,  # 파일당 최대 압축률
+    'RATIO_MIN_SIZE': 1024 * 1024,  # 압축률 검사를 적용할 최소 파일 크기 (1MB)
+}
+
+# AI 채점 설정 (manage.py score_worker 가 처리)
+PROJECT_SCORER = 'project.scoring.http_scorer'  # 로컬 테스트: 'project.scoring.fake_scorer'
+SCORING_SERVICE = {
+    'URL': 'https://sozerong.pythonanywhere.com/random',
+    'CONNECT_TIMEOUT': 3.05,  # 연결 제한 시간(초)
+    'READ_TIMEOUT': 30,  # 응답 제한 시간(초)
+    'POOL_SIZE': 10,  # keep-alive 연결 풀 크기 (score_worker 동시 실행 수 이상)
+    'FAILURE_THRESHOLD': 5,  # 연속 실패 시 회로 차단
+    'RESET_TIMEOUT': 30,  # 회로 차단 유지 시간(초)
+}
+SCORE_WORKER = {
+    'CONCURRENCY': 4,  # 동시에 실행할 작업 수
+    'TIMEOUT': 30,  # 작업당 제한 시간(초)
+    'MAX_ATTEMPTS': 5,  # 최대 시도 횟수
+    'BACKOFF': 5,  # 재시도 대기 기준 시간(초)
+    'POLL_INTERVAL': 1,  # 큐 확인 주기(초)
+}
+
+# 캐시 설정
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # 토큰 인증 캐시 (users.authentication)
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+    # 코드 미리보기용: 바이트 크기 기준 LRU
+    'preview': {
+        'BACKEND': 'scb_be.cache.SizeAwareLocMemCache',
+        'LOCATION': 'preview',
+        'TIMEOUT': 60 * 60,
+        'OPTIONS': {
+            'MAX_BYTES': 64 * 1024 * 1024,  # 전체 용량 (64MB)
+            'MAX_ENTRY_BYTES': 2 * 1024 * 1024,  # 파일 하나당 최대 2MB
+        },
+    },
+}
+
+PROJECT_PREVIEW_CACHE = {
+    'ALIAS': 'preview',
+    'PROJECT_MAX_BYTES': 8 * 1024 * 1024,  # 프로젝트 하나가 차지할 수 있는 최대 용량
+}
+
+# 프로필 이미지 썸네일 (users.images)
+PROFILE_IMAGE = {
+    # 이름: ((가로, 세로), 자르기 여부) - 자르면 정확히 그 크기, 아니면 비율 유지하며 그 안으로 축소
+    'VARIANTS': {
+        'thumb': ((64, 64), True),
+        'avatar': ((256, 256), True),
+        'large': ((1024, 1024), False),
+    },
+    'QUALITY': 80,  # WebP / JPEG 품질
+    'MAX_PIXELS': 40_000_000,  # 업로드 허용 최대 픽셀 수 (가로 x 세로)
+    'WORKERS': 2,  # 백그라운드 변환 스레드 수
+}
+
+# 비밀번호 해시
+# PASSWORD_HASHER 환경 변수로 기본 해시 선택 (argon2는 argon2-cffi 패키지 필요)
+# 로그인 시 기본 해시와 다른 형식으로 저장된 비밀번호는 자동으로 다시 해시됨 (users.hashing)
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'argon2' if find_spec('argon2') else 'scrypt')
+_PASSWORD_HASHERS = {
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items()
+    if name != PASSWORD_HASHER and (name != 'argon2' or find_spec('argon2'))
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+# 비밀번호 해시 작업 풀 (users.hashing, 프로세스마다 하나)
+# 해시는 CPU 작업이라 코어 수보다 많이 동시에 계산하면 각 해시가 느려질 뿐이므로 WORKERS는 코어 수
+# 성공한 로그인의 최대 지연 ≈ ADMISSION_TIMEOUT + (QUEUE_SIZE / WORKERS + 1) × 해시 한 번 시간 (python manage.py bench login)
+PASSWORD_HASHING = {
+    'WORKERS': os.cpu_count() or 1,  # 동시에 계산하는 해시 수
+    'QUEUE_SIZE': 2 * (os.cpu_count() or 1),  # 대기열 크기
+    'ADMISSION_TIMEOUT': 0.1,  # 대기열 자리를 기다리는 최대 시간(초), 넘으면 503
+}
+
+# 토큰 인증 설정
+TOKEN_AUTH = {
+    'CACHE_ALIAS': 'auth',
+    'CACHE_TIMEOUT': 60,  # 토큰 -> 사용자 캐시 유지 시간(초)
+    'TOKEN_TTL': timedelta(days=14),  # 토큰 유효 기간
+    'ROTATE_AFTER': timedelta(days=1),  # 로그인 시 이보다 오래된 토큰은 새로 발급
+}
+
+# 조회 API 응답 본문 캐시 (ETag 키, scb_be.conditional) / None이면 사용하지 않음
+RESPONSE_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 5 * 60,
+}
+
+# 코드 검색 (업로드 후 백그라운드에서 트라이그램 색인 생성, 누락분은 manage.py index_code)
+PROJECT_CODE_SEARCH = {
+    'MAX_FILE_SIZE': 1024 * 1024,  # 이보다 큰 파일은 색인하지 않음 (1MB)
+    'WORKERS': None,  # 색인 프로세스 수 (None이면 CPU 코어 수)
+    'UPLOAD_WORKERS': 1,  # 업로드 직후 색인할 백그라운드 스레드 수
+    'MAX_RESULTS': 500,  # 검색 결과(일치하는 줄) 최대 개수
+}
+
+# 일괄 생성 / 수정 / 삭제 API (scb_be.bulk)
+BULK_API = {
+    'MAX_ITEMS': 500,  # 요청 하나에 처리할 최대 항목 수
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
     ],
+    # JSON 응답은 scb_be.renderers (orjson이 설치되어 있으면 사용, 없으면 표준 json)
+    'DEFAULT_RENDERER_CLASSES': [
+        'scb_be.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'scb_be.pagination.CursorPagination',
+    # users.throttles (로그인 / 회원가입 요청 제한)
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': '30/min',
+        'login_username': '10/min',
+        'register_ip': '20/hour',
+    },
+    # 앞단 프록시 수 (cloudtype 로드밸런서 1단): X-Forwarded-For의 마지막 항목(프록시가 붙인 주소)을 클라이언트 IP로 사용
+    # 설정하지 않으면 클라이언트가 보낸 X-Forwarded-For 전체를 IP로 쓰므로 값을 바꿔가며 IP 제한을 피할 수 있음
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 1)),
+}
+
+# 스트리밍 JSON 응답 (scb_be.renderers, ?stream=1 목록 / code-preview)
+STREAMING_JSON = {
+    'BUFFER_SIZE': 64 * 1024,  # 한 번에 내보내는 최소 바이트 수
+    'CHUNK_SIZE': 500,  # 목록을 DB에서 한 번에 읽어 직렬화하는 행 수
 }
 
 # HTTPS 및 리디렉션 설정
@@ -0,0 +1,155 @@
+"""
+응답 필드 선택 (?fields= / ?exclude=)
+
+- SparseFieldsMixin (Serializer): 조회(GET) 요청의 ?fields=id,title 또는 ?exclude=school_id에 따라 응답 필드를 고릅니다.
+- serializer_projection(): 선택된 필드가 읽는 컬럼(only), 정방향 관계(select_related), 역참조 관계(prefetch_related)를 계산합니다.
+- SparseQuerysetMixin (View): 목록 조회 queryset에 projection을 적용해 요청하지 않은 컬럼과 JOIN은 조회하지 않습니다.
+  커서 페이지네이션의 정렬 컬럼은 항상 조회합니다. (다음 페이지 커서 계산용)
+
+source가 '*'인 필드(SerializerMethodField 등)는 Meta.field_sources에 읽는 경로를 적습니다.
+적지 않으면 그 필드를 요청했을 때 컬럼을 제한하지 않습니다. (JOIN만 줄임)
+없는 필드 이름은 무시합니다.
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from drf_yasg import openapi
+from rest_framework import permissions
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+
+# 목록 API swagger 문서용 쿼리 파라미터
+SPARSE_PARAMETERS = [
+    openapi.Parameter(FIELDS_PARAM, openapi.IN_QUERY, description="응답할 필드 (쉼표로 구분, 예: id,title)", type=openapi.TYPE_STRING),
+    openapi.Parameter(EXCLUDE_PARAM, openapi.IN_QUERY, description="응답에서 뺄 필드 (쉼표로 구분)", type=openapi.TYPE_STRING),
+]
+
+
+def _param_names(request, name):
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return {part.strip() for part in value.split(',') if part.strip()}
+
+
+def select_field_names(field_names, request):
+    """요청의 ?fields= / ?exclude=로 field_names 중 응답할 필드 이름을 (순서 유지) 반환합니다."""
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return tuple(field_names)
+    fields = _param_names(request, FIELDS_PARAM)
+    exclude = _param_names(request, EXCLUDE_PARAM) or set()
+    return tuple(
+        name for name in field_names
+        if (fields is None or name in fields) and name not in exclude
+    )
+
+
+class SparseFieldsMixin:
+    """ModelSerializer에 섞어 ?fields= / ?exclude=를 지원합니다. (조회 요청에만 적용)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+        selected = set(select_field_names(tuple(self.fields), request))
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+
+def _resolve(model, parts, only, related, prefetch):
+    """source 경로 하나('created_by.username')를 only / select_related / prefetch_related 경로로 나눕니다."""
+    prefix = ''
+    for index, part in enumerate(parts):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return  # annotate / property / 직접 채운 속성
+        path = prefix + part
+        if field.one_to_many or field.many_to_many:
+            prefetch.add(path)
+            return
+        if not field.concrete:
+            related.add(path)  # 역방향 OneToOne
+            if index == len(parts) - 1:
+                return
+        elif field.is_relation and index < len(parts) - 1:
+            only.add(path)  # FK 컬럼
+            related.add(path)
+        else:
+            only.add(path)
+            return
+        model = field.related_model
+        prefix = path + '__'
+
+
+@lru_cache(maxsize=None)
+def serializer_field_names(serializer_class):
+    return tuple(serializer_class().fields)
+
+
+@lru_cache(maxsize=None)
+def serializer_projection(serializer_class, field_names=None):
+    """
+    Serializer(field_names가 있으면 그 필드만)가 읽는 컬럼, 정방향 관계, 역참조 관계를 계산합니다.
+    (only, select_related, prefetch_related)를 반환하며, 컬럼을 정할 수 없으면 only는 None입니다.
+    """
+    model = serializer_class.Meta.model
+    sources = getattr(serializer_class.Meta, 'field_sources', {})
+    only = {model._meta.pk.name}
+    related, prefetch = set(), set()
+    complete = True
+
+    for name, field in serializer_class().fields.items():
+        if field.write_only or (field_names is not None and name not in field_names):
+            continue
+        paths = sources.get(name) or ([] if field.source == '*' else [field.source])
+        if not paths:
+            complete = False
+            continue
+        for path in paths:
+            _resolve(model, path.split('.'), only, related, prefetch)
+
+    only_fields = tuple(sorted(only)) if complete else None
+    return only_fields, tuple(sorted(related)), tuple(sorted(prefetch))
+
+
+class SparseQuerysetMixin:
+    """
+    목록 조회(list action, ListAPIView)에서 serializer가 응답할 필드에 필요한 컬럼 / 관계만 조회합니다.
+    다른 경로(댓글 목록 등)는 sparse_queryset()을 직접 호출합니다.
+    역참조 관리자(board.comments)는 FK 컬럼을 읽으므로 Comment.objects.filter(board_id=...)처럼 넘깁니다.
+    """
+    sparse_actions = ('list',)
+
+    def sparse_queryset(self, queryset, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        all_fields = serializer_field_names(serializer_class)
+        selected = select_field_names(all_fields, self.request)
+        only, related, prefetch = serializer_projection(
+            serializer_class, None if selected == all_fields else frozenset(selected)
+        )
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if only is not None:
+            queryset = queryset.only(*only, *self.ordering_fields(queryset))
+        if related:  # 인자 없는 select_related()는 모든 FK를 JOIN하므로
+            queryset = queryset.select_related(*related)
+        return queryset.prefetch_related(*prefetch)
+
+    def ordering_fields(self, queryset):
+        """커서 페이지네이션이 다음 페이지 위치를 읽는 정렬 컬럼"""
+        paginator = self.paginator
+        if paginator is None or not hasattr(paginator, 'get_ordering'):
+            return ()
+        ordering = paginator.get_ordering(self.request, queryset, self)
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        return tuple(field.lstrip('-') for field in ordering)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, 'action', 'list') in self.sparse_actions:
+            queryset = self.sparse_queryset(queryset)
+        return queryset
@@ -0,0 +1,69 @@
+import threading
+
+from django.db import OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase
+
+from . import versions
+from .models import Version
+
+
+class VersionCounterTests(TestCase):
+    def test_missing_version_is_zero(self):
+        self.assertEqual(versions.get_versions(['a', 'b']), [0, 0])
+
+    def test_bump_runs_after_commit_and_not_on_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                versions.bump_on_commit('a', 'b')
+                self.assertEqual(versions.get_versions(['a', 'b']), [0, 0])
+        self.assertEqual(versions.get_versions(['a', 'b']), [1, 1])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    versions.bump_on_commit('a')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(versions.get_version('a'), 1)
+
+    def test_bump_is_stored_in_database(self):
+        versions.bump('board.Board')
+        self.assertEqual(Version.objects.get(name='board.Board').value, 1)
+
+
+class VersionCounterRaceTests(TransactionTestCase):
+    def test_concurrent_bumps_are_not_lost(self):
+        threads, rounds = 8, 25
+        errors = []
+        start = threading.Barrier(threads)
+
+        def bump():
+            # 테스트 DB(공유 캐시 메모리 sqlite)는 테이블 잠금을 기다리지 않고 바로 실패하므로 다시 시도
+            # (실패한 문장은 실행되지 않았으므로 다시 시도해도 증가가 중복되지 않음)
+            for _ in range(100):
+                try:
+                    return versions.bump_many(['race.A', 'race.B:parent=1'])  # 첫 증가는 행 생성 경쟁
+                except OperationalError as exc:
+                    if 'locked' not in str(exc):
+                        raise
+            raise AssertionError('table stayed locked')
+
+        def work():
+            try:
+                start.wait()
+                for _ in range(rounds):
+                    bump()
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=work) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(versions.get_versions(['race.A', 'race.B:parent=1']), [threads * rounds] * 2)
@@ -22,6 +22,7 @@ from django.conf.urls.static import static  # static() 사용을 위해 가져
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import permissions
+from .views import metrics_view
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -46,6 +47,7 @@ urlpatterns = [
    
     
     path('api/board/', include('board.urls')),  # Board 앱 URL
+    path('metrics/', metrics_view, name='metrics'),  # 관리자용 메트릭
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
 ]
 
@@ -0,0 +1,232 @@
+"""
+목록 조회 values 모드 (읽기 전용 빠른 직렬화)
+
+ModelSerializer는 행마다 필드 객체의 get_attribute / to_representation을 거칩니다.
+ValuesListMixin은 목록 조회에서 queryset.values()로 필요한 컬럼만 dict로 읽고,
+serializer 필드별로 미리 만든 변환 함수로 같은 JSON을 만듭니다. (serializer 인스턴스 / 모델 객체 생성 없음)
+
+- 변환 계획은 (serializer 클래스, 응답 필드) 조합마다 한 번 계산해 재사용합니다. (?fields= / ?exclude= 적용 후)
+- 값을 그대로 쓰는 필드(Char / Integer / Boolean / Choice / JSON / PK 관계)는 변환 없이,
+  DateTimeField(ISO 8601)는 시간대를 요청마다 한 번만 구해 변환하고, 그 밖의 날짜 / Decimal 필드는
+  DRF 필드의 to_representation을, 파일 필드는 저장소 URL을 사용합니다.
+- SerializerMethodField는 serializer에 values_<필드 이름>(self, *값) 메서드가 있어야 합니다.
+  (읽는 경로는 Meta.field_sources)
+- 변환할 수 없는 필드가 하나라도 있으면 기존 serializer로 처리합니다.
+응답 형태와 Swagger 스키마는 serializer_class 그대로입니다.
+
+?stream=1이면 페이지 없이 전체 목록을 JSON 배열로 스트리밍합니다. (STREAMING_JSON['CHUNK_SIZE']행씩 읽어 직렬화)
+정렬은 페이지네이션(?sort=)과 같습니다.
+"""
+from functools import lru_cache
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from drf_yasg import openapi
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .renderers import StreamingJSONResponse, iter_json_array
+from .sparse import select_field_names, serializer_field_names
+
+STREAM_PARAM = 'stream'
+
+# 목록 API swagger 문서용 쿼리 파라미터
+STREAM_PARAMETERS = [
+    openapi.Parameter(
+        STREAM_PARAM, openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN,
+        description="1이면 페이지 없이 전체 목록을 JSON 배열로 스트리밍 (next / previous 없음)",
+    ),
+]
+
+# DB 값이 곧 응답 값인 필드
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    serializers.JSONField,
+    serializers.ReadOnlyField,
+    relations.PrimaryKeyRelatedField,
+)
+# DRF 필드의 to_representation을 그대로 사용하는 필드
+CALL_FIELDS = (
+    serializers.DateTimeField,
+    serializers.DateField,
+    serializers.TimeField,
+    serializers.DecimalField,
+)
+
+
+def _model_field(model, lookup):
+    """'created_by__username' 경로의 마지막 모델 필드"""
+    field = None
+    for part in lookup.split('__'):
+        field = model._meta.get_field(part)
+        model = field.related_model
+    return field
+
+
+def _iso_format(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+
+def _datetime_converter(field):
+    """DateTimeField.to_representation과 같은 결과 (시간대는 요청마다 한 번만 계산)"""
+    tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if tz is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    return convert
+
+
+@lru_cache(maxsize=None)
+def values_plan(serializer_class, field_names):
+    """
+    (values 조회 경로, 필드별 변환 규칙)을 반환합니다. 변환할 수 없는 필드가 있으면 None
+    규칙: (이름, 종류, values 키 목록, 보조 값)
+    """
+    model = serializer_class.Meta.model
+    sources = getattr(serializer_class.Meta, 'field_sources', {})
+    serializer = serializer_class()
+    lookups, rules = [], []
+
+    for name in field_names:
+        field = serializer.fields[name]
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            method = getattr(serializer_class, f'values_{name}', None)
+            if method is None or name not in sources:
+                return None
+            keys = [path.replace('.', '__') for path in sources[name]]
+            rules.append((name, 'method', keys, method))
+            lookups += keys
+            continue
+        if field.source == '*' or isinstance(field, (serializers.BaseSerializer, relations.ManyRelatedField)):
+            return None
+        key = field.source.replace('.', '__')
+        try:
+            model_field = _model_field(model, key)
+        except FieldDoesNotExist:
+            return None  # annotate / property
+        if model_field.many_to_many or model_field.one_to_many:
+            return None
+        nullable_path = '__' in key  # 관계가 비어 있으면 DRF는 필드를 생략함
+        if isinstance(field, IDENTITY_FIELDS):
+            kind, extra = 'value', None
+        elif isinstance(field, serializers.FloatField):
+            kind, extra = 'call', float
+        elif isinstance(field, relations.StringRelatedField):
+            kind, extra = 'call', str
+        elif isinstance(field, serializers.DateTimeField) and _iso_format(field):
+            kind, extra = 'datetime', field
+        elif isinstance(field, CALL_FIELDS):
+            kind, extra = 'call', field.to_representation
+        elif isinstance(field, serializers.FileField) and getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+            kind, extra = 'file', model_field.storage
+        else:
+            return None
+        rules.append((name, kind, [key], (extra, nullable_path)))
+        lookups.append(key)
+
+    return tuple(dict.fromkeys(lookups)), tuple(rules)
+
+
+def serialize_rows(serializer_class, rules, rows, context):
+    """values() 행(dict) 목록을 serializer_class와 같은 형태의 dict 목록으로 변환합니다."""
+    request = context.get('request')
+    serializer = None
+    steps = []
+    for name, kind, keys, extra in rules:
+        if kind == 'method':
+            if serializer is None:
+                serializer = serializer_class(context=context)  # values_* 메서드용 (한 번만)
+            method = extra.__get__(serializer)
+            steps.append((name, 'method', keys, method, False))
+            continue
+        convert, nullable_path = extra
+        if kind == 'datetime':
+            kind, convert = 'call', _datetime_converter(convert)
+        elif kind == 'file':
+            storage = convert
+            if request is not None:
+                def convert(value, storage=storage):
+                    return request.build_absolute_uri(storage.url(value)) if value else None
+            else:
+                def convert(value, storage=storage):
+                    return storage.url(value) if value else None
+        steps.append((name, kind, keys[0], convert, nullable_path))
+
+    results = []
+    for row in rows:
+        item = {}
+        for name, kind, key, convert, nullable_path in steps:
+            if kind == 'method':
+                item[name] = convert(*(row[k] for k in key))
+                continue
+            value = row[key]
+            if value is None:
+                if not nullable_path:
+                    item[name] = None
+                continue
+            item[name] = value if kind == 'value' else convert(value)
+        results.append(item)
+    return results
+
+
+class ValuesListMixin:
+    """
+    list()를 values 모드로 처리합니다. ConditionalGetMixin 뒤, ModelViewSet / ListAPIView 앞에 둡니다.
+    SparseQuerysetMixin(정렬 컬럼 계산)과 함께 사용합니다.
+    """
+    values_mode = True
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        plan = None
+        if self.values_mode:
+            plan = values_plan(
+                serializer_class, select_field_names(serializer_field_names(serializer_class), request)
+            )
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        lookups, rules = plan
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.stream_requested(request):
+            return self.stream_list(queryset, serializer_class, lookups, rules)
+        rows = queryset.values(*dict.fromkeys(lookups + self.ordering_fields(queryset)))
+        page = self.paginate_queryset(rows)
+        data = serialize_rows(serializer_class, rules, page if page is not None else rows, self.get_serializer_context())
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def stream_requested(self, request):
+        return (
+            request.query_params.get(STREAM_PARAM) in ('1', 'true')
+            and request.accepted_renderer.format == 'json'  # Browsable API는 기존대로
+        )
+
+    def stream_list(self, queryset, serializer_class, lookups, rules):
+        """전체 목록을 페이지네이션과 같은 순서로 스트리밍합니다."""
+        paginator = self.paginator
+        if paginator is not None and hasattr(paginator, 'get_ordering'):
+            ordering = paginator.get_ordering(self.request, queryset, self)
+            queryset = queryset.order_by(*((ordering,) if isinstance(ordering, str) else ordering))
+        chunk_size = settings.STREAMING_JSON['CHUNK_SIZE']
+        rows = queryset.values(*lookups).iterator(chunk_size)
+        context = self.get_serializer_context()
+
+        def items():
+            while chunk := list(islice(rows, chunk_size)):
+                yield from serialize_rows(serializer_class, rules, chunk, context)
+        return StreamingJSONResponse(iter_json_array(items()))
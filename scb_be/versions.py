@@ -0,0 +1,87 @@
+"""
+모델 / 부모 객체 단위 버전 카운터
+목록 응답의 ETag / 캐시 키에 사용합니다. 버전 조회는 기본 키 조회 한 번(SELECT)입니다.
+
+- track(Comment, parents=('board',))로 등록하면 post_save / post_delete 때
+  'board.Comment'와 'board.Comment:board=<id>' 버전이 올라갑니다.
+- bulk_create / update()처럼 signal이 없는 쓰기는 bump_on_commit()을 직접 호출합니다.
+
+동시성
+- 카운터는 DB(scb_be.Version)에 있으므로 웹 서버와 score_worker 등 모든 프로세스가 같은 값을 봅니다.
+  (프로세스별 캐시에 두면 다른 프로세스의 변경을 볼 수 없음)
+- 버전 증가는 UPDATE ... SET value = value + 1 이므로 동시에 올려도 증가분이 사라지지 않습니다.
+  처음 올리는 이름은 행을 먼저 만듭니다. (INSERT, 다른 프로세스가 먼저 만들었으면 무시)
+- 버전은 트랜잭션 커밋 후(on_commit)에 올립니다. 커밋 전에 올리면 다른 요청이 새 버전 키로
+  이전 데이터를 캐시해 버릴 수 있습니다. 커밋 후에 올리면 새 버전을 본 요청은 항상 새 데이터를 읽습니다.
+- 아직 올린 적 없는 버전은 0입니다.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+
+from .models import Version
+
+
+def model_name(model):
+    return model._meta.label  # 예: 'board.Comment'
+
+
+def parent_name(model, field, parent_id):
+    return f"{model._meta.label}:{field}={parent_id}"  # 예: 'board.Comment:board=3'
+
+
+def get_versions(names):
+    """이름 목록에 대한 버전 목록을 반환합니다."""
+    found = dict(Version.objects.filter(name__in=names).values_list('name', 'value'))
+    return [found.get(name, 0) for name in names]
+
+
+def get_version(name):
+    return get_versions([name])[0]
+
+
+_existing = set()  # 커밋된 행이 있는 것으로 확인된 이름 (행은 지우지 않으므로 다시 만들 필요 없음)
+MAX_EXISTING = 10000
+
+
+def bump_many(names):
+    """버전들을 1씩 올립니다. (행이 있는 것으로 확인된 이름만 올리면 UPDATE 한 번)"""
+    names = list(dict.fromkeys(names))
+    new = [name for name in names if name not in _existing]
+    if new:  # 행부터 만듦 (다른 프로세스가 먼저 만들었으면 무시), UPDATE 결과만으로는 어느 행이 없었는지 알 수 없으므로
+        Version.objects.bulk_create([Version(name=name) for name in new], ignore_conflicts=True)
+    Version.objects.filter(name__in=names).update(value=F('value') + 1)
+    if new and not transaction.get_connection().in_atomic_block:  # 롤백될 수 있는 행은 기억하지 않음
+        if len(_existing) > MAX_EXISTING:
+            _existing.clear()
+        _existing.update(new)
+
+
+def bump(name):
+    """버전을 올리고 새 버전을 반환합니다."""
+    bump_many([name])
+    return get_version(name)
+
+
+def bump_on_commit(*names):
+    """현재 트랜잭션이 커밋된 뒤 버전을 올립니다. (트랜잭션 밖이면 바로)"""
+    transaction.on_commit(lambda: bump_many(names))
+
+
+def track(model, parents=()):
+    """model 저장/삭제 시 모델 버전과 parents FK별 부모 버전을 올리도록 signal을 연결합니다."""
+    attnames = [model._meta.get_field(field).attname for field in parents]
+
+    def changed(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        names = [model_name(model)]
+        for field, attname in zip(parents, attnames):
+            parent_id = getattr(instance, attname)
+            if parent_id is not None:
+                names.append(parent_name(model, field, parent_id))
+        bump_on_commit(*names)
+
+    uid = f"versions:{model._meta.label}"
+    post_save.connect(changed, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(changed, sender=model, weak=False, dispatch_uid=uid)
@@ -0,0 +1,20 @@
+from django.core.cache import caches
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from . import metrics
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def metrics_view(request):
+    """프로세스 메트릭 조회 (관리자 전용)"""
+    data = metrics.snapshot()
+    # stats()를 제공하는 캐시 백엔드의 사용량 포함
+    data['caches'] = {
+        alias: caches[alias].stats()
+        for alias in caches.settings
+        if hasattr(caches[alias], 'stats')
+    }
+    return Response(data)
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from django.contrib.auth.models import User
+        from scb_be import versions
+        from . import authentication  # noqa: F401  토큰 캐시 무효화 signal 등록
+        from .models import Profile
+
+        versions.track(Profile)
+        versions.track(User)  # 프로필 목록에 username 포함
@@ -0,0 +1,140 @@
+"""
+캐시를 사용하는 토큰 인증
+
+DRF TokenAuthentication은 요청마다 Token을 DB에서 조회합니다. (select_related('user'))
+CachedTokenAuthentication은 토큰 -> (사용자, 발급 시각)을 TOKEN_AUTH['CACHE_ALIAS'] 캐시에
+최대 CACHE_TIMEOUT초 동안 보관해 DB 조회를 줄입니다.
+
+- 캐시 무효화: 로그아웃 / 토큰 교체(Token 삭제), 사용자 정보 변경(비밀번호 변경, 비활성화 등)
+- 토큰 만료: 발급 후 TOKEN_TTL이 지나면 인증 실패, 로그인 시 ROTATE_AFTER가 지난 토큰은 새로 발급
+- 사용자와 프로필(user.profile)을 한 번에 조회해 캐시하므로 뷰에서 request.user.profile은 추가 쿼리가 없습니다.
+- 캐시는 프로세스별 LocMem이 기본이므로 다른 프로세스의 무효화는 CACHE_TIMEOUT 안에 반영됩니다.
+  여러 프로세스에서 즉시 반영하려면 공유 캐시(Redis 등)를 지정합니다.
+"""
+import hashlib
+import threading
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from scb_be import metrics
+from .models import Profile
+
+
+def token_cache():
+    return caches[settings.TOKEN_AUTH['CACHE_ALIAS']]
+
+
+def token_cache_key(key):
+    # 캐시 키에 토큰 원문을 남기지 않음
+    return 'auth:token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'  # 사용자 -> 토큰 캐시 키 (사용자 변경 시 무효화용)
+
+
+def token_expires_at(created):
+    return created + settings.TOKEN_AUTH['TOKEN_TTL']
+
+
+def invalidate_token(key):
+    token_cache().delete(token_cache_key(key))
+
+
+def invalidate_user(user_id):
+    cache = token_cache()
+    cache_key = cache.get(user_cache_key(user_id))
+    cache.delete_many([user_cache_key(user_id)] + ([cache_key] if cache_key else []))
+
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def _record_lookup(hit):
+    name = 'hits' if hit else 'misses'
+    with _stats_lock:
+        _stats[name] += 1
+        ratio = _stats['hits'] / (_stats['hits'] + _stats['misses'])
+    metrics.incr(f'auth.token_cache.{name}')
+    metrics.set_gauge('auth.token_cache.hit_ratio', ratio)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def lookup_token(self, key):
+        """TokenAuthentication.authenticate_credentials와 같은 검사, 프로필까지 함께 조회"""
+        try:
+            token = self.get_model().objects.select_related('user__profile').get(key=key)
+        except self.get_model().DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        return token
+
+    def authenticate_credentials(self, key):
+        cache = token_cache()
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            _record_lookup(hit=False)
+            token = self.lookup_token(key)
+            user, created = token.user, token.created
+            remaining = (token_expires_at(created) - timezone.now()).total_seconds()
+            timeout = min(settings.TOKEN_AUTH['CACHE_TIMEOUT'], remaining)
+            if timeout > 0:
+                cache.set(cache_key, (user, created), timeout)
+                cache.set(user_cache_key(user.pk), cache_key, timeout)
+        else:
+            _record_lookup(hit=True)
+            user, created = cached
+
+        if timezone.now() >= token_expires_at(created):
+            cache.delete(cache_key)
+            raise exceptions.AuthenticationFailed('Token has expired.')
+        return user, Token(key=key, user=user, created=created)
+
+
+def issue_token(user):
+    """
+    로그인 시 사용할 토큰을 반환합니다.
+    기존 토큰이 ROTATE_AFTER보다 오래되었으면(만료 포함) 삭제하고 새로 발급합니다.
+    """
+    token = Token.objects.filter(user=user).first()
+    if token and timezone.now() - token.created < settings.TOKEN_AUTH['ROTATE_AFTER']:
+        return token
+    with transaction.atomic():
+        if token:
+            token.delete()
+        return Token.objects.create(user=user)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    # 로그아웃 / 토큰 교체
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_changed_profile(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_user(instance.user_id)  # 캐시된 user.profile 갱신
+
+
+@receiver(post_save, sender=User)
+def invalidate_changed_user(sender, instance, created, raw=False, **kwargs):
+    if created or raw:
+        return
+    invalidate_user(instance.pk)  # 캐시된 사용자 정보(is_active 등) 갱신
+    if instance._password is not None:
+        # 비밀번호가 바뀌면 기존 토큰 폐기
+        Token.objects.filter(user=instance).delete()
@@ -0,0 +1,101 @@
+"""
+비밀번호 해시 전용 작업 풀
+
+비밀번호 해시(PBKDF2 / scrypt / argon2)는 요청마다 수십 ms의 CPU를 사용합니다.
+로그인이 몰리면 모든 요청 워커가 해시 계산에 묶이므로, 해시 계산만 크기가 정해진 스레드 풀에서 실행합니다.
+(hashlib / argon2는 계산 중 GIL을 놓으므로 스레드 풀로 동시 실행 수를 제한할 수 있음)
+
+- 동시에 계산하는 해시는 WORKERS개, 대기열은 QUEUE_SIZE개까지
+- 대기열이 가득 차면 ADMISSION_TIMEOUT초 기다린 뒤 503(HashingOverloaded)으로 거절
+- DB 조회/저장은 요청 스레드에서 하고 해시 계산만 풀로 보냄
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+from django.contrib.auth.models import User
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from scb_be import metrics
+
+
+class HashingOverloaded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Too many login requests. Please retry shortly.'
+    default_code = 'hashing_overloaded'
+    wait = 1  # Retry-After 헤더 (초)
+
+
+class HashingPool:
+    def __init__(self, workers=4, queue_size=32, admission_timeout=2.0):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(workers + queue_size)  # 계산 중 + 대기 중
+        self._admission_timeout = admission_timeout
+
+    def run(self, fn, *args):
+        """fn(*args)를 풀에서 실행하고 결과를 기다립니다. 자리가 없으면 HashingOverloaded"""
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self._admission_timeout):
+            metrics.incr('hashing.rejected')
+            raise HashingOverloaded()
+        try:
+            return self._executor.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+            metrics.observe('hashing.latency', time.monotonic() - started)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool():
+    """settings.PASSWORD_HASHING 설정으로 만든 공유 작업 풀을 반환합니다."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            options = settings.PASSWORD_HASHING
+            _pool = HashingPool(
+                workers=options['WORKERS'],
+                queue_size=options['QUEUE_SIZE'],
+                admission_timeout=options['ADMISSION_TIMEOUT'],
+            )
+        return _pool
+
+
+def hash_password(raw_password):
+    return get_hashing_pool().run(make_password, raw_password)
+
+
+def _must_rehash(encoded):
+    # 기본 해시가 바뀌었거나 반복 횟수 등 설정이 바뀐 경우
+    preferred = get_hasher('default')
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def authenticate_user(username, password):
+    """
+    ModelBackend.authenticate와 같은 검사를 하되 해시 계산은 작업 풀에서 실행합니다.
+    기본 해시와 다른 형식으로 저장된 비밀번호는 로그인 성공 시 다시 해시해 저장합니다.
+    """
+    try:
+        user = User._default_manager.get_by_natural_key(username)
+    except User.DoesNotExist:
+        hash_password(password)  # 없는 사용자도 같은 시간이 걸리도록 (사용자 존재 여부 노출 방지)
+        return None
+
+    encoded = user.password
+    if not get_hashing_pool().run(check_password, password, encoded) or not user.is_active:
+        return None
+    if _must_rehash(encoded):
+        user.password = hash_password(password)
+        user.save(update_fields=['password'])
+        metrics.incr('hashing.rehashed')
+    return user
@@ -0,0 +1,151 @@
+"""
+프로필 이미지 변환 (썸네일)
+
+업로드된 원본은 그대로 두고 PROFILE_IMAGE['VARIANTS'] 크기의 WebP / JPEG 이미지를 만듭니다.
+- EXIF 회전을 적용한 뒤 다시 인코딩하므로 EXIF / ICC 등 메타데이터는 남지 않습니다.
+- 변환 이미지는 내용의 SHA-256으로 저장합니다. (profile/variants/ab/cd/<digest>.webp)
+  내용이 바뀌면 URL도 바뀌므로 오래 캐시해도 되고, 같은 이미지는 한 번만 저장됩니다.
+- 변환은 트랜잭션 커밋 후 백그라운드 스레드 풀에서 실행합니다. (요청 처리 시간에 포함되지 않음)
+  결과는 Profile.image_variants에 {'source': 원본 이름, 'thumb': {'webp': 경로, 'jpeg': 경로}, ...}로 저장되며,
+  원본이 다시 바뀌면 source가 달라지므로 이전 결과는 사용하지 않습니다.
+- 서버 재시작 등으로 누락된 변환은 manage.py generate_thumbnails로 다시 만듭니다.
+"""
+import hashlib
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps
+
+from scb_be import metrics, versions
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {
+    'webp': ('WEBP', {'method': 4}),
+    'jpeg': ('JPEG', {'optimize': True, 'progressive': True}),
+}
+
+
+class ImageTooLarge(ValueError):
+    pass
+
+
+def check_dimensions(fileobj):
+    """헤더만 읽어 가로 x 세로가 MAX_PIXELS를 넘는지 확인합니다. (압축 폭탄 방지)"""
+    position = fileobj.tell()
+    try:
+        with Image.open(fileobj) as image:
+            width, height = image.size
+    finally:
+        fileobj.seek(position)
+    if width * height > settings.PROFILE_IMAGE['MAX_PIXELS']:
+        raise ImageTooLarge(f"Image is too large ({width}x{height}).")
+    return width, height
+
+
+def render_variant(image, size, crop):
+    """crop이면 size 크기로 가운데를 잘라내고, 아니면 비율을 유지한 채 size 안으로 줄입니다."""
+    if crop:
+        return ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail(size, Image.Resampling.LANCZOS)  # 원본보다 크게 늘리지는 않음
+    return resized
+
+
+def encode(image, fmt):
+    name, options = FORMATS[fmt]
+    if image.mode not in ('RGB', 'RGBA') or (fmt == 'jpeg' and image.mode == 'RGBA'):
+        # JPEG은 투명도를 지원하지 않으므로 흰 배경에 합성
+        background = Image.new('RGB', image.size, 'white')
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        image = background if fmt == 'jpeg' else rgba
+    buffer = io.BytesIO()
+    image.save(buffer, name, quality=settings.PROFILE_IMAGE['QUALITY'], **options)  # exif / icc_profile은 넘기지 않음
+    return buffer.getvalue()
+
+
+def store_variant(data, fmt):
+    """내용 주소 경로에 저장하고 경로를 반환합니다. 같은 내용이 있으면 다시 저장하지 않습니다."""
+    digest = hashlib.sha256(data).hexdigest()
+    name = f"profile/variants/{digest[:2]}/{digest[2:4]}/{digest}.{fmt}"
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(data))
+    return name
+
+
+def build_variants(fileobj):
+    """원본 파일에서 모든 변환 이미지를 만들어 {variant: {format: 경로}}를 반환합니다."""
+    check_dimensions(fileobj)
+    with Image.open(fileobj) as original:
+        original.draft('RGB', max(size for size, _ in settings.PROFILE_IMAGE['VARIANTS'].values()))  # JPEG은 축소 디코딩
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    variants = {}
+    for variant, (size, crop) in settings.PROFILE_IMAGE['VARIANTS'].items():
+        rendered = render_variant(image, size, crop)
+        variants[variant] = {fmt: store_variant(encode(rendered, fmt), fmt) for fmt in FORMATS}
+    return variants
+
+
+def generate_profile_variants(profile_id):
+    """프로필 원본 이미지의 변환 이미지를 만들어 저장합니다. 원본이 그 사이 바뀌었으면 저장하지 않습니다."""
+    from .models import Profile
+
+    profile = Profile.objects.filter(pk=profile_id).only('pk', 'image', 'image_variants').first()
+    if profile is None or not profile.image:
+        return None
+    source = profile.image.name
+    if profile.image_variants.get('source') == source:
+        return profile.image_variants
+
+    try:
+        with profile.image.open('rb') as fileobj:
+            variants = build_variants(fileobj)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        metrics.incr('profile_image.failed')
+        logger.warning("Profile %s image variants failed: %s", profile_id, e)
+        return None
+
+    variants['source'] = source
+    with transaction.atomic():
+        # signal 없이 저장 (post_save로 다시 변환이 예약되지 않도록) -> 버전은 직접 올림
+        updated = Profile.objects.filter(pk=profile_id, image=source).update(image_variants=variants)
+        versions.bump_on_commit(versions.model_name(Profile))
+    metrics.incr('profile_image.generated')
+    return variants if updated else None
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PROFILE_IMAGE['WORKERS'], thread_name_prefix='profile-image'
+            )
+        return _executor
+
+
+def _run(profile_id):
+    close_old_connections()
+    try:
+        generate_profile_variants(profile_id)
+    except Exception:
+        logger.exception("Profile %s image variants failed", profile_id)
+    finally:
+        close_old_connections()
+
+
+def schedule_profile_variants(profile_id):
+    """트랜잭션 커밋 후 백그라운드에서 변환 이미지를 만듭니다."""
+    transaction.on_commit(lambda: _get_executor().submit(_run, profile_id))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from users.images import generate_profile_variants
+from users.models import Profile
+
+
+class Command(BaseCommand):
+    help = "프로필 이미지 썸네일(WebP / JPEG)을 만듭니다. 기존 업로드나 누락된 변환을 채울 때 사용합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="이미 변환된 프로필도 다시 변환 (VARIANTS 설정 변경 시)")
+        parser.add_argument('--batch-size', type=int, default=200, help="한 번에 조회할 프로필 수")
+
+    def handle(self, *args, **options):
+        default = Profile._meta.get_field('image').default
+        queryset = Profile.objects.exclude(image='').exclude(image=default).only('pk', 'image', 'image_variants')
+        if options['force']:
+            queryset.update(image_variants={})
+
+        generated = failed = 0
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk).order_by('pk')[:options['batch_size']])
+            if not batch:
+                break
+            for profile in batch:
+                if profile.image_variants.get('source') == profile.image.name:
+                    continue
+                if generate_profile_variants(profile.pk) is None:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"Failed profile {profile.pk} ({profile.image.name})"))
+                else:
+                    generated += 1
+            last_pk = batch[-1].pk
+        self.stdout.write(self.style.SUCCESS(f"Generated thumbnails for {generated} profile(s), {failed} failed."))
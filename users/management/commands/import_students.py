@@ -0,0 +1,40 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.provisioning import import_students
+
+
+class Command(BaseCommand):
+    help = "CSV(username,email,password)로 학생 계정을 일괄 등록합니다. 비밀번호는 프로세스 풀에서 해시합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help="헤더가 username,email,password인 CSV 파일 (password가 비어 있으면 로그인 불가 계정)")
+        parser.add_argument('--workers', type=int, help="해시 프로세스 수 (기본: CPU 코어 수)")
+        parser.add_argument('--batch-size', type=int, default=500, help="한 트랜잭션에서 만들 사용자 수")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['csv_path'], newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                missing = {'username', 'email'} - set(reader.fieldnames or ())
+                if missing:
+                    raise CommandError(f"Missing column(s): {', '.join(sorted(missing))}")
+                students = []
+                for line, row in enumerate(reader, start=2):
+                    username = (row['username'] or '').strip()
+                    if not username or len(username) > 20:  # 회원가입과 같은 학번 길이 제한
+                        raise CommandError(f"Line {line}: invalid username {username!r}")
+                    students.append((username, (row['email'] or '').strip(), row.get('password') or None))
+        except OSError as e:
+            raise CommandError(e)
+
+        def report(created):
+            self.stdout.write(f"Created {created}/{len(students)}")
+
+        created, skipped = import_students(
+            students, workers=options['workers'], batch_size=options['batch_size'], on_batch=report
+        )
+        if skipped:
+            self.stdout.write(self.style.WARNING(f"Skipped {len(skipped)} existing/duplicate username(s): {', '.join(skipped[:20])}"))
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} student(s)."))
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-17 22:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_profile_school_id'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='profile',
+            name='school_id',
+        ),
+    ]
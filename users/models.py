@@ -12,10 +12,20 @@ class Profile(models.Model):
     code = models.CharField(max_length=50, unique=True, null=True, blank=True)
     #school_id = models.CharField(max_length=20, unique=True)
     image = models.ImageField(upload_to='profile/', default='default.png')
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)  # 썸네일 경로 (users.images)
     def __str__(self):
         return self.user.username
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
-        Profile.objects.create(user=instance)
\ No newline at end of file
+        Profile.objects.create(user=instance)
+
+@receiver(post_save, sender=Profile)
+def schedule_image_variants(sender, instance, raw=False, **kwargs):
+    # 새 이미지가 업로드되면 커밋 후 썸네일 생성 (기본 이미지는 제외)
+    if raw or not instance.image or instance.image.name == sender._meta.get_field('image').default:
+        return
+    if instance.image_variants.get('source') != instance.image.name:
+        from .images import schedule_profile_variants
+        schedule_profile_variants(instance.pk)
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+사용자 생성 (회원가입 / 학기별 일괄 등록)
+
+- register_user: 해시 한 번, User INSERT 한 번, Profile(post_save)과 Token을 같은 트랜잭션에서 생성
+- import_students: CSV 등으로 받은 학생 목록을 프로세스 풀에서 해시한 뒤 bulk_create로 등록
+  bulk_create는 post_save가 호출되지 않으므로 Profile도 bulk_create로 함께 만듭니다.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+from scb_be import versions
+from .hashing import hash_password
+from .models import Profile
+
+
+def register_user(username, email, password):
+    """사용자, 프로필, 토큰을 한 트랜잭션에서 만들고 (user, token)을 반환합니다."""
+    encoded = hash_password(password)  # 트랜잭션을 열기 전에 해시 (잠금 시간 단축)
+    with transaction.atomic():
+        user = User(username=username, email=email, password=encoded)
+        user.save()  # post_save: create_user_profile
+        token = Token.objects.create(user=user)
+    return user, token
+
+
+def _init_worker():
+    # spawn 방식으로 시작된 워커에서도 설정(PASSWORD_HASHERS)을 사용할 수 있도록
+    if not apps.ready:
+        django.setup()
+
+
+def _hash_all(passwords, workers):
+    if workers == 1:
+        return [make_password(password) for password in passwords]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return list(executor.map(make_password, passwords, chunksize=max(1, len(passwords) // (workers * 4))))
+
+
+def import_students(students, workers=None, batch_size=500, on_batch=None):
+    """
+    students: (username, email, password) 목록
+    이미 있는 username과 목록 안에서 중복된 username은 건너뜁니다.
+    on_batch(created_count)는 배치 하나를 저장할 때마다 호출됩니다.
+    생성한 사용자 수와 건너뛴 username 목록을 반환합니다.
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = {}
+    skipped = []
+    for username, email, password in students:
+        if username in pending:
+            skipped.append(username)
+        else:
+            pending[username] = (email, password)
+    existing = set(User.objects.filter(username__in=list(pending)).values_list('username', flat=True))
+    skipped += [username for username in pending if username in existing]
+    rows = [(username, email, password) for username, (email, password) in pending.items() if username not in existing]
+
+    created = 0
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        hashes = _hash_all([password for _, _, password in batch], workers)  # 트랜잭션 밖에서 해시
+        with transaction.atomic():
+            User.objects.bulk_create(
+                [User(username=username, email=email, password=encoded)
+                 for (username, email, _), encoded in zip(batch, hashes)],
+                batch_size=batch_size,
+            )
+            # bulk_create가 pk를 돌려주지 않는 DB도 있으므로 username으로 다시 조회
+            user_ids = User.objects.filter(username__in=[row[0] for row in batch]).values_list('pk', flat=True)
+            Profile.objects.bulk_create([Profile(user_id=user_id) for user_id in user_ids], batch_size=batch_size)
+            versions.bump_on_commit(versions.model_name(User), versions.model_name(Profile))
+        created += len(batch)
+        if on_batch:
+            on_batch(created)
+    return created, skipped
@@ -1,10 +1,14 @@
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.core.files.storage import default_storage
 from rest_framework import serializers
-from rest_framework.authtoken.models import Token
 from rest_framework.validators import UniqueValidator
-from django.contrib.auth import authenticate
+from scb_be.sparse import SparseFieldsMixin
+from .authentication import issue_token, token_expires_at
+from .hashing import authenticate_user
+from .images import ImageTooLarge, check_dimensions
 from .models import Profile
+from .provisioning import register_user
 
 # 회원가입 시리얼라이저
 class RegisterSerializer(serializers.ModelSerializer):
@@ -28,10 +32,11 @@ class RegisterSerializer(serializers.ModelSerializer):
         write_only=True,
         required=True,
     )
+    token = serializers.CharField(source='auth_token.key', read_only=True)
 
     class Meta:
         model = User
-        fields = ('username', 'email', 'password', 'password2')
+        fields = ('username', 'email', 'password', 'password2', 'token')
 
     def validate(self, data):
         if data['password'] != data['password2']:
@@ -40,37 +45,59 @@ class RegisterSerializer(serializers.ModelSerializer):
         return data
 
     def create(self, validated_data):
-        user = User.objects.create_user(
+        user, token = register_user(
             username=validated_data['username'],  # username을 학번으로 사용
             email=validated_data['email'],
+            password=validated_data['password'],
         )
-        user.set_password(validated_data['password'])
-        user.save()
-        token = Token.objects.create(user=user)
-        return {
-            'user': user,
-            'token': token.key  # .key로 반환
-        }
+        return user  # token은 user.auth_token으로 응답에 포함
 
 class LoginSerializer(serializers.Serializer):
     username = serializers.CharField(required=True)
     password = serializers.CharField(required=True, write_only=True)
 
     def validate(self, data):
-        user = authenticate(username=data['username'], password=data['password'])
+        user = authenticate_user(data['username'], data['password'])
         if user:
-            token, created = Token.objects.get_or_create(user=user)
-            return {'token': token.key}
+            token = issue_token(user)  # 오래된 토큰은 새로 발급
+            return {'token': token.key, 'expires_at': token_expires_at(token.created)}
         raise serializers.ValidationError(
             {"error": "Unable to log in with provided credentials."}
         )
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     username = serializers.CharField(source='user.username', read_only=True)
+    image_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
-        fields = ("nickname", "range", "code", "image", "username")
+        fields = ("nickname", "range", "code", "image", "image_variants", "username")
+        field_sources = {'image_variants': ('image', 'image_variants')}  # ?fields= 사용 시 조회할 컬럼
+
+    def validate_image(self, image):
+        try:
+            check_dimensions(image)
+        except ImageTooLarge as e:
+            raise serializers.ValidationError(str(e))
+        return image
+
+    def get_image_variants(self, profile):
+        """{'thumb': {'webp': URL, 'jpeg': URL}, ...} (생성 전이거나 원본이 바뀐 경우 빈 객체)"""
+        return self.values_image_variants(profile.image.name, profile.image_variants)
+
+    def values_image_variants(self, image, variants):
+        """values 모드(scb_be.values)용: image 컬럼(파일 이름)과 image_variants 컬럼 값으로 계산"""
+        if not variants or variants.get('source') != image:
+            return {}
+        request = self.context.get('request')
+        urls = {}
+        for variant, paths in variants.items():
+            if variant == 'source':
+                continue
+            urls[variant] = {fmt: default_storage.url(path) for fmt, path in paths.items()}
+            if request is not None:
+                urls[variant] = {fmt: request.build_absolute_uri(url) for fmt, url in urls[variant].items()}
+        return urls
 
 # 수정 사항
 # 1. `school_id` 관련 부분을 모두 제거했습니다.
@@ -1,3 +1,94 @@
-from django.test import TestCase
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from . import hashing
+from .hashing import HashingOverloaded, HashingPool
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],  # 테스트 속도
+)
+class LoginTestCase(TestCase):
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.user = User.objects.create_user('20201234', password='secret')
+        self.client = APIClient()
+
+    def login(self, username='20201234', password='secret'):
+        return self.client.post('/users/login/', {'username': username, 'password': password}, format='json')
+
+
+class LoginThrottleTests(LoginTestCase):
+    def test_username_limit_rejects_before_hashing(self):
+        with mock.patch('users.serializers.authenticate_user', wraps=hashing.authenticate_user) as authenticate:
+            for _ in range(10):  # login_username: 10/min
+                self.assertEqual(self.login(password='wrong').status_code, 400)
+            response = self.login()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(authenticate.call_count, 10)  # 거절된 요청은 해시 계산 없음
+        self.assertEqual(self.login(username='20209999', password='wrong').status_code, 400)  # 다른 계정은 허용
+
+    def test_ip_limit_applies_across_usernames(self):
+        for index in range(30):  # login_ip: 30/min
+            self.assertEqual(self.login(username=f'user{index}', password='wrong').status_code, 400)
+        self.assertEqual(self.login().status_code, 429)
+
+    def test_spoofed_forwarded_for_does_not_reset_ip_limit(self):
+        # 클라이언트가 보낸 앞쪽 항목은 매번 다르고 프록시가 붙인 마지막 항목(실제 IP)은 같음
+        for index in range(30):
+            self.client.credentials(HTTP_X_FORWARDED_FOR=f'10.0.0.{index}, 203.0.113.7')
+            self.assertEqual(self.login(username=f'user{index}', password='wrong').status_code, 400)
+        self.client.credentials(HTTP_X_FORWARDED_FOR='10.0.1.1, 203.0.113.7')
+        self.assertEqual(self.login().status_code, 429)
+
+        self.client.credentials(HTTP_X_FORWARDED_FOR='10.0.1.1, 203.0.113.8')  # 다른 클라이언트는 허용
+        self.assertEqual(self.login().status_code, 200)
+
+
+class HashingPoolTests(LoginTestCase):
+    def saturate(self, pool, count):
+        """count개의 해시 계산이 실행 중인 상태를 만듭니다. (count는 workers 이하)"""
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def blocking():
+            started.release()
+            release.wait(5)
+
+        threads = [threading.Thread(target=pool.run, args=(blocking,)) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for _ in range(count):
+            self.assertTrue(started.acquire(timeout=5))
+
+        def finish():
+            release.set()
+            for thread in threads:
+                thread.join()
+        self.addCleanup(finish)
+        return finish
+
+    def test_rejects_calls_above_capacity(self):
+        pool = HashingPool(workers=2, queue_size=0, admission_timeout=0.05)
+        self.saturate(pool, 2)
+        with self.assertRaises(HashingOverloaded):
+            pool.run(lambda: None)
+
+    def test_login_above_capacity_is_503(self):
+        pool = HashingPool(workers=2, queue_size=0, admission_timeout=0.05)
+        with mock.patch.object(hashing, '_pool', pool):
+            finish = self.saturate(pool, 2)
+            response = self.login()
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response['Retry-After'], '1')
+
+            finish()
+            self.assertEqual(self.login().status_code, 200)
@@ -0,0 +1,33 @@
+"""
+로그인 / 회원가입 요청 제한 (캐시 기반)
+비밀번호 해시를 계산하기 전에 거절하므로 무차별 대입 요청의 비용이 작습니다.
+허용 횟수는 settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']의 scope 값입니다.
+클라이언트 IP는 settings.REST_FRAMEWORK['NUM_PROXIES']에 따라 X-Forwarded-For에서 프록시가 붙인 항목을 사용합니다.
+"""
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class IPRateThrottle(SimpleRateThrottle):
+    """클라이언트 IP별 제한 (scope는 하위 클래스에서 지정)"""
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class LoginIPThrottle(IPRateThrottle):
+    scope = 'login_ip'
+
+
+class RegisterIPThrottle(IPRateThrottle):
+    scope = 'register_ip'
+
+
+class LoginUsernameThrottle(SimpleRateThrottle):
+    """같은 계정(username)에 대한 로그인 시도 제한 (여러 IP에서 나누어 시도하는 경우)"""
+    scope = 'login_username'
+
+    def get_cache_key(self, request, view):
+        username = request.data.get('username') if hasattr(request.data, 'get') else None
+        if not username:
+            return None  # 입력 검증에서 실패하므로 제한하지 않음
+        return self.cache_format % {'scope': self.scope, 'ident': str(username).strip().lower()[:150]}
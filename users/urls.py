@@ -1,9 +1,10 @@
 from django.urls import path
-from .views import RegisterView, LoginView, ProfileView, ProfileListView
+from .views import RegisterView, LoginView, LogoutView, ProfileView, ProfileListView
 
 urlpatterns = [
     path('register/', RegisterView.as_view()),   # 회원가입
     path('login/', LoginView.as_view()),         # 로그인
+    path('logout/', LogoutView.as_view()),       # 로그아웃
     path('profile/', ProfileListView.as_view()),  # 전체 프로필 조회
     path('profile/<int:pk>/', ProfileView.as_view()),  # 개별 프로필 조회 및 수정
 ]
\ No newline at end of file
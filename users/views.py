@@ -2,16 +2,23 @@ from django.contrib.auth.models import User
 from .models import Profile  # Profile이 users 앱의 models.py에 정의되어 있다고 가정
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from .serializers import RegisterSerializer, LoginSerializer, ProfileSerializer
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from .permissions import CustomReadOnly
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework.authtoken.models import Token
+from scb_be.conditional import ConditionalGetMixin
+from scb_be.pagination import ProfilePagination
+from scb_be.sparse import SPARSE_PARAMETERS, SparseQuerysetMixin
+from scb_be.values import STREAM_PARAMETERS, ValuesListMixin
+from .throttles import LoginIPThrottle, LoginUsernameThrottle, RegisterIPThrottle
 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
+    throttle_classes = [RegisterIPThrottle]
 
     @swagger_auto_schema(
         operation_description="회원가입 API",
@@ -24,7 +31,7 @@ class RegisterView(generics.CreateAPIView):
                     "application/json": {
                         "username": "202021058",  # 학번 예시
                         "email": "testuser@example.com",
-                        "password": "password123"
+                        "token": "9944b09199c62bcf9418ad846dd0e4bbdfc6ee4b"
                     }
                 },
             ),
@@ -36,6 +43,7 @@ class RegisterView(generics.CreateAPIView):
 
 class LoginView(generics.GenericAPIView):
     serializer_class = LoginSerializer
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
 
     @swagger_auto_schema(
         operation_description="로그인 API",
@@ -46,24 +54,44 @@ class LoginView(generics.GenericAPIView):
                 schema=openapi.Schema(
                     type=openapi.TYPE_OBJECT,
                     properties={
-                        'token': openapi.Schema(type=openapi.TYPE_STRING, description="인증 토큰")
+                        'token': openapi.Schema(type=openapi.TYPE_STRING, description="인증 토큰"),
+                        'expires_at': openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATETIME, description="토큰 만료 시각"),
                     },
                 ),
                 examples={
                     "application/json": {
-                        "token": "abc123xyz456"
+                        "token": "abc123xyz456",
+                        "expires_at": "2025-01-15T12:00:00+09:00"
                     }
                 }
             ),
             400: "유효하지 않은 요청 데이터",
             401: "인증 실패",
+            429: "요청 횟수 초과",
+            503: "로그인 요청이 많아 잠시 후 다시 시도",
         },
     )
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        token = serializer.validated_data['token']
-        return Response({"token": token}, status=status.HTTP_200_OK)
+        return Response({
+            "token": serializer.validated_data['token'],
+            "expires_at": serializer.validated_data['expires_at'],
+        }, status=status.HTTP_200_OK)
+
+class LogoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description="로그아웃 API (현재 토큰 폐기)",
+        responses={
+            204: "로그아웃 성공",
+            401: "인증 필요",
+        },
+    )
+    def post(self, request):
+        Token.objects.filter(key=request.auth.key).delete()  # 토큰 캐시도 함께 무효화됨
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 class ProfileView(generics.RetrieveUpdateAPIView):
     queryset = Profile.objects.all()
@@ -95,12 +123,15 @@ class ProfileView(generics.RetrieveUpdateAPIView):
             return Response({"error": "You can only update your own profile."}, status=status.HTTP_403_FORBIDDEN)
         return super().patch(request, *args, **kwargs)
 
-class ProfileListView(generics.ListAPIView):
-    queryset = Profile.objects.all()
+class ProfileListView(SparseQuerysetMixin, ConditionalGetMixin, ValuesListMixin, generics.ListAPIView):
+    queryset = Profile.objects.select_related('user')
     serializer_class = ProfileSerializer
+    pagination_class = ProfilePagination
+    list_version_names = ('users.Profile', 'auth.User')
 
     @swagger_auto_schema(
         operation_description="모든 프로필 조회 API",
+        manual_parameters=SPARSE_PARAMETERS + STREAM_PARAMETERS,
         responses={
             200: openapi.Response(
                 "프로필 리스트",